@@ -1,83 +1,57 @@
-from django.contrib.auth import authenticate, get_user_model
-from drf_spectacular.utils import extend_schema
-from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
 
-User = get_user_model()
+from apps.accounts.services import AuthenticatedUserCache
 
 
-class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+class CachedJWTAuthentication(JWTAuthentication):
     """
-    Custom serializer for obtaining JWT tokens.
+    JWT authentication that resolves the token's user from a cache.
 
-    This serializer extends the default `TokenObtainPairSerializer` to use
-    the user's email as the username field and includes additional user
-    information (user ID and email) in the token response.
-
-    Attributes:
-        username_field (str): Specifies the field to use as the username (email in this case).
+    The user is loaded (and checked to be active) by `JWTAuthentication` on
+    the first request and then rebuilt from the fields cached by
+    `AuthenticatedUserCache`, so repeated requests with the same token run
+    no user query. Entries are dropped whenever the user is saved or deleted.
 
     Methods:
-        - validate: Authenticates the user and customizes the token response.
+        - get_user: Returns the user of a validated token.
     """
 
-    username_field = User.EMAIL_FIELD
-
-    def validate(self, attrs):
+    def get_user(self, validated_token):
         """
-        Validate the user's credentials and generates a JWT token.
+        Return the user of a validated token, from the cache when possible.
 
         Args:
-            attrs (dict): The data passed to the serializer, including email and password.
+            validated_token (Token): The validated access token.
 
         Raises:
-            serializers.ValidationError: If the credentials are invalid.
+            InvalidToken: If the token has no user claim.
+            AuthenticationFailed: If the user does not exist, is inactive or changed its password after the token was issued.
 
         Returns:
-            dict: The token data, including the access and refresh tokens,
-                  along with the user's ID and email.
+            User: The authenticated user.
         """
-        email = attrs.get("email")
-        password = attrs.get("password")
-        user = authenticate(
-            request=self.context.get("request"), email=email, password=password
-        )
-
-        if not user:
-            raise serializers.ValidationError("Invalid credentials")
-
-        data = super().validate(attrs)
-        data.update(
-            {
-                "user_id": user.id,
-                "email": user.email,
-            }
-        )
-
-        return data
-
-
-@extend_schema(tags=["auth"])
-class CustomTokenObtainPairView(TokenObtainPairView):
-    """
-    Custom view for obtaining JWT tokens.
-
-    This view uses the `CustomTokenObtainPairSerializer` to authenticate
-    users and generate JWT tokens. It is tagged under "auth" for API documentation.
-    """
-
-    serializer_class = CustomTokenObtainPairSerializer
-
-
-@extend_schema(tags=["auth"])
-class CustomTokenRefreshView(TokenRefreshView):
-    """
-    Custom view for refreshing JWT tokens.
-
-    This view extends the default `TokenRefreshView` and is tagged under "auth"
-    for API documentation. It allows users to refresh their access tokens
-    using a valid refresh token.
-    """
-
-    pass
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        cached = AuthenticatedUserCache.get(user_id) if user_id is not None else None
+
+        # Entries cached with the revoke check disabled carry no digest.
+        if cached is None or (api_settings.CHECK_REVOKE_TOKEN and cached[1] is None):
+            user = super().get_user(validated_token)
+            AuthenticatedUserCache.set(user)
+            return user
+
+        user, password_digest = cached
+
+        # Cached users were active when cached, but the token may predate
+        # the current password.
+        if (
+            api_settings.CHECK_REVOKE_TOKEN
+            and validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != password_digest
+        ):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+
+        return user
@@ -0,0 +1,148 @@
+import json
+import statistics
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Measure the throughput of the token endpoint under concurrent logins.
+
+    Sends `--requests` logins to a running server from `--concurrency`
+    threads and reports the throughput, the latency percentiles and the
+    average hash and database time read from the `Server-Timing` header,
+    which the server only sends with `DEBUG` or `LOGIN_SERVER_TIMING`.
+    """
+
+    help = "Benchmark /api/v1/token/ with concurrent logins."
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+
+        Args:
+            parser (ArgumentParser): The command argument parser.
+
+        Returns:
+            None
+        """
+        parser.add_argument(
+            "--url",
+            default="http://localhost:8000/api/v1/token/",
+            help="Token endpoint to call.",
+        )
+        parser.add_argument("--email", required=True, help="Login email.")
+        parser.add_argument("--password", required=True, help="Login password.")
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Total number of logins."
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=10, help="Concurrent logins."
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the logins and report the results.
+
+        Args:
+            *args: Positional arguments.
+            **options: The parsed command options.
+
+        Raises:
+            CommandError: If no login succeeded.
+
+        Returns:
+            None
+        """
+        body = json.dumps(
+            {"email": options["email"], "password": options["password"]}
+        ).encode()
+
+        def login(_):
+            return self.login(options["url"], body)
+
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+            results = list(pool.map(login, range(options["requests"])))
+
+        elapsed = time.perf_counter() - started
+        succeeded = [result for result in results if result["status"] == 200]
+
+        if not succeeded:
+            raise CommandError(
+                f"No login succeeded (statuses: {sorted({r['status'] for r in results})})."
+            )
+
+        latencies = sorted(result["latency"] for result in results)
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        timings = defaultdict(list)
+
+        for result in succeeded:
+            for name, duration in result["timings"].items():
+                timings[name].append(duration)
+
+        self.stdout.write(
+            f"{len(succeeded)}/{len(results)} logins in {elapsed:.2f} s "
+            f"({len(results) / elapsed:.1f} logins/s)"
+        )
+        self.stdout.write(
+            f"Latency: median {statistics.median(latencies):.1f} ms, "
+            f"p95 {p95:.1f} ms, max {latencies[-1]:.1f} ms"
+        )
+        if not timings:
+            self.stdout.write(
+                "Server time: not reported (run the server with "
+                "LOGIN_SERVER_TIMING=True or read the login logs)"
+            )
+            return
+
+        self.stdout.write(
+            "Server time: "
+            + ", ".join(
+                f"{name} {statistics.mean(values):.1f} ms"
+                for name, values in timings.items()
+            )
+        )
+
+    @staticmethod
+    def login(url: str, body: bytes) -> dict:
+        """
+        Send one login request.
+
+        Args:
+            url (str): The token endpoint.
+            body (bytes): The JSON credentials.
+
+        Returns:
+            dict: The response `status`, the `latency` in milliseconds and the `timings` of its `Server-Timing` header.
+        """
+        request = urllib.request.Request(
+            url, data=body, headers={"Content-Type": "application/json"}
+        )
+        started = time.perf_counter()
+
+        try:
+            with urllib.request.urlopen(request) as response:
+                status, header = response.status, response.headers.get("Server-Timing")
+        except urllib.error.HTTPError as e:
+            status, header = e.code, e.headers.get("Server-Timing")
+
+        timings = {}
+
+        for metric in (header or "").split(","):
+            name, _, duration = metric.strip().partition(";dur=")
+
+            if duration:
+                timings[name] = float(duration)
+
+        return {
+            "status": status,
+            "latency": (time.perf_counter() - started) * 1000,
+            "timings": timings,
+        }
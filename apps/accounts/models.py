@@ -28,3 +28,20 @@ class User(AbstractUser, PermissionsMixin):
     REQUIRED_FIELDS = []
 
     objects = UserManager()
+
+
+class RevokedToken(models.Model):
+    """
+    Refresh token revoked until it expires.
+
+    Used by the database revocation store. Rows are looked up by JTI and
+    deleted by the `purge_revoked_tokens` task once the token has expired,
+    so the table only holds tokens that are still alive.
+
+    Attributes:
+        jti (CharField): The identifier of the revoked token.
+        expires_at (DateTimeField): When the token expires and the row can be purged.
+    """
+
+    jti = models.CharField(max_length=255, primary_key=True)
+    expires_at = models.DateTimeField(db_index=True)
@@ -0,0 +1,216 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import redis
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from apps.accounts.models import RevokedToken
+
+
+class TokenRevocationStore(ABC):
+    """
+    Base class for refresh-token revocation stores.
+
+    A revocation store remembers the JTI of every refresh token that was
+    rotated or revoked until the token itself expires, so a token can be
+    used only once and the store never grows beyond the tokens still alive.
+    Both operations are a single keyed lookup.
+
+    Methods:
+        - revoke: Revokes a token, telling whether it was already revoked.
+        - is_revoked: Tells whether a token is revoked.
+        - purge: Deletes the entries of expired tokens.
+    """
+
+    @abstractmethod
+    def revoke(self, jti: str, expires_at: int) -> bool:
+        """
+        Revoke a token until it expires.
+
+        The check and the write are atomic, so when the same token is
+        presented concurrently only one caller revokes it.
+
+        Args:
+            jti (str): The token identifier.
+            expires_at (int): The token expiration, as a Unix timestamp.
+
+        Returns:
+            bool: True if the token was revoked by this call, False if it already was.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Tell whether a token is revoked.
+
+        Args:
+            jti (str): The token identifier.
+
+        Returns:
+            bool: True if the token is revoked and not yet expired.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def purge(self) -> int:
+        """
+        Delete the entries of expired tokens.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+        raise NotImplementedError
+
+
+class LocalTokenRevocationStore(TokenRevocationStore):
+    """
+    In-process revocation store backed by a dictionary.
+
+    Only suitable for a single process (local development and tests).
+    Expired entries are dropped by `purge`.
+    """
+
+    def __init__(self):
+        self._tokens = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expires_at: int) -> bool:
+        with self._lock:
+            if self._tokens.get(jti, 0) > time.time():
+                return False
+
+            self._tokens[jti] = expires_at
+            return True
+
+    def is_revoked(self, jti: str) -> bool:
+        return self._tokens.get(jti, 0) > time.time()
+
+    def purge(self) -> int:
+        now = time.time()
+
+        with self._lock:
+            expired = [jti for jti, exp in self._tokens.items() if exp <= now]
+
+            for jti in expired:
+                del self._tokens[jti]
+
+        return len(expired)
+
+
+class RedisTokenRevocationStore(TokenRevocationStore):
+    """
+    Revocation store backed by Redis keys shared by all processes.
+
+    Each token is revoked with `SET NX EXAT`, which expires the key together
+    with the token, so Redis evicts the entries on its own and `purge` has
+    nothing to do.
+    """
+
+    def __init__(self, url: str, key_prefix: str):
+        self.client = redis.Redis.from_url(url)
+        self.key_prefix = key_prefix
+
+    def revoke(self, jti: str, expires_at: int) -> bool:
+        if expires_at <= time.time():
+            # Redis rejects an expiration in the past; the token is dead anyway.
+            return True
+
+        return bool(self.client.set(self._key(jti), 1, exat=expires_at, nx=True))
+
+    def is_revoked(self, jti: str) -> bool:
+        return bool(self.client.exists(self._key(jti)))
+
+    def purge(self) -> int:
+        return 0
+
+    def _key(self, jti: str) -> str:
+        return f"{self.key_prefix}:{jti}"
+
+
+class DatabaseTokenRevocationStore(TokenRevocationStore):
+    """
+    Revocation store backed by the `RevokedToken` table.
+
+    Tokens are looked up by primary key and expired rows are deleted by the
+    `purge_revoked_tokens` periodic task through the `expires_at` index.
+    """
+
+    def revoke(self, jti: str, expires_at: int) -> bool:
+        expires_at = datetime_from_epoch(expires_at)
+        _, created = RevokedToken.objects.get_or_create(
+            jti=jti, defaults={"expires_at": expires_at}
+        )
+
+        if created:
+            return True
+
+        # An expired row may still be waiting for the purge.
+        return bool(
+            RevokedToken.objects.filter(jti=jti, expires_at__lte=timezone.now()).update(
+                expires_at=expires_at
+            )
+        )
+
+    def is_revoked(self, jti: str) -> bool:
+        return RevokedToken.objects.filter(
+            jti=jti, expires_at__gt=timezone.now()
+        ).exists()
+
+    def purge(self) -> int:
+        deleted, _ = RevokedToken.objects.filter(
+            expires_at__lte=timezone.now()
+        ).delete()
+        return deleted
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_revocation_store() -> TokenRevocationStore:
+    """
+    Return the per-process revocation store configured in the settings.
+
+    The backend is selected with `TOKEN_REVOCATION_BACKEND` ("redis",
+    "database" or "local").
+
+    Raises:
+        ValueError: If the configured backend is unknown.
+
+    Returns:
+        TokenRevocationStore: The shared store instance.
+    """
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                backend = settings.TOKEN_REVOCATION_BACKEND
+                if backend == "redis":
+                    _store = RedisTokenRevocationStore(
+                        settings.TOKEN_REVOCATION_URL,
+                        settings.TOKEN_REVOCATION_KEY_PREFIX,
+                    )
+                elif backend == "database":
+                    _store = DatabaseTokenRevocationStore()
+                elif backend == "local":
+                    _store = LocalTokenRevocationStore()
+                else:
+                    raise ValueError(f"Unknown token revocation backend: {backend}")
+
+    return _store
+
+
+def reset_revocation_store() -> None:
+    """
+    Drop the cached store so the next call rebuilds it from the settings.
+
+    Returns:
+        None
+    """
+    global _store
+    _store = None
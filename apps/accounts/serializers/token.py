@@ -0,0 +1,151 @@
+import time
+
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.models import update_last_login
+from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.accounts.revocation import get_revocation_store
+from apps.commons.timing import QueryTimer
+
+User = get_user_model()
+
+
+class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Custom serializer for obtaining JWT tokens.
+
+    This serializer extends the default `TokenObtainPairSerializer` to use
+    the user's email as the username field and includes additional user
+    information (user ID and email) in the token response.
+
+    The credentials are verified exactly once per login: the tokens are
+    built from the authenticated user instead of calling the parent
+    `validate`, which would run the password hasher and the user query a
+    second time. The time spent hashing and querying the database is kept
+    in `timings`, in milliseconds, for instrumentation.
+
+    Attributes:
+        username_field (str): Specifies the field to use as the username (email in this case).
+        timings (dict): The `hash`, `db` and `total` milliseconds of the last validation.
+
+    Methods:
+        - validate: Authenticates the user and customizes the token response.
+    """
+
+    username_field = User.EMAIL_FIELD
+
+    def validate(self, attrs):
+        """
+        Validate the user's credentials and generates a JWT token.
+
+        Args:
+            attrs (dict): The data passed to the serializer, including email and password.
+
+        Raises:
+            serializers.ValidationError: If the credentials are invalid.
+
+        Returns:
+            dict: The token data, including the access and refresh tokens,
+                  along with the user's ID and email.
+        """
+        queries = QueryTimer()
+        started = time.perf_counter()
+        hash_time = 0.0
+
+        try:
+            with queries:
+                user = authenticate(
+                    request=self.context.get("request"),
+                    email=attrs.get("email"),
+                    password=attrs.get("password"),
+                )
+                hash_time = time.perf_counter() - started - queries.duration
+
+                if not api_settings.USER_AUTHENTICATION_RULE(user):
+                    raise serializers.ValidationError("Invalid credentials")
+
+                self.user = user
+                refresh = self.get_token(user)
+
+                if api_settings.UPDATE_LAST_LOGIN:
+                    update_last_login(None, user)
+        finally:
+            self.timings = {
+                "hash": hash_time * 1000,
+                "db": queries.duration * 1000,
+                "total": (time.perf_counter() - started) * 1000,
+            }
+
+        return {
+            "refresh": str(refresh),
+            "access": str(refresh.access_token),
+            "user_id": user.id,
+            "email": user.email,
+        }
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Custom serializer for refreshing JWT tokens.
+
+    With `ROTATE_REFRESH_TOKENS` and `BLACKLIST_AFTER_ROTATION`, every
+    refresh token can be used only once: it is revoked in the configured
+    revocation store before a new one is issued, and presenting it again is
+    rejected. The store keeps each entry only until the token expires, so
+    the parent `validate`, which records every issued token in the
+    outstanding-tokens table of the blacklist app, is not used.
+
+    Methods:
+        - validate: Checks and revokes the refresh token and issues new tokens.
+    """
+
+    def validate(self, attrs):
+        """
+        Validate the refresh token and issue a new access token.
+
+        Args:
+            attrs (dict): The data passed to the serializer, including the refresh token.
+
+        Raises:
+            InvalidToken: If the refresh token is invalid, expired or revoked.
+            AuthenticationFailed: If the user of the token is no longer active.
+
+        Returns:
+            dict: The new access token and, when rotating, the new refresh token.
+        """
+        refresh = self.token_class(attrs["refresh"])
+        jti = refresh[api_settings.JTI_CLAIM]
+        store = get_revocation_store()
+
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            revoked = not store.revoke(jti, refresh["exp"])
+        else:
+            revoked = store.is_revoked(jti)
+
+        if revoked:
+            raise InvalidToken("Token is blacklisted")
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        user = User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+
+        if user_id and not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                self.error_messages["no_active_account"], "no_active_account"
+            )
+
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+
+        return data
@@ -0,0 +1,150 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+User = get_user_model()
+
+
+class StaffRecipientService:
+    """
+    Cached email addresses of the active staff members.
+
+    Staff notifications are sent to every active staff member, so the list
+    is read from the cache instead of the users table on every notification.
+    The signals in `apps.accounts.signals` invalidate it whenever a user's
+    staff status, active status or email may have changed.
+
+    Methods:
+    - get_emails: Returns the emails of the active staff members.
+    - invalidate: Drops the cached list.
+    """
+
+    CACHE_KEY = "accounts:staff_emails"
+
+    @classmethod
+    def get_emails(cls) -> list[str]:
+        """
+        Return the emails of the active staff members.
+
+        Returns:
+            list[str]: The staff emails, ordered by user ID.
+        """
+        emails = cache.get(cls.CACHE_KEY)
+
+        if emails is None:
+            emails = list(
+                User.objects.filter(is_staff=True, is_active=True)
+                .exclude(email="")
+                .order_by("id")
+                .values_list("email", flat=True)
+            )
+            cache.set(cls.CACHE_KEY, emails, settings.STAFF_EMAILS_CACHE_TIMEOUT)
+
+        return emails
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Drop the cached staff emails.
+
+        Returns:
+            None
+        """
+        cache.delete(cls.CACHE_KEY)
+
+
+class AuthenticatedUserCache:
+    """
+    Short-lived cache of the users resolved from access tokens.
+
+    Authenticated requests read the token's user from the shared cache
+    instead of the users table. Only the fields requests rely on are cached
+    (never the password hash), and the user is rebuilt from them with every
+    other field deferred, as `only()` would: those are loaded from the
+    database on access, and `save()` writes back only the cached fields.
+    When `CHECK_REVOKE_TOKEN` is enabled, the digest of the password the
+    token must match is cached along with them.
+
+    The signals in `apps.accounts.signals` drop a user's entry whenever it
+    is saved (e.g. deactivated, demoted or given a new password) or deleted;
+    `JWT_USER_CACHE_TIMEOUT` bounds how long a change made without signals,
+    such as `QuerySet.update`, goes unnoticed.
+
+    Methods:
+    - get: Returns the cached user and password digest.
+    - set: Caches a user.
+    - invalidate: Drops the cached user.
+    """
+
+    KEY_PREFIX = "accounts:jwt_user"
+    FIELDS = ("id", "email", "is_active", "is_staff", "is_superuser")
+
+    @classmethod
+    def get(cls, user_id) -> tuple[User, str | None] | None:
+        """
+        Return the cached user and password digest.
+
+        Args:
+            user_id (Any): The user ID claimed by the token.
+
+        Returns:
+            tuple[User, str | None] | None: The user and the digest of its password (None unless `CHECK_REVOKE_TOKEN` is enabled), or None on a miss.
+        """
+        entry = cache.get(cls._key(user_id))
+
+        if entry is None:
+            return None
+
+        values, password_digest = entry
+        names = [
+            field.attname
+            for field in User._meta.concrete_fields
+            if field.attname in values
+        ]
+        user = User.from_db(
+            router.db_for_read(User), names, [values[name] for name in names]
+        )
+        return user, password_digest
+
+    @classmethod
+    def set(cls, user: User) -> None:
+        """
+        Cache a user for `JWT_USER_CACHE_TIMEOUT` seconds.
+
+        Args:
+            user (User): The resolved user.
+
+        Returns:
+            None
+        """
+        values = {name: getattr(user, name) for name in cls.FIELDS}
+        password_digest = (
+            get_md5_hash_password(user.password)
+            if api_settings.CHECK_REVOKE_TOKEN
+            else None
+        )
+        cache.set(
+            cls._key(user.pk),
+            (values, password_digest),
+            settings.JWT_USER_CACHE_TIMEOUT,
+        )
+
+    @classmethod
+    def invalidate(cls, user_id) -> None:
+        """
+        Drop the cached user.
+
+        Args:
+            user_id (Any): The user ID.
+
+        Returns:
+            None
+        """
+        cache.delete(cls._key(user_id))
+
+    @classmethod
+    def _key(cls, user_id) -> str:
+        return f"{cls.KEY_PREFIX}:{user_id}"
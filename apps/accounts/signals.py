@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.services import AuthenticatedUserCache, StaffRecipientService
+
+User = get_user_model()
+
+STAFF_FIELDS = {"is_staff", "is_active", "email"}
+LOGIN_FIELDS = {"last_login"}
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_staff_emails(sender, update_fields=None, **kwargs):
+    """
+    Invalidate the cached staff emails when a user changes.
+
+    Saves limited to fields that do not affect the list, such as the
+    `last_login` update on every login, are ignored. The cache is
+    invalidated right away and again once the transaction commits.
+
+    Args:
+        sender (Model): The model class that sent the signal.
+        update_fields (frozenset, optional): The fields saved, if limited.
+        **kwargs: Additional signal arguments.
+
+    Returns:
+        None
+    """
+    if update_fields is not None and not STAFF_FIELDS & set(update_fields):
+        return
+
+    StaffRecipientService.invalidate()
+    transaction.on_commit(StaffRecipientService.invalidate)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_authenticated_user(sender, instance, update_fields=None, **kwargs):
+    """
+    Drop the cached token user when a user changes.
+
+    Saves limited to `last_login` are ignored. The cache is invalidated
+    right away and again once the transaction commits.
+
+    Args:
+        sender (Model): The model class that sent the signal.
+        instance (User): The saved or deleted user.
+        update_fields (frozenset, optional): The fields saved, if limited.
+        **kwargs: Additional signal arguments.
+
+    Returns:
+        None
+    """
+    if update_fields is not None and set(update_fields) <= LOGIN_FIELDS:
+        return
+
+    user_id = instance.pk
+    AuthenticatedUserCache.invalidate(user_id)
+    transaction.on_commit(lambda: AuthenticatedUserCache.invalidate(user_id))
@@ -0,0 +1,14 @@
+from celery import shared_task
+
+from .revocation import get_revocation_store
+
+
+@shared_task
+def purge_revoked_tokens() -> int:
+    """
+    Delete the revoked refresh tokens that have already expired.
+
+    Returns:
+        int: The number of entries deleted.
+    """
+    return get_revocation_store().purge()
@@ -0,0 +1,77 @@
+import hashlib
+from collections.abc import Mapping
+
+from django.contrib.auth import get_user_model
+
+from apps.commons.throttling import SlidingWindowRateThrottle
+
+User = get_user_model()
+
+
+class LoginIPRateThrottle(SlidingWindowRateThrottle):
+    """
+    Throttle for login attempts coming from the same client IP.
+
+    Runs before the credentials are validated, so rejected attempts never
+    reach the password hasher or the database. The client IP is resolved
+    with DRF's `get_ident`, which only trusts the `X-Forwarded-For` entries
+    added by the `NUM_PROXIES` proxies in front of the app.
+    """
+
+    scope = "login_ip"
+
+    def get_cache_key(self, request, view):
+        """
+        Return the cache key of the client IP.
+
+        Args:
+            request (Request): The HTTP request object.
+            view (APIView): The view being throttled.
+
+        Returns:
+            str: The cache key.
+        """
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class LoginEmailRateThrottle(SlidingWindowRateThrottle):
+    """
+    Throttle for login attempts against the same account.
+
+    Limits credential stuffing spread over many IPs. The email is
+    normalized and hashed, so the cache keys have a bounded length.
+    """
+
+    scope = "login_email"
+
+    def get_cache_key(self, request, view):
+        """
+        Return the cache key of the submitted email, if any.
+
+        Args:
+            request (Request): The HTTP request object.
+            view (APIView): The view being throttled.
+
+        Returns:
+            str | None: The cache key, or None if no email was submitted.
+        """
+        if not isinstance(request.data, Mapping):
+            # Left to the serializer, which rejects the body with a 400.
+            return None
+
+        email = request.data.get(User.EMAIL_FIELD)
+
+        if not isinstance(email, str) or not email.strip():
+            return None
+
+        ident = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+
+class TokenRefreshRateThrottle(LoginIPRateThrottle):
+    """Throttle for token refreshes coming from the same client IP."""
+
+    scope = "token_refresh"
@@ -0,0 +1,99 @@
+import logging
+
+from django.conf import settings
+from drf_spectacular.utils import extend_schema
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from apps.accounts.serializers.token import (
+    CustomTokenObtainPairSerializer,
+    CustomTokenRefreshSerializer,
+)
+from apps.accounts.throttles import (
+    LoginEmailRateThrottle,
+    LoginIPRateThrottle,
+    TokenRefreshRateThrottle,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@extend_schema(tags=["auth"])
+class CustomTokenObtainPairView(TokenObtainPairView):
+    """
+    Custom view for obtaining JWT tokens.
+
+    This view uses the `CustomTokenObtainPairSerializer` to authenticate
+    users and generate JWT tokens. It is tagged under "auth" for API documentation.
+
+    Every login, successful or not, is instrumented: the time spent in the
+    password hasher and in the database is logged. It is only returned in a
+    `Server-Timing` header with `DEBUG` or `LOGIN_SERVER_TIMING`, since it
+    would let clients tell accounts apart by timing.
+
+    Logins are throttled per client IP and per email before the credentials
+    are checked, so bursts are rejected with 429 without hashing anything.
+    """
+
+    serializer_class = CustomTokenObtainPairSerializer
+    throttle_classes = [LoginIPRateThrottle, LoginEmailRateThrottle]
+
+    def get_serializer(self, *args, **kwargs):
+        """
+        Return the token serializer, keeping it to read its timings.
+
+        Args:
+            *args: Positional arguments for the serializer.
+            **kwargs: Keyword arguments for the serializer.
+
+        Returns:
+            CustomTokenObtainPairSerializer: The serializer instance.
+        """
+        self.token_serializer = super().get_serializer(*args, **kwargs)
+        return self.token_serializer
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Log the login timings, adding them to the response if enabled.
+
+        Args:
+            request (Request): The HTTP request object.
+            response (Response): The response, including error responses.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Response: The finalized response.
+        """
+        timings = getattr(getattr(self, "token_serializer", None), "timings", None)
+
+        if timings:
+            if settings.DEBUG or settings.LOGIN_SERVER_TIMING:
+                response["Server-Timing"] = ", ".join(
+                    f"{name};dur={duration:.1f}" for name, duration in timings.items()
+                )
+
+            logger.info(
+                "Login %s in %.1f ms (hash %.1f ms, db %.1f ms)",
+                "succeeded" if response.status_code == 200 else "failed",
+                timings["total"],
+                timings["hash"],
+                timings["db"],
+            )
+
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+@extend_schema(tags=["auth"])
+class CustomTokenRefreshView(TokenRefreshView):
+    """
+    Custom view for refreshing JWT tokens.
+
+    This view extends the default `TokenRefreshView` and is tagged under "auth"
+    for API documentation. It allows users to refresh their access tokens
+    using a valid refresh token. Rotated refresh tokens are revoked by the
+    `CustomTokenRefreshSerializer` and cannot be used again. Refreshes are
+    throttled per client IP.
+    """
+
+    serializer_class = CustomTokenRefreshSerializer
+    throttle_classes = [TokenRefreshRateThrottle]
@@ -0,0 +1,54 @@
+from django.db import transaction
+
+
+class AtomicWriteMixin:
+    """
+    Run the writes of a DRF model view inside a transaction.
+
+    Signal handlers that run during `save` and `delete` (e.g. those taking
+    row locks) then share the transaction of the write itself.
+
+    Methods:
+        - perform_create: Saves a new instance in a transaction.
+        - perform_update: Saves an updated instance in a transaction.
+        - perform_destroy: Deletes an instance in a transaction.
+    """
+
+    def perform_create(self, serializer):
+        """
+        Save a new instance in a transaction.
+
+        Args:
+            serializer (Serializer): The validated serializer.
+
+        Returns:
+            None
+        """
+        with transaction.atomic():
+            super().perform_create(serializer)
+
+    def perform_update(self, serializer):
+        """
+        Save an updated instance in a transaction.
+
+        Args:
+            serializer (Serializer): The validated serializer.
+
+        Returns:
+            None
+        """
+        with transaction.atomic():
+            super().perform_update(serializer)
+
+    def perform_destroy(self, instance):
+        """
+        Delete an instance in a transaction.
+
+        Args:
+            instance (Model): The instance to delete.
+
+        Returns:
+            None
+        """
+        with transaction.atomic():
+            super().perform_destroy(instance)
@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from django.core.cache import cache
+
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe, per-process least-recently-used cache.
+
+    Entries beyond `maxsize` are evicted oldest-first. The cache keeps hit,
+    miss and eviction counters so callers can expose their hit rate.
+
+    Methods:
+        - get: Returns a cached value or `default`.
+        - set: Stores a value, evicting the least recently used entry if needed.
+        - get_or_set: Returns a cached value or computes and stores it.
+        - clear: Removes every entry without resetting the counters.
+        - stats: Returns the cache counters.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """
+        Return the value cached for `key` and mark it as recently used.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any, optional): Returned when the key is not cached. Defaults to `MISSING`.
+
+        Returns:
+            Any: The cached value or `default`.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries beyond `maxsize`.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+
+        Returns:
+            None
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, computing and storing it on a miss.
+
+        The factory runs outside the lock, so concurrent misses for the same
+        key may compute the value more than once.
+
+        Args:
+            key (Hashable): The cache key.
+            factory (Callable[[], Any]): Computes the value on a miss.
+
+        Returns:
+            Any: The cached or freshly computed value.
+        """
+        value = self.get(key)
+
+        if value is MISSING:
+            value = factory()
+            self.set(key, value)
+
+        return value
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: Size, maximum size, hits, misses, evictions and hit rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._data)
+
+
+def get_or_set_locked(
+    key: str,
+    factory: Callable[[], Any],
+    timeout: float,
+    lock_timeout: float = 10,
+    wait_timeout: float = 2,
+    poll_interval: float = 0.05,
+) -> Any:
+    """
+    Return a value from Django's cache, computing it once on a miss.
+
+    Only the caller that acquires the `<key>:lock` entry computes the value;
+    concurrent callers poll the cache for up to `wait_timeout` seconds and
+    compute the value themselves only if it still has not appeared. This
+    keeps a hot key expiring from sending every concurrent request to the
+    database.
+
+    Args:
+        key (str): The cache key.
+        factory (Callable[[], Any]): Computes the value on a miss.
+        timeout (float): Seconds the computed value is cached for.
+        lock_timeout (float, optional): Seconds before an abandoned lock expires. Defaults to 10.
+        wait_timeout (float, optional): Seconds to wait for another caller. Defaults to 2.
+        poll_interval (float, optional): Seconds between polls. Defaults to 0.05.
+
+    Returns:
+        Any: The cached or freshly computed value.
+    """
+    value = cache.get(key, MISSING)
+
+    if value is not MISSING:
+        return value
+
+    lock_key = f"{key}:lock"
+
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            value = factory()
+            cache.set(key, value, timeout)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+    deadline = time.monotonic() + wait_timeout
+
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        value = cache.get(key, MISSING)
+
+        if value is not MISSING:
+            return value
+
+    return factory()
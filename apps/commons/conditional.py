@@ -0,0 +1,79 @@
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def content_etag(data) -> str:
+    """
+    Return a strong ETag for serialized response data.
+
+    Args:
+        data (Any): JSON serializable response data.
+
+    Returns:
+        str: The quoted MD5 digest of the canonical JSON representation.
+    """
+    content = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder)
+    return f'"{hashlib.md5(content.encode()).hexdigest()}"'
+
+
+class ConditionalGetMixin:
+    """
+    ETag and Last-Modified support for DRF views.
+
+    Views compute the validators of a resource (ideally from a cache or a
+    cheap version lookup), call `not_modified` before serializing anything
+    and return its 304 response when the client's copy is current.
+    Otherwise they add the validators to the full response with
+    `add_validators`.
+
+    Methods:
+        - not_modified: Returns a 304 response if the client's copy is current.
+        - add_validators: Adds the ETag and Last-Modified headers to a response.
+    """
+
+    def not_modified(self, request, etag=None, last_modified=None):
+        """
+        Evaluate the request's conditional headers against the validators.
+
+        Args:
+            request (Request): The HTTP request object.
+            etag (str, optional): The quoted ETag of the current representation.
+            last_modified (float, optional): The POSIX timestamp of the last modification.
+
+        Returns:
+            HttpResponse | None: A 304 response with the validators, or None if the full response must be sent.
+        """
+        response = get_conditional_response(
+            request._request,
+            etag=etag,
+            last_modified=int(last_modified) if last_modified else None,
+        )
+
+        if response is not None:
+            self.add_validators(response, etag, last_modified)
+
+        return response
+
+    def add_validators(self, response, etag=None, last_modified=None):
+        """
+        Add the ETag and Last-Modified headers to a response.
+
+        Args:
+            response (HttpResponse): The response to update.
+            etag (str, optional): The quoted ETag of the representation.
+            last_modified (float, optional): The POSIX timestamp of the last modification.
+
+        Returns:
+            HttpResponse: The same response.
+        """
+        if etag:
+            response["ETag"] = etag
+
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified)
+
+        return response
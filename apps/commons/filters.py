@@ -0,0 +1,29 @@
+from rest_framework.filters import OrderingFilter
+
+
+class StableOrderingFilter(OrderingFilter):
+    """
+    Ordering filter that always breaks ties by primary key.
+
+    Rows sharing the requested ordering values (e.g. the same price) keep
+    a deterministic order, so no row is repeated or skipped across pages.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Return the requested ordering followed by the primary key.
+
+        Args:
+            request (Request): The HTTP request object.
+            queryset (QuerySet): The queryset being ordered.
+            view (APIView): The view being filtered.
+
+        Returns:
+            tuple[str, ...] | None: The ordering, or None if there is none.
+        """
+        ordering = super().get_ordering(request, queryset, view)
+
+        if not ordering or {"id", "-id", "pk", "-pk"} & set(ordering):
+            return ordering
+
+        return (*ordering, "id")
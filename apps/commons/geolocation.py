@@ -0,0 +1,171 @@
+import ipaddress
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from geoip2.database import MODE_MMAP, Reader
+
+from apps.commons.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class GeoLocationService:
+    """
+    Process-wide geolocation service backed by the GeoLite2 City database.
+
+    The database is opened once per process in memory-mapped mode and
+    reopened when the file on disk changes. Lookups are served from a bounded
+    LRU cache keyed by IP address or, for IPv4, by its network prefix
+    (`GEOIP_CACHE_IPV4_PREFIX`).
+
+    Methods:
+    - locate: Returns the country and city of an IP address.
+    - stats: Returns the lookup cache counters.
+    - reset: Closes the database and clears the lookup cache.
+    """
+
+    _lock = threading.Lock()
+    _reader = None
+    _reader_mtime = None
+    _reader_pid = None
+    _last_check = 0.0
+    _cache = None
+
+    @classmethod
+    def locate(cls, ip: str | None) -> tuple[str | None, str | None]:
+        """
+        Return the country and city names of an IP address.
+
+        Args:
+            ip (str | None): The IP address to locate.
+
+        Returns:
+            tuple[str | None, str | None]: The country and city names, or
+            `(None, None)` if the address cannot be located.
+        """
+        key = cls._cache_key(ip)
+
+        if key is None:
+            return None, None
+
+        cls._refresh_reader()
+        return cls._get_cache().get_or_set(key, lambda: cls._lookup(ip))
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+        Return the lookup cache counters.
+
+        Returns:
+            dict: Size, maximum size, hits, misses, evictions and hit rate.
+        """
+        return cls._get_cache().stats()
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Close the database reader and drop the lookup cache.
+
+        Returns:
+            None
+        """
+        with cls._lock:
+            if cls._reader is not None:
+                cls._reader.close()
+
+            cls._reader = None
+            cls._reader_mtime = None
+            cls._reader_pid = None
+            cls._last_check = 0.0
+            cls._cache = None
+
+    @classmethod
+    def _get_cache(cls) -> LRUCache:
+        if cls._cache is None:
+            with cls._lock:
+                if cls._cache is None:
+                    cls._cache = LRUCache(settings.GEOIP_CACHE_SIZE)
+
+        return cls._cache
+
+    @classmethod
+    def _cache_key(cls, ip: str | None) -> str | None:
+        """
+        Build the lookup cache key for an IP address.
+
+        Args:
+            ip (str | None): The IP address.
+
+        Returns:
+            str | None: The address or its IPv4 network, or None if the address is invalid.
+        """
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+
+        prefix = settings.GEOIP_CACHE_IPV4_PREFIX
+
+        if address.version == 4 and prefix:
+            return str(ipaddress.ip_network(f"{address}/{prefix}", strict=False))
+
+        return str(address)
+
+    @classmethod
+    def _refresh_reader(cls) -> None:
+        """
+        Open the database, or reopen it if the file changed on disk.
+
+        The file is checked at most every `GEOIP_RELOAD_CHECK_INTERVAL`
+        seconds. A forked process opens its own reader.
+
+        Returns:
+            None
+        """
+        now = time.monotonic()
+        pid = os.getpid()
+
+        if (
+            cls._reader_pid == pid
+            and now - cls._last_check < settings.GEOIP_RELOAD_CHECK_INTERVAL
+        ):
+            return
+
+        with cls._lock:
+            cls._last_check = now
+
+            try:
+                mtime = os.stat(settings.GEOIP_DB_PATH).st_mtime
+            except OSError:
+                logger.warning("GeoIP database not found: %s", settings.GEOIP_DB_PATH)
+                cls._reader_pid = pid
+                return
+
+            if cls._reader_pid == pid and cls._reader_mtime == mtime:
+                return
+
+            # The previous reader is not closed explicitly: lookups running in
+            # other threads may still hold it, and it is released with them.
+            cls._reader = Reader(settings.GEOIP_DB_PATH, mode=MODE_MMAP)
+            cls._reader_mtime = mtime
+            cls._reader_pid = pid
+
+            if cls._cache is not None:
+                cls._cache.clear()
+
+    @classmethod
+    def _lookup(cls, ip: str) -> tuple[str | None, str | None]:
+        reader = cls._reader
+
+        if reader is None:
+            return None, None
+
+        try:
+            response = reader.city(ip)
+        except Exception:
+            return None, None
+
+        return response.country.name, response.city.name
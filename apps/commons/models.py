@@ -0,0 +1,25 @@
+from django.db import models
+
+
+class OutboxMessage(models.Model):
+    """
+    Celery task waiting to be published by the outbox relay.
+
+    Messages are written in the same transaction as the change that causes
+    them, so a rolled back change never publishes its side effects, and the
+    request never waits for the broker.
+    """
+
+    task = models.CharField(max_length=255)
+    args = models.JSONField(default=list)
+    kwargs = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        """
+        Return a string representation of the OutboxMessage instance.
+
+        Returns:
+            str: The task name and the message ID.
+        """
+        return f"{self.task} ({self.id})"
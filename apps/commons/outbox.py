@@ -0,0 +1,101 @@
+import logging
+
+from celery import current_app
+from django.conf import settings
+from django.db import transaction
+
+from apps.commons.models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+class Outbox:
+    """
+    Transactional outbox for Celery tasks.
+
+    `enqueue` stores the task call as an `OutboxMessage` in the current
+    transaction. The relay publishes the stored messages in batches: each
+    batch is locked with `SELECT ... FOR UPDATE SKIP LOCKED`, so concurrent
+    relays never publish the same message, and published messages are
+    deleted in the same transaction. A message is only published twice if
+    the relay dies between publishing it and committing.
+
+    Methods:
+    - enqueue: Stores a task call to be published after the commit.
+    - relay: Publishes every pending message in batches.
+    - relay_batch: Publishes one batch of pending messages.
+    """
+
+    @classmethod
+    def enqueue(cls, task_name: str, *args, **kwargs) -> OutboxMessage:
+        """
+        Store a task call to be published by the relay.
+
+        Args:
+            task_name (str): The registered name of the Celery task.
+            *args: The task positional arguments, JSON serializable.
+            **kwargs: The task keyword arguments, JSON serializable.
+
+        Returns:
+            OutboxMessage: The stored message.
+        """
+        return OutboxMessage.objects.create(task=task_name, args=args, kwargs=kwargs)
+
+    @classmethod
+    def relay(cls, batch_size: int | None = None) -> int:
+        """
+        Publish every pending message, one batch at a time.
+
+        Args:
+            batch_size (int, optional): Messages per batch. Defaults to `OUTBOX_RELAY_BATCH_SIZE`.
+
+        Returns:
+            int: The number of messages published.
+        """
+        batch_size = batch_size or settings.OUTBOX_RELAY_BATCH_SIZE
+        total = 0
+
+        while True:
+            published = cls.relay_batch(batch_size)
+            total += published
+
+            if published < batch_size:
+                return total
+
+    @classmethod
+    def relay_batch(cls, batch_size: int) -> int:
+        """
+        Publish one batch of pending messages.
+
+        Publishing stops at the first message the broker rejects; the
+        messages published before it are still deleted, and the rest are
+        retried on the next run.
+
+        Args:
+            batch_size (int): The maximum number of messages to publish.
+
+        Returns:
+            int: The number of messages published.
+        """
+        with transaction.atomic():
+            messages = list(
+                OutboxMessage.objects.select_for_update(skip_locked=True).order_by(
+                    "id"
+                )[:batch_size]
+            )
+            published = []
+
+            for message in messages:
+                try:
+                    current_app.signature(
+                        message.task, args=message.args, kwargs=message.kwargs
+                    ).apply_async()
+                except Exception:
+                    logger.exception("Failed to publish outbox message %s", message.id)
+                    break
+
+                published.append(message.id)
+
+            OutboxMessage.objects.filter(id__in=published).delete()
+
+        return len(published)
@@ -0,0 +1,169 @@
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination over the primary key.
+
+    Each page is fetched with `WHERE id > <cursor> ORDER BY id LIMIT n`, which
+    is an index range scan no matter how deep the page is, and no total count
+    is computed.
+    """
+
+    ordering = "id"
+    page_size_query_param = "limit"
+    max_page_size = 1000
+
+
+class CursorOrLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination with opt-in keyset pagination and count skipping.
+
+    - `?pagination=cursor` (or a `cursor` parameter from a previous page)
+      switches to `KeysetPagination`.
+    - `?count=false` keeps limit/offset but skips the `COUNT(*)` query; the
+      `count` key is omitted and the next link is present only when another
+      row exists.
+
+    Without those parameters it behaves like `LimitOffsetPagination`, so
+    existing clients are unaffected.
+    """
+
+    mode_query_param = "pagination"
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginate a queryset using the mode requested by the client.
+
+        Args:
+            queryset (QuerySet): The queryset to paginate.
+            request (Request): The HTTP request object.
+            view (APIView, optional): The view being paginated.
+
+        Returns:
+            list | None: The page of results, or None if pagination is disabled.
+        """
+        self.cursor_paginator = None
+
+        if self._use_cursor(request):
+            self.cursor_paginator = KeysetPagination()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+
+        if self._skip_count(request):
+            return self._paginate_without_count(queryset, request)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        """
+        Build the paginated response for the active pagination mode.
+
+        Args:
+            data (list): The serialized page of results.
+
+        Returns:
+            Response: The paginated response.
+        """
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+
+        if self.count is None:
+            return Response(
+                {
+                    "next": self.get_next_link(),
+                    "previous": self.get_previous_link(),
+                    "results": data,
+                }
+            )
+
+        return super().get_paginated_response(data)
+
+    def get_next_link(self):
+        """
+        Return the link to the next page.
+
+        Returns:
+            str | None: The next page URL, or None on the last page.
+        """
+        if self.count is None:
+            return self._build_link(self.offset + self.limit) if self.has_next else None
+
+        return super().get_next_link()
+
+    def get_schema_operation_parameters(self, view):
+        """
+        Document the limit/offset, cursor and count query parameters.
+
+        Args:
+            view (APIView): The view being documented.
+
+        Returns:
+            list[dict]: The OpenAPI query parameters.
+        """
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Use `cursor` to switch to keyset pagination.",
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            {
+                "name": KeysetPagination.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": KeysetPagination.cursor_query_description,
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Use `false` to skip the total count.",
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+    def _use_cursor(self, request) -> bool:
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or KeysetPagination.cursor_query_param in request.query_params
+        )
+
+    def _skip_count(self, request) -> bool:
+        return request.query_params.get(self.count_query_param, "").lower() in (
+            "false",
+            "0",
+        )
+
+    def _paginate_without_count(self, queryset, request):
+        """
+        Fetch one extra row instead of counting to know whether a next page exists.
+
+        Args:
+            queryset (QuerySet): The queryset to paginate.
+            request (Request): The HTTP request object.
+
+        Returns:
+            list | None: The page of results, or None if pagination is disabled.
+        """
+        self.request = request
+        self.limit = self.get_limit(request)
+
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        self.count = None
+        start, end = self.offset, self.offset + self.limit + 1
+        rows = list(queryset[start:end])
+        self.has_next = len(rows) > self.limit
+        return rows[: self.limit]
+
+    def _build_link(self, offset: int) -> str:
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.offset_query_param, offset)
@@ -1,21 +1,41 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
 
 class EmailService:
     """
     Service class for sending emails via AWS SES.
 
-    This class provides a method to send emails using AWS Simple Email Service (SES).
+    This class provides methods to send emails using AWS Simple Email Service (SES).
     It requires AWS credentials and configuration to be set in the Django settings.
 
+    The SES client is created lazily, once per process, and shared by every
+    thread: its connection pool (`AWS_SES_MAX_POOL_CONNECTIONS`) and retry
+    policy (`AWS_SES_MAX_ATTEMPTS`) are configured once instead of on every
+    email. `AWS_SES_ENDPOINT_URL` points the client to a local SES stub.
+
     Methods:
     - send_email: Sends an email to the specified recipients.
+    - send_bulk: Sends many emails concurrently over the shared client.
+    - get_client: Returns the shared SES client.
+    - reset_client: Drops the shared SES client so it is rebuilt.
     """
 
+    _lock = threading.Lock()
+    _client = None
+    _client_pid = None
+
     @classmethod
-    def send_email(self, subject: str, content: str, to_emails: list[str]) -> None:
+    def send_email(cls, subject: str, content: str, to_emails: list[str]) -> dict:
         """
         Send an email using AWS SES.
 
@@ -31,18 +51,10 @@ class EmailService:
         Returns:
             dict: The response from the AWS SES client if the email is sent successfully.
         """
-        if not settings.AWS_ACCESS_KEY_ID or not settings.AWS_SECRET_ACCESS_KEY:
-            raise ValueError("Missing AWS SES credentials")
-
-        client = boto3.client(
-            "ses",
-            region_name=settings.AWS_REGION_NAME,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
+        client = cls.get_client()
 
         try:
-            response = client.send_email(
+            return client.send_email(
                 Source=settings.FROM_EMAIL,
                 Destination={"ToAddresses": to_emails},
                 Message={
@@ -50,8 +62,101 @@ class EmailService:
                     "Body": {"Text": {"Data": content}},
                 },
             )
-            return response
         except ClientError as e:
             raise RuntimeError(
                 f"Failed to send email: {e.response['Error']['Message']}"
             )
+
+    @classmethod
+    def send_bulk(
+        cls, messages: list[tuple[str, str, list[str]]], max_workers: int | None = None
+    ) -> list[dict]:
+        """
+        Send many emails concurrently over the shared SES client.
+
+        A failed message does not stop the others; its error is reported in
+        its result instead.
+
+        Args:
+            messages (list[tuple[str, str, list[str]]]): The subject, content and recipients of each email.
+            max_workers (int, optional): Concurrent sends. Defaults to `AWS_SES_MAX_POOL_CONNECTIONS`.
+
+        Raises:
+            ValueError: If AWS SES credentials are missing in the settings.
+
+        Returns:
+            list[dict]: For each message, in order, its recipients (`to`), the SES `message_id` and the `error`, if any.
+        """
+        if not messages:
+            return []
+
+        cls.get_client()
+        max_workers = max_workers or settings.AWS_SES_MAX_POOL_CONNECTIONS
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(messages))) as pool:
+            return list(pool.map(lambda message: cls._send_one(*message), messages))
+
+    @classmethod
+    def get_client(cls):
+        """
+        Return the SES client shared by every thread of the current process.
+
+        Raises:
+            ValueError: If AWS SES credentials are missing in the settings.
+
+        Returns:
+            botocore.client.BaseClient: The SES client.
+        """
+        if not settings.AWS_ACCESS_KEY_ID or not settings.AWS_SECRET_ACCESS_KEY:
+            raise ValueError("Missing AWS SES credentials")
+
+        pid = os.getpid()
+
+        if cls._client is None or cls._client_pid != pid:
+            with cls._lock:
+                if cls._client is None or cls._client_pid != pid:
+                    cls._client = cls._create_client()
+                    cls._client_pid = pid
+
+        return cls._client
+
+    @classmethod
+    def reset_client(cls) -> None:
+        """
+        Drop the shared SES client so the next call rebuilds it from the settings.
+
+        Returns:
+            None
+        """
+        with cls._lock:
+            cls._client = None
+            cls._client_pid = None
+
+    @classmethod
+    def _create_client(cls):
+        return boto3.client(
+            "ses",
+            region_name=settings.AWS_REGION_NAME,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            endpoint_url=settings.AWS_SES_ENDPOINT_URL or None,
+            config=Config(
+                max_pool_connections=settings.AWS_SES_MAX_POOL_CONNECTIONS,
+                retries={
+                    "max_attempts": settings.AWS_SES_MAX_ATTEMPTS,
+                    "mode": "adaptive",
+                },
+                connect_timeout=settings.AWS_SES_CONNECT_TIMEOUT,
+                read_timeout=settings.AWS_SES_READ_TIMEOUT,
+            ),
+        )
+
+    @classmethod
+    def _send_one(cls, subject: str, content: str, to_emails: list[str]) -> dict:
+        try:
+            response = cls.send_email(subject, content, to_emails)
+        except (RuntimeError, BotoCoreError) as e:
+            logger.warning("Failed to send email to %s: %s", to_emails, e)
+            return {"to": to_emails, "message_id": None, "error": str(e)}
+
+        return {"to": to_emails, "message_id": response.get("MessageId"), "error": None}
@@ -0,0 +1,14 @@
+from celery import shared_task
+
+from .outbox import Outbox
+
+
+@shared_task
+def relay_outbox() -> int:
+    """
+    Publish the pending outbox messages to the broker.
+
+    Returns:
+        int: The number of messages published.
+    """
+    return Outbox.relay()
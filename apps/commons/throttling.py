@@ -0,0 +1,96 @@
+from django.core.cache import cache as default_cache
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Rate throttle based on a sliding-window counter in the cache.
+
+    DRF's `SimpleRateThrottle` keeps the timestamp of every request in the
+    window, so each check reads and rewrites a list that grows with the
+    rate. This throttle keeps one counter per fixed window instead and
+    estimates the sliding window from the current and previous counters,
+    weighting the previous one by how much of it still overlaps.
+
+    Each request first increments the current counter and is decided on the
+    value the increment returns, so concurrent requests each see a distinct
+    count and no more than the rate get through. A rejected request
+    decrements the counter again, so it does not use up the rate. A check
+    costs one `get` and one `incr` (plus a `decr` when rejected).
+
+    Subclasses define `scope` and `get_cache_key`, as with DRF throttles.
+
+    Methods:
+        - allow_request: Tells whether the request is within the rate.
+        - wait: Returns the seconds until the next request is allowed.
+    """
+
+    cache = default_cache
+
+    def allow_request(self, request, view):
+        """
+        Tell whether the request is within the rate, counting it if so.
+
+        Args:
+            request (Request): The HTTP request object.
+            view (APIView): The view being throttled.
+
+        Returns:
+            bool: True if the request is allowed.
+        """
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        window, offset = divmod(now, self.duration)
+        current_key = f"{self.key}:{int(window)}"
+        previous = self.cache.get(f"{self.key}:{int(window) - 1}", 0)
+        current = self._increment(current_key)
+        overlap = 1 - offset / self.duration
+
+        # `current` includes this request; the others must leave room for it.
+        if current - 1 + previous * overlap >= self.num_requests:
+            try:
+                self.cache.decr(current_key)
+            except ValueError:
+                pass
+
+            self._wait = self._wait_time(current - 1, previous, offset)
+            return False
+
+        self._wait = None
+        return True
+
+    def wait(self):
+        """
+        Return the seconds until the next request is allowed.
+
+        Returns:
+            float | None: The seconds to wait, or None if the request was allowed.
+        """
+        return self._wait
+
+    def _wait_time(self, current: int, previous: int, offset: float) -> float:
+        if current >= self.num_requests or not previous:
+            return self.duration - offset
+
+        # The estimate drops below the limit once enough of the previous
+        # window has slid out.
+        allowed = (self.num_requests - current) / previous
+        return max((1 - allowed) * self.duration - offset, 0.0)
+
+    def _increment(self, key: str) -> int:
+        if self.cache.add(key, 1, 2 * self.duration):
+            return 1
+
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # The counter expired between `add` and `incr`.
+            self.cache.set(key, 1, 2 * self.duration)
+            return 1
@@ -0,0 +1,42 @@
+import time
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class QueryTimer:
+    """
+    Context manager that measures the time spent running database queries.
+
+    It installs a `connection.execute_wrapper` for the duration of the
+    block and accumulates the number of queries and their wall time.
+
+    Attributes:
+        count (int): The number of queries run.
+        duration (float): The seconds spent running them.
+    """
+
+    def __init__(self, using: str = DEFAULT_DB_ALIAS):
+        self.using = using
+        self.count = 0
+        self.duration = 0.0
+        self._wrapper = None
+
+    def __enter__(self):
+        """Start measuring the queries."""
+        self._wrapper = connections[self.using].execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop measuring the queries."""
+        return self._wrapper.__exit__(*exc_info)
+
+    def __call__(self, execute, sql, params, many, context):
+        """Run and time a query."""
+        started = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
@@ -0,0 +1,212 @@
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+
+import redis
+from django.conf import settings
+
+
+class VisitBuffer(ABC):
+    """
+    Base class for product visit buffers.
+
+    A visit buffer collects product visit events on the web tier so they can
+    be drained in chunks by a periodic task instead of being written one by
+    one. Events are plain JSON-serializable dictionaries.
+
+    Methods:
+        - append: Adds an event to the tail of the buffer.
+        - drain: Removes and returns up to `max_items` events from the head.
+        - requeue: Puts events back at the head of the buffer.
+        - dead_letter: Sets aside events that cannot be stored.
+    """
+
+    @abstractmethod
+    def append(self, event: dict) -> int:
+        """
+        Add an event to the tail of the buffer.
+
+        Args:
+            event (dict): The visit event.
+
+        Returns:
+            int: The number of events in the buffer after the append.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def drain(self, max_items: int) -> list[dict]:
+        """
+        Remove and return up to `max_items` events from the head of the buffer.
+
+        Args:
+            max_items (int): The maximum number of events to return.
+
+        Returns:
+            list[dict]: The drained events, oldest first.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def requeue(self, events: list[dict]) -> None:
+        """
+        Put previously drained events back at the head of the buffer.
+
+        Args:
+            events (list[dict]): The events to restore, oldest first.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def dead_letter(self, events: list[dict]) -> None:
+        """
+        Set aside events that cannot be stored, so they are not retried.
+
+        Only the latest `VISIT_BUFFER_DEAD_LETTER_MAX_SIZE` events are kept
+        for inspection.
+
+        Args:
+            events (list[dict]): The events to set aside.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of buffered events."""
+        raise NotImplementedError
+
+
+class LocalVisitBuffer(VisitBuffer):
+    """
+    In-process visit buffer backed by a thread-safe deque.
+
+    Only suitable when the process that records visits is also the one that
+    flushes them (local development and tests).
+    """
+
+    def __init__(self, dead_letter_max_size: int = 10000):
+        self._events = deque()
+        self.dead_letters = deque(maxlen=dead_letter_max_size)
+        self._lock = threading.Lock()
+
+    def append(self, event: dict) -> int:
+        with self._lock:
+            self._events.append(event)
+            return len(self._events)
+
+    def drain(self, max_items: int) -> list[dict]:
+        with self._lock:
+            count = min(max_items, len(self._events))
+            return [self._events.popleft() for _ in range(count)]
+
+    def requeue(self, events: list[dict]) -> None:
+        with self._lock:
+            self._events.extendleft(reversed(events))
+
+    def dead_letter(self, events: list[dict]) -> None:
+        with self._lock:
+            self.dead_letters.extend(events)
+
+    def __len__(self) -> int:
+        """Return the number of buffered events."""
+        return len(self._events)
+
+
+class RedisVisitBuffer(VisitBuffer):
+    """
+    Visit buffer backed by a Redis list shared by all web and worker processes.
+
+    Events are appended with `RPUSH` and drained atomically with a
+    `LRANGE`/`LTRIM` transaction, so concurrent flushers never receive the
+    same event twice. Dead-lettered events go to a capped list at
+    `<key>:dead`.
+    """
+
+    def __init__(self, url: str, key: str, dead_letter_max_size: int = 10000):
+        self.client = redis.Redis.from_url(url)
+        self.key = key
+        self.dead_letter_key = f"{key}:dead"
+        self.dead_letter_max_size = dead_letter_max_size
+
+    def append(self, event: dict) -> int:
+        return self.client.rpush(self.key, json.dumps(event))
+
+    def drain(self, max_items: int) -> list[dict]:
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.lrange(self.key, 0, max_items - 1)
+        pipeline.ltrim(self.key, max_items, -1)
+        items, _ = pipeline.execute()
+        return [json.loads(item) for item in items]
+
+    def requeue(self, events: list[dict]) -> None:
+        if events:
+            self.client.lpush(self.key, *[json.dumps(e) for e in reversed(events)])
+
+    def dead_letter(self, events: list[dict]) -> None:
+        if not events:
+            return
+
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.rpush(self.dead_letter_key, *[json.dumps(e) for e in events])
+        pipeline.ltrim(self.dead_letter_key, -self.dead_letter_max_size, -1)
+        pipeline.execute()
+
+    def __len__(self) -> int:
+        """Return the number of buffered events."""
+        return self.client.llen(self.key)
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_visit_buffer() -> VisitBuffer:
+    """
+    Return the per-process visit buffer configured in the settings.
+
+    The backend is selected with `VISIT_BUFFER_BACKEND` ("redis" or "local").
+
+    Raises:
+        ValueError: If the configured backend is unknown.
+
+    Returns:
+        VisitBuffer: The shared buffer instance.
+    """
+    global _buffer
+
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                backend = settings.VISIT_BUFFER_BACKEND
+                if backend == "redis":
+                    _buffer = RedisVisitBuffer(
+                        settings.VISIT_BUFFER_URL,
+                        settings.VISIT_BUFFER_KEY,
+                        settings.VISIT_BUFFER_DEAD_LETTER_MAX_SIZE,
+                    )
+                elif backend == "local":
+                    _buffer = LocalVisitBuffer(
+                        settings.VISIT_BUFFER_DEAD_LETTER_MAX_SIZE
+                    )
+                else:
+                    raise ValueError(f"Unknown visit buffer backend: {backend}")
+
+    return _buffer
+
+
+def reset_visit_buffer() -> None:
+    """
+    Drop the cached buffer so the next call rebuilds it from the settings.
+
+    Returns:
+        None
+    """
+    global _buffer
+    _buffer = None
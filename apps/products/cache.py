@@ -0,0 +1,123 @@
+import hashlib
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.commons.cache import get_or_set_locked
+
+
+class ProductCache:
+    """
+    Cache for catalogue representations backed by Django's cache framework.
+
+    Every key embeds a catalogue generation number. Any write to a product
+    or brand bumps the generation, which invalidates every cached detail and
+    list representation at once without having to track individual keys.
+    Besides products, it holds the brand responses with product statistics.
+
+    Methods:
+    - get_detail: Returns the cached detail entry for a SKU.
+    - evict_detail: Drops the cached detail entry of a SKU.
+    - get_list: Returns the cached list response for a request.
+    - generation: Returns the current catalogue generation.
+    - invalidate: Bumps the catalogue generation.
+    """
+
+    GENERATION_KEY = "products:generation"
+    # Bumped whenever the format of the cached entries changes.
+    FORMAT_VERSION = 2
+
+    @classmethod
+    def get_detail(cls, sku: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached detail entry for a SKU, building it on a miss.
+
+        Args:
+            sku (str): The product SKU.
+            factory (Callable[[], Any]): Builds the entry on a miss.
+
+        Returns:
+            Any: The cached or freshly built entry.
+        """
+        return cls._get_or_set(cls._detail_key(sku), factory)
+
+    @classmethod
+    def evict_detail(cls, sku: str) -> None:
+        """
+        Drop the cached detail entry of a SKU, leaving every other entry.
+
+        Args:
+            sku (str): The product SKU.
+
+        Returns:
+            None
+        """
+        cache.delete(cls._detail_key(sku))
+
+    @classmethod
+    def get_list(cls, request, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached list response for a request, building it on a miss.
+
+        The key includes the host and the full path with its query string,
+        so each page, filter and pagination mode is cached separately.
+
+        Args:
+            request (Request): The HTTP request object.
+            factory (Callable[[], Any]): Builds the response data on a miss.
+
+        Returns:
+            Any: The cached or freshly built response data.
+        """
+        path = f"{request.get_host()}{request.get_full_path()}"
+        path_hash = hashlib.md5(path.encode()).hexdigest()
+        key = f"products:v{cls.FORMAT_VERSION}:{cls.generation()}:list:{path_hash}"
+        return cls._get_or_set(key, factory)
+
+    @classmethod
+    def generation(cls) -> int:
+        """
+        Return the current catalogue generation.
+
+        A missing generation is initialized from the clock, so it never goes
+        back to a value that older entries may still be stored under.
+
+        Returns:
+            int: The catalogue generation.
+        """
+        generation = cache.get(cls.GENERATION_KEY)
+
+        if generation is None:
+            cache.add(cls.GENERATION_KEY, time.time_ns(), None)
+            generation = cache.get(cls.GENERATION_KEY)
+
+        return generation
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Invalidate every cached product representation.
+
+        Returns:
+            None
+        """
+        try:
+            cache.incr(cls.GENERATION_KEY)
+        except ValueError:
+            cache.add(cls.GENERATION_KEY, time.time_ns(), None)
+
+    @classmethod
+    def _detail_key(cls, sku: str) -> str:
+        sku_hash = hashlib.md5(sku.encode()).hexdigest()
+        return f"products:v{cls.FORMAT_VERSION}:{cls.generation()}:detail:{sku_hash}"
+
+    @classmethod
+    def _get_or_set(cls, key: str, factory: Callable[[], Any]) -> Any:
+        return get_or_set_locked(
+            key,
+            factory,
+            timeout=settings.PRODUCT_CACHE_TIMEOUT,
+            lock_timeout=settings.PRODUCT_CACHE_LOCK_TIMEOUT,
+        )
@@ -0,0 +1,240 @@
+import base64
+import binascii
+import datetime
+import heapq
+from itertools import islice
+from operator import attrgetter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.db.transaction import TransactionManagementError
+from django.utils import timezone
+
+from apps.products.models import (
+    Brand,
+    CatalogueSequence,
+    CatalogueTombstone,
+    Product,
+)
+
+
+class CatalogueChangeFeed:
+    """
+    Incremental feed of catalogue changes ordered by a change sequence.
+
+    Every product and brand write stamps the row with the next number of a
+    single catalogue sequence (`change_seq`, indexed), and every deletion
+    leaves a `CatalogueTombstone` with its own number. A client remembers the
+    cursor of its last page and only reads the rows stamped after it, so
+    each poll costs O(changes) instead of O(catalogue).
+
+    Numbers are allocated inside the writing transaction, and the sequence
+    row stays locked until that transaction commits, so changes become
+    visible in sequence order and a cursor never skips a change committed
+    later with a lower number. Allocating outside a transaction is refused;
+    products and brands save atomically (`CatalogueChangeMixin`) and bulk
+    writes allocate right before committing, so the lock is held briefly.
+
+    Methods:
+    - allocate: Reserves the next sequence numbers.
+    - stamp: Assigns the next sequence number to a product or brand.
+    - record_deletion: Leaves a tombstone for a deleted product or brand.
+    - read: Returns the changes after a sequence number.
+    - is_expired: Checks whether deletions after a sequence number were purged.
+    - purge_tombstones: Deletes the tombstones past the retention period.
+    - encode_cursor: Builds an opaque cursor for a sequence number.
+    - decode_cursor: Returns the sequence number of a cursor.
+    """
+
+    SEQUENCE_ID = 1
+
+    @classmethod
+    def allocate(cls, count: int = 1) -> int:
+        """
+        Reserve the next sequence numbers for the current transaction.
+
+        Args:
+            count (int, optional): The number of sequence numbers to reserve. Defaults to 1.
+
+        Raises:
+            TransactionManagementError: If called outside a transaction.
+
+        Returns:
+            int: The first reserved number; the rest follow it consecutively.
+        """
+        if transaction.get_autocommit():
+            raise TransactionManagementError(
+                "Catalogue changes must be stamped inside the transaction "
+                "that writes them."
+            )
+
+        sequence, _ = CatalogueSequence.objects.select_for_update().get_or_create(
+            pk=cls.SEQUENCE_ID
+        )
+        sequence.value += count
+        sequence.save(update_fields=["value"])
+
+        return sequence.value - count + 1
+
+    @classmethod
+    def stamp(cls, instance: Product | Brand) -> None:
+        """
+        Assign the next sequence number to a product or brand about to be saved.
+
+        Args:
+            instance (Product | Brand): The instance being saved.
+
+        Returns:
+            None
+        """
+        instance.change_seq = cls.allocate()
+
+    @classmethod
+    def record_deletion(cls, instance: Product | Brand) -> None:
+        """
+        Leave a tombstone for a deleted product or brand.
+
+        Args:
+            instance (Product | Brand): The deleted instance.
+
+        Returns:
+            None
+        """
+        kind, key = cls._identify(instance)
+        CatalogueTombstone.objects.create(kind=kind, key=key, change_seq=cls.allocate())
+
+    @classmethod
+    def read(cls, since: int, limit: int) -> dict:
+        """
+        Return the changes stamped after a sequence number.
+
+        At most `limit + 1` rows are read from each source, through the
+        `change_seq` indexes, and merged in sequence order.
+
+        Args:
+            since (int): The sequence number of the last change already seen.
+            limit (int): The maximum number of changes to return.
+
+        Returns:
+            dict: The `results` (with their `kind`, `key`, `deleted` flag and current `instance`), the `cursor` of the last change and whether there are more changes (`has_more`).
+        """
+        sources = [
+            Product.objects.defer("search_vector").filter(change_seq__gt=since),
+            Brand.objects.filter(change_seq__gt=since),
+            CatalogueTombstone.objects.filter(change_seq__gt=since),
+        ]
+        rows = heapq.merge(
+            *[list(rows.order_by("change_seq")[: limit + 1]) for rows in sources],
+            key=attrgetter("change_seq"),
+        )
+        rows = list(islice(rows, limit + 1))
+        page = rows[:limit]
+
+        return {
+            "results": [cls._change(row) for row in page],
+            "cursor": cls.encode_cursor(page[-1].change_seq if page else since),
+            "has_more": len(rows) > limit,
+        }
+
+    @classmethod
+    def is_expired(cls, since: int) -> bool:
+        """
+        Check whether tombstones stamped after a sequence number were purged.
+
+        A client holding such a cursor may have missed deletions and has to
+        sync again from the start.
+
+        Args:
+            since (int): The sequence number of the last change already seen.
+
+        Returns:
+            bool: True if the cursor is too old to be resumed.
+        """
+        return CatalogueSequence.objects.filter(
+            pk=cls.SEQUENCE_ID, purged_seq__gt=since
+        ).exists()
+
+    @classmethod
+    def purge_tombstones(cls) -> int:
+        """
+        Delete the tombstones older than `CATALOGUE_TOMBSTONE_RETENTION_DAYS`.
+
+        The highest purged sequence number is recorded, so cursors older than
+        it are rejected instead of silently missing deletions.
+
+        Returns:
+            int: The number of tombstones deleted.
+        """
+        cutoff = timezone.now() - datetime.timedelta(
+            days=settings.CATALOGUE_TOMBSTONE_RETENTION_DAYS
+        )
+
+        with transaction.atomic():
+            last = CatalogueTombstone.objects.filter(deleted_at__lt=cutoff).aggregate(
+                last=Max("change_seq")
+            )["last"]
+
+            if last is None:
+                return 0
+
+            CatalogueSequence.objects.filter(
+                pk=cls.SEQUENCE_ID, purged_seq__lt=last
+            ).update(purged_seq=last)
+            deleted, _ = CatalogueTombstone.objects.filter(
+                change_seq__lte=last
+            ).delete()
+
+        return deleted
+
+    @staticmethod
+    def encode_cursor(seq: int) -> str:
+        """
+        Build an opaque cursor for a sequence number.
+
+        Args:
+            seq (int): The sequence number of the last change seen.
+
+        Returns:
+            str: The URL-safe cursor.
+        """
+        return base64.urlsafe_b64encode(f"seq:{seq}".encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> int:
+        """
+        Return the sequence number of a cursor.
+
+        Args:
+            cursor (str): A cursor returned by the change feed.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            int: The sequence number of the last change seen.
+        """
+        try:
+            prefix, seq = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValueError("Invalid cursor")
+
+        if prefix != "seq" or not seq.isdigit():
+            raise ValueError("Invalid cursor")
+
+        return int(seq)
+
+    @classmethod
+    def _change(cls, row: Product | Brand | CatalogueTombstone) -> dict:
+        if isinstance(row, CatalogueTombstone):
+            return {"kind": row.kind, "key": row.key, "deleted": True, "instance": None}
+
+        kind, key = cls._identify(row)
+        return {"kind": kind, "key": key, "deleted": False, "instance": row}
+
+    @staticmethod
+    def _identify(instance: Product | Brand) -> tuple[str, str]:
+        if isinstance(instance, Product):
+            return CatalogueTombstone.Kind.PRODUCT, instance.sku
+
+        return CatalogueTombstone.Kind.BRAND, instance.name
@@ -0,0 +1,86 @@
+from rest_framework.filters import BaseFilterBackend
+
+from apps.products.serializers.product import ProductFilterQuerySerializer
+
+
+class ProductFilterBackend(BaseFilterBackend):
+    """
+    Filter backend for the product price range and brand.
+
+    Query parameters are validated by `ProductFilterQuerySerializer`, so
+    malformed values get a 400 response instead of being ignored. Brand and
+    price filters are served by the `(brand, price)` index.
+    """
+
+    LOOKUPS = {
+        "min_price": "price__gte",
+        "max_price": "price__lte",
+        "brand": "brand_id",
+        "brand_name": "brand__name",
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        """
+        Filter the products by the requested price range and brand.
+
+        Args:
+            request (Request): The HTTP request object.
+            queryset (QuerySet): The products to filter.
+            view (APIView): The view being filtered.
+
+        Raises:
+            ValidationError: If a filter value is invalid.
+
+        Returns:
+            QuerySet: The matching products.
+        """
+        query = ProductFilterQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        return queryset.filter(
+            **{
+                self.LOOKUPS[name]: value
+                for name, value in query.validated_data.items()
+            }
+        )
+
+    def get_schema_operation_parameters(self, view):
+        """
+        Document the filter query parameters.
+
+        Args:
+            view (APIView): The view being documented.
+
+        Returns:
+            list[dict]: The OpenAPI query parameters.
+        """
+        return [
+            {
+                "name": "min_price",
+                "required": False,
+                "in": "query",
+                "description": "Only products priced at or above this value.",
+                "schema": {"type": "number"},
+            },
+            {
+                "name": "max_price",
+                "required": False,
+                "in": "query",
+                "description": "Only products priced at or below this value.",
+                "schema": {"type": "number"},
+            },
+            {
+                "name": "brand",
+                "required": False,
+                "in": "query",
+                "description": "Only products of the brand with this ID.",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": "brand_name",
+                "required": False,
+                "in": "query",
+                "description": "Only products of the brand with this name.",
+                "schema": {"type": "string"},
+            },
+        ]
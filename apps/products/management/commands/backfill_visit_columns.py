@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.products.models import ProductRetrieve
+from apps.products.visits import VisitColumns
+
+
+class Command(BaseCommand):
+    """
+    Move the metadata of legacy visits into the typed visit columns.
+
+    Visits are processed in primary key order, one transaction per batch,
+    so the command can be interrupted and run again at any time: visits
+    already backfilled have no metadata left and are skipped.
+    """
+
+    help = "Backfill the typed ProductRetrieve columns from the legacy metadata."
+
+    fields = ["ip", "device_type", "user_agent", "location", "referer"]
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+
+        Args:
+            parser (ArgumentParser): The command argument parser.
+
+        Returns:
+            None
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Visits updated per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Backfill every legacy visit in batches.
+
+        Args:
+            *args: Positional arguments.
+            **options: The parsed command options.
+
+        Returns:
+            None
+        """
+        batch_size = options["batch_size"]
+        last_id = 0
+        total = 0
+
+        while True:
+            with transaction.atomic():
+                visits = list(
+                    ProductRetrieve.objects.filter(
+                        id__gt=last_id, metadata__isnull=False
+                    ).order_by("id")[:batch_size]
+                )
+
+                if not visits:
+                    break
+
+                columns = VisitColumns.from_metadata([v.metadata for v in visits])
+
+                for visit, values in zip(visits, columns):
+                    for field, value in values.items():
+                        setattr(visit, field, value)
+
+                ProductRetrieve.objects.bulk_update(visits, self.fields)
+                # `bulk_update` would store a JSON null; clear it to SQL NULL.
+                ProductRetrieve.objects.filter(
+                    id__in=[visit.id for visit in visits]
+                ).update(metadata=None)
+
+            last_id = visits[-1].id
+            total += len(visits)
+            self.stdout.write(f"{total} visits backfilled")
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {total} visits"))
@@ -0,0 +1,177 @@
+import statistics
+import time
+from unittest.mock import patch
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+from django.urls import resolve, reverse
+from rest_framework.test import APIRequestFactory
+
+from apps.products.cache import ProductCache
+from apps.products.models import Product
+from apps.products.services import ProductVisitTracker
+
+
+class Command(BaseCommand):
+    """
+    Compare the product retrieve latency with and without connection reuse.
+
+    The retrieve view is called in-process `--requests` times in two
+    modes: opening a new database connection for every request
+    (`CONN_MAX_AGE=0`, no pool) and with the configured persistent
+    connections or pool. Every request runs between the same connection
+    checks Django runs on `request_started` and `request_finished`, and the
+    product's cache entry is evicted before each one (outside the timing) so
+    the product is read from the database, unless `--cached` is given.
+
+    The retrieves are anonymous, so visit tracking is patched out for the
+    run and no visits are recorded. The benchmark still evicts the product's
+    cache entry and changes the connection settings of the process, so it
+    must not run against production.
+    """
+
+    help = "Benchmark the product retrieve with and without connection reuse."
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+
+        Args:
+            parser (ArgumentParser): The command argument parser.
+
+        Returns:
+            None
+        """
+        parser.add_argument(
+            "--sku", help="Product to retrieve. Defaults to the first product."
+        )
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Retrieves per mode."
+        )
+        parser.add_argument(
+            "--cached",
+            action="store_true",
+            help="Serve the product from the product cache.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the retrieves in both modes and report their latency.
+
+        Args:
+            *args: Positional arguments.
+            **options: The parsed command options.
+
+        Raises:
+            CommandError: If there is no product to retrieve.
+
+        Returns:
+            None
+        """
+        sku = options["sku"] or (
+            Product.objects.order_by("id").values_list("sku", flat=True).first()
+        )
+
+        if not sku or not Product.objects.filter(sku=sku).exists():
+            raise CommandError("There is no product to retrieve.")
+
+        settings_dict = connection.settings_dict
+        configured = {
+            "CONN_MAX_AGE": settings_dict["CONN_MAX_AGE"],
+            "OPTIONS": settings_dict["OPTIONS"],
+        }
+        path = reverse("product-detail", args=[sku])
+
+        try:
+            connection.close()
+            settings_dict.update(
+                CONN_MAX_AGE=0,
+                OPTIONS={k: v for k, v in configured["OPTIONS"].items() if k != "pool"},
+            )
+            self.report(
+                "New connection per request",
+                self.measure(sku, path, options["requests"], options["cached"]),
+            )
+        finally:
+            connection.close()
+            settings_dict.update(configured)
+
+        self.report(
+            self.describe(configured),
+            self.measure(sku, path, options["requests"], options["cached"]),
+        )
+
+    @staticmethod
+    def measure(sku: str, path: str, requests: int, cached: bool) -> list[float]:
+        """
+        Retrieve the product repeatedly and time each request.
+
+        A first, untimed request warms up the view and the connection.
+
+        Args:
+            sku (str): The product SKU.
+            path (str): The product detail path.
+            requests (int): The number of timed requests.
+            cached (bool): Whether to keep the product cache.
+
+        Returns:
+            list[float]: The latency of each request, in milliseconds.
+        """
+        factory = APIRequestFactory()
+        match = resolve(path)
+        latencies = []
+
+        with patch.object(ProductVisitTracker, "track"):
+            for _ in range(requests + 1):
+                if not cached:
+                    ProductCache.evict_detail(sku)
+
+                started = time.perf_counter()
+                close_old_connections()
+                response = match.func(factory.get(path), *match.args, **match.kwargs)
+                response.render()
+                close_old_connections()
+                latencies.append((time.perf_counter() - started) * 1000)
+
+                if response.status_code != 200:
+                    raise CommandError(f"The retrieve returned {response.status_code}.")
+
+        return latencies[1:]
+
+    @staticmethod
+    def describe(configured: dict) -> str:
+        """
+        Describe the configured connection handling.
+
+        Args:
+            configured (dict): The configured `CONN_MAX_AGE` and `OPTIONS`.
+
+        Returns:
+            str: The label of the configured mode.
+        """
+        if configured["OPTIONS"].get("pool"):
+            return "Connection pool"
+
+        if configured["CONN_MAX_AGE"] == 0:
+            return "Configured (CONN_MAX_AGE=0, no reuse)"
+
+        return f"Persistent connections (CONN_MAX_AGE={configured['CONN_MAX_AGE']})"
+
+    def report(self, label: str, latencies: list[float]) -> None:
+        """
+        Print the latency percentiles of a mode.
+
+        Args:
+            label (str): The mode label.
+            latencies (list[float]): The request latencies, in milliseconds.
+
+        Returns:
+            None
+        """
+        latencies = sorted(latencies)
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        self.stdout.write(
+            f"{label}: median {statistics.median(latencies):.2f} ms, "
+            f"p95 {p95:.2f} ms, max {latencies[-1]:.2f} ms "
+            f"({len(latencies)} requests)"
+        )
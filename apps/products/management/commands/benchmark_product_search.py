@@ -0,0 +1,150 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.products.cache import ProductCache
+from apps.products.changes import CatalogueChangeFeed
+from apps.products.models import Brand, Product
+from apps.products.search import ProductSearch
+
+NAMES = ["Casco", "Guantes", "Chaqueta", "Botas", "Rodilleras", "Gafas"]
+VARIANTS = ["integral", "de cuero", "impermeable", "urbano", "off road"]
+
+
+class Command(BaseCommand):
+    """
+    Measure the latency of the product search on PostgreSQL.
+
+    The catalogue is first grown to `--products` rows with generated
+    `BENCH-` products inserted by `generate_series` (the search trigger
+    fills their vectors), then every term is searched `--repeat` times,
+    reading the first page as the API does. Run it against a disposable
+    database: the generated products are not removed.
+    """
+
+    help = "Benchmark the product search against a catalogue of the given size."
+
+    default_terms = ["casco", "guantes de cuero", "BENCH-00042", "BENCH-0004", "BENC"]
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+
+        Args:
+            parser (ArgumentParser): The command argument parser.
+
+        Returns:
+            None
+        """
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=1_000_000,
+            help="Catalogue size to benchmark against.",
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="Searches per term.")
+        parser.add_argument(
+            "--limit", type=int, default=10, help="Products read per search."
+        )
+        parser.add_argument(
+            "--term",
+            action="append",
+            dest="terms",
+            help="Search term; may be repeated. Defaults to a mixed set.",
+        )
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Print the query plan of every term.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Seed the catalogue and report the search latency per term.
+
+        Args:
+            *args: Positional arguments.
+            **options: The parsed command options.
+
+        Raises:
+            CommandError: If the database is not PostgreSQL.
+
+        Returns:
+            None
+        """
+        if not ProductSearch.is_supported():
+            raise CommandError("The product search benchmark requires PostgreSQL.")
+
+        self.seed(options["products"])
+
+        for term in options["terms"] or self.default_terms:
+            products = ProductSearch.search(Product.objects.all(), term).values_list(
+                "id", flat=True
+            )[: options["limit"]]
+            timings = []
+
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                list(products)
+                timings.append((time.perf_counter() - start) * 1000)
+
+            timings.sort()
+            p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+            self.stdout.write(
+                f"{term!r}: median {statistics.median(timings):.2f} ms, "
+                f"p95 {p95:.2f} ms, max {timings[-1]:.2f} ms"
+            )
+
+            if options["explain"]:
+                self.stdout.write(products.explain(analyze=True))
+
+    def seed(self, size: int) -> None:
+        """
+        Insert generated products until the catalogue has `size` rows.
+
+        Args:
+            size (int): The target number of products.
+
+        Returns:
+            None
+        """
+        missing = size - Product.objects.count()
+
+        if missing <= 0:
+            return
+
+        self.stdout.write(f"Inserting {missing} products...")
+        brand, _ = Brand.objects.get_or_create(name="Bench")
+        start = Product.objects.filter(sku__startswith="BENCH-").count() + 1
+
+        with transaction.atomic():
+            first_seq = CatalogueChangeFeed.allocate(missing)
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {Product._meta.db_table} "
+                    "(sku, name, price, brand_id, updated_at, change_seq) "
+                    "SELECT 'BENCH-' || lpad(i::text, 7, '0'), "
+                    "(%s::text[])[1 + i %% %s] || ' ' || (%s::text[])[1 + i %% %s], "
+                    "1 + (i %% 100000) / 100.0, %s, now(), %s + i - %s "
+                    "FROM generate_series(%s, %s) AS i "
+                    "ON CONFLICT (sku) DO NOTHING",
+                    [
+                        NAMES,
+                        len(NAMES),
+                        VARIANTS,
+                        len(VARIANTS),
+                        brand.id,
+                        first_seq,
+                        start,
+                        start,
+                        start + missing - 1,
+                    ],
+                )
+
+        ProductCache.invalidate()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Product._meta.db_table}")
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-18 03:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="productretrieve",
+            name="visited_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
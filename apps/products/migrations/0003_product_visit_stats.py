@@ -0,0 +1,79 @@
+# Generated by Django 5.2.1 on 2026-10-18 03:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0002_alter_productretrieve_visited_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RollupCheckpoint",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=100, primary_key=True, serialize=False),
+                ),
+                ("last_id", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ProductVisitStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("hour", "Hour"), ("day", "Day")], max_length=4
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField()),
+                ("country", models.CharField(blank=True, max_length=100)),
+                ("device_type", models.CharField(blank=True, max_length=20)),
+                ("browser", models.CharField(blank=True, max_length=100)),
+                ("visits", models.PositiveIntegerField(default=0)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="visit_stats",
+                        to="products.product",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["period", "bucket_start"],
+                        name="products_pr_period_310c63_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "product",
+                            "period",
+                            "bucket_start",
+                            "country",
+                            "device_type",
+                            "browser",
+                        ),
+                        name="unique_product_visit_stat",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 5.2.1 on 2026-10-18 03:12
+
+import datetime
+
+from django.db import migrations, models
+
+TABLE = "products_productretrieve"
+LEGACY_TABLE = f"{TABLE}_legacy"
+MONTHS_AHEAD = 3
+
+
+def month_start(value, offset=0):
+    months = value.year * 12 + value.month - 1 + offset
+    return datetime.date(months // 12, months % 12 + 1, 1)
+
+
+def partition_product_retrieves(apps, schema_editor):
+    """
+    Move the visits into a table range-partitioned by month on `visited_at`.
+
+    The existing table is renamed, a partitioned table with the same columns
+    is created with one partition per month holding data (plus a few months
+    ahead and a default partition), the rows are copied over and the old
+    table is dropped. The primary key becomes `(id, visited_at)`, since
+    PostgreSQL requires the partition key in every unique constraint.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %s",
+            [TABLE],
+        )
+
+        if cursor.fetchone():
+            return
+
+    execute = schema_editor.execute
+    execute(f"ALTER TABLE {TABLE} RENAME TO {LEGACY_TABLE}")
+    execute(
+        f"ALTER TABLE {LEGACY_TABLE} "
+        f"RENAME CONSTRAINT {TABLE}_pkey TO {LEGACY_TABLE}_pkey"
+    )
+    execute(
+        f"CREATE TABLE {TABLE} ("
+        "id bigint NOT NULL, "
+        "visited_at timestamp with time zone NOT NULL, "
+        "metadata jsonb NOT NULL, "
+        "product_id bigint NOT NULL, "
+        f"CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, visited_at), "
+        f"CONSTRAINT {TABLE}_product_id_fk FOREIGN KEY (product_id) "
+        "REFERENCES products_product (id) DEFERRABLE INITIALLY DEFERRED"
+        ") PARTITION BY RANGE (visited_at)"
+    )
+    execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(visited_at) FROM {LEGACY_TABLE}")
+        oldest = cursor.fetchone()[0]
+
+    today = datetime.date.today()
+    start = month_start(oldest.date() if oldest else today)
+    last = month_start(today, MONTHS_AHEAD)
+
+    while start <= last:
+        end = month_start(start, 1)
+        execute(
+            f"CREATE TABLE {TABLE}_p{start:%Y%m} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        start = end
+
+    execute(
+        f"INSERT INTO {TABLE} (id, visited_at, metadata, product_id) "
+        f"SELECT id, visited_at, metadata, product_id FROM {LEGACY_TABLE}"
+    )
+    execute(f"DROP TABLE {LEGACY_TABLE}")
+    execute(f"CREATE SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+    execute(
+        f"SELECT setval('{TABLE}_id_seq', COALESCE(MAX(id), 0) + 1, false) "
+        f"FROM {TABLE}"
+    )
+    execute(
+        f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')"
+    )
+    execute(f"CREATE INDEX {TABLE}_product_id_idx ON {TABLE} (product_id)")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0003_product_visit_stats"),
+    ]
+
+    operations = [
+        # The partitioned table keeps working with the previous model state,
+        # so the migration is reversible without moving the rows back.
+        migrations.RunPython(partition_product_retrieves, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="productretrieve",
+            index=models.Index(
+                fields=["visited_at"], name="products_pr_visited_09940b_idx"
+            ),
+        ),
+    ]
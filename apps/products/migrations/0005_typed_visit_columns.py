@@ -0,0 +1,127 @@
+# Generated by Django 5.2.1 on 2026-10-18 03:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0004_productretrieve_partitioning"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VisitUserAgent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("user_agent_hash", models.CharField(max_length=32, unique=True)),
+                ("user_agent", models.TextField()),
+                ("device", models.CharField(blank=True, max_length=100)),
+                ("os", models.CharField(blank=True, max_length=100)),
+                ("browser", models.CharField(blank=True, max_length=100)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="productretrieve",
+            name="device_type",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (0, "unknown"),
+                    (1, "mobile"),
+                    (2, "tablet"),
+                    (3, "pc"),
+                    (4, "bot"),
+                ],
+                default=0,
+            ),
+        ),
+        migrations.AddField(
+            model_name="productretrieve",
+            name="ip",
+            field=models.GenericIPAddressField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="productretrieve",
+            name="referer",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AlterField(
+            model_name="productretrieve",
+            name="metadata",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="VisitLocation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("country", models.CharField(max_length=100)),
+                ("city", models.CharField(max_length=255)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("country", "city"), name="unique_visit_location"
+                    )
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="productretrieve",
+            name="location",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="retrieves",
+                to="products.visitlocation",
+            ),
+        ),
+        migrations.AddField(
+            model_name="productretrieve",
+            name="user_agent",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="retrieves",
+                to="products.visituseragent",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productretrieve",
+            index=models.Index(
+                fields=["product", "visited_at"], name="products_pr_product_fc92f1_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productretrieve",
+            index=models.Index(
+                fields=["location", "visited_at"], name="products_pr_locatio_4b2a1b_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productretrieve",
+            index=models.Index(
+                fields=["device_type", "visited_at"],
+                name="products_pr_device__f30000_idx",
+            ),
+        ),
+    ]
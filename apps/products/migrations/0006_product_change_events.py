@@ -0,0 +1,45 @@
+# Generated by Django 5.2.1 on 2026-10-18 03:16
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0005_typed_visit_columns"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductChangeEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sku", models.CharField(max_length=50)),
+                ("name", models.CharField(max_length=255)),
+                ("brand_name", models.CharField(max_length=100)),
+                ("price", models.DecimalField(decimal_places=2, max_digits=10)),
+                ("changed_by", models.EmailField(blank=True, max_length=254)),
+                ("changed_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="change_events",
+                        to="products.product",
+                    ),
+                ),
+            ],
+        ),
+    ]
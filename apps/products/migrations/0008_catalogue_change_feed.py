@@ -0,0 +1,85 @@
+# Generated by Django 5.2.1 on 2026-10-18 03:25
+
+from django.db import migrations, models
+from django.db.models import F, Max
+
+
+def number_existing_rows(apps, schema_editor):
+    """
+    Give every existing product and brand its own position in the change feed.
+
+    Products are numbered by ID, brands after them, and the sequence counter
+    starts past the highest number, so a client syncing from scratch
+    receives every row.
+    """
+    Product = apps.get_model("products", "Product")
+    Brand = apps.get_model("products", "Brand")
+    CatalogueSequence = apps.get_model("products", "CatalogueSequence")
+
+    products = Product.objects.aggregate(last=Max("id"))["last"] or 0
+    brands = Brand.objects.aggregate(last=Max("id"))["last"] or 0
+
+    Product.objects.update(change_seq=F("id"))
+    Brand.objects.update(change_seq=F("id") + products)
+    CatalogueSequence.objects.create(value=products + brands)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0007_product_brand_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogueSequence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("value", models.BigIntegerField(default=0)),
+                ("purged_seq", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="CatalogueTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("product", "Product"), ("brand", "Brand")],
+                        max_length=10,
+                    ),
+                ),
+                ("key", models.CharField(max_length=100)),
+                ("change_seq", models.BigIntegerField(db_index=True)),
+                ("deleted_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="brand",
+            name="change_seq",
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="change_seq",
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(number_existing_rows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.2.1 on 2026-10-18 03:28
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+PRODUCT_TABLE = "products_product"
+BRAND_TABLE = "products_brand"
+SEARCH_CONFIG = "spanish"
+
+
+def create_search_objects(apps, schema_editor):
+    """
+    Keep `search_vector` up to date in the database and index it.
+
+    A trigger computes the vector from the SKU (weight A), the name (B) and
+    the brand name (C) on every insert and update, including bulk upserts,
+    and a brand rename resets the vectors of its products so they are
+    recomputed. The vector gets a GIN index and the upper-cased SKU a
+    trigram index for prefix and typo-tolerant lookups.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    execute = schema_editor.execute
+    execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    execute(
+        f"CREATE OR REPLACE FUNCTION {PRODUCT_TABLE}_search_vector() "
+        "RETURNS trigger AS $$ BEGIN "
+        "NEW.search_vector := "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.sku, '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.name, '')), 'B') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce("
+        f"(SELECT name FROM {BRAND_TABLE} WHERE id = NEW.brand_id), '')), 'C'); "
+        "RETURN NEW; END $$ LANGUAGE plpgsql"
+    )
+    execute(
+        f"CREATE TRIGGER {PRODUCT_TABLE}_search_vector "
+        "BEFORE INSERT OR UPDATE OF sku, name, brand_id, search_vector "
+        f"ON {PRODUCT_TABLE} FOR EACH ROW "
+        f"EXECUTE FUNCTION {PRODUCT_TABLE}_search_vector()"
+    )
+    execute(
+        f"CREATE OR REPLACE FUNCTION {BRAND_TABLE}_search_vector() "
+        "RETURNS trigger AS $$ BEGIN "
+        "IF NEW.name IS DISTINCT FROM OLD.name THEN "
+        f"UPDATE {PRODUCT_TABLE} SET search_vector = NULL "
+        "WHERE brand_id = NEW.id; "
+        "END IF; RETURN NULL; END $$ LANGUAGE plpgsql"
+    )
+    execute(
+        f"CREATE TRIGGER {BRAND_TABLE}_search_vector "
+        f"AFTER UPDATE OF name ON {BRAND_TABLE} FOR EACH ROW "
+        f"EXECUTE FUNCTION {BRAND_TABLE}_search_vector()"
+    )
+    execute(f"UPDATE {PRODUCT_TABLE} SET search_vector = NULL")
+    execute(
+        f"CREATE INDEX {PRODUCT_TABLE}_search_vector_idx "
+        f"ON {PRODUCT_TABLE} USING gin (search_vector)"
+    )
+    execute(
+        f"CREATE INDEX {PRODUCT_TABLE}_sku_trgm_idx "
+        f"ON {PRODUCT_TABLE} USING gin (UPPER(sku) gin_trgm_ops)"
+    )
+
+
+def drop_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    execute = schema_editor.execute
+    execute(f"DROP INDEX IF EXISTS {PRODUCT_TABLE}_sku_trgm_idx")
+    execute(f"DROP INDEX IF EXISTS {PRODUCT_TABLE}_search_vector_idx")
+    execute(f"DROP TRIGGER IF EXISTS {BRAND_TABLE}_search_vector ON {BRAND_TABLE}")
+    execute(f"DROP FUNCTION IF EXISTS {BRAND_TABLE}_search_vector()")
+    execute(f"DROP TRIGGER IF EXISTS {PRODUCT_TABLE}_search_vector ON {PRODUCT_TABLE}")
+    execute(f"DROP FUNCTION IF EXISTS {PRODUCT_TABLE}_search_vector()")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0008_catalogue_change_feed"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_objects, drop_search_objects),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.1 on 2026-10-18 03:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0009_product_search"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["brand", "price"], name="products_pr_brand_i_91b49e_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["price", "id"], name="products_pr_price_dbec84_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["name", "id"], name="products_pr_name_37bd5c_idx"
+            ),
+        ),
+        # Dropped once the (brand, price) index covering it exists.
+        migrations.AlterField(
+            model_name="product",
+            name="brand",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="products",
+                to="products.brand",
+            ),
+        ),
+    ]
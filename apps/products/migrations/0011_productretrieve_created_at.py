@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-18 03:48
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0010_product_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productretrieve",
+            name="created_at",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(), editable=False
+            ),
+        ),
+    ]
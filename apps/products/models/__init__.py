@@ -1,4 +1,19 @@
 from .brand import Brand
+from .changes import CatalogueSequence, CatalogueTombstone
+from .notification import ProductChangeEvent
 from .product import Product, ProductRetrieve
+from .statistics import ProductVisitStat, RollupCheckpoint
+from .visit import VisitLocation, VisitUserAgent
 
-__all__ = ["Product", "ProductRetrieve", "Brand"]
+__all__ = [
+    "Product",
+    "ProductRetrieve",
+    "Brand",
+    "CatalogueSequence",
+    "CatalogueTombstone",
+    "ProductChangeEvent",
+    "ProductVisitStat",
+    "RollupCheckpoint",
+    "VisitLocation",
+    "VisitUserAgent",
+]
@@ -1,8 +1,13 @@
 from django.db import models
 
+from .changes import CatalogueChangeMixin
 
-class Brand(models.Model):
+
+class Brand(CatalogueChangeMixin, models.Model):
     name = models.CharField(max_length=100, unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Position in the catalogue change feed, see `apps.products.changes`.
+    change_seq = models.BigIntegerField(default=0, db_index=True)
 
     def __str__(self):
         """
@@ -0,0 +1,80 @@
+from django.db import models, router, transaction
+
+
+class CatalogueChangeMixin:
+    """
+    Save a product or brand inside a transaction.
+
+    The `pre_save` signal stamps the row with the next catalogue change
+    sequence, which locks the sequence row. Saving atomically keeps that
+    stamp and the write in one transaction, even outside `atomic` blocks
+    (shell, management commands, tasks), so changes still become visible
+    in sequence order.
+    """
+
+    def save(self, *args, **kwargs):
+        """
+        Save the instance in a transaction.
+
+        Args:
+            *args: Positional arguments for `Model.save`.
+            **kwargs: Keyword arguments for `Model.save`.
+
+        Returns:
+            None
+        """
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
+
+class CatalogueSequence(models.Model):
+    """
+    Counter of the catalogue change sequence.
+
+    A single row holds the last `change_seq` handed out to a product, brand
+    or tombstone. It is locked while a number is allocated, so writers are
+    serialized and their changes become visible in sequence order.
+    `purged_seq` is the highest sequence of the tombstones already purged:
+    cursors older than it may have missed deletions.
+    """
+
+    value = models.BigIntegerField(default=0)
+    purged_seq = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        """
+        Return a string representation of the CatalogueSequence instance.
+
+        Returns:
+            str: The last allocated sequence number.
+        """
+        return f"Catalogue sequence ({self.value})"
+
+
+class CatalogueTombstone(models.Model):
+    """
+    Record of a deleted product or brand for the change feed.
+
+    Tombstones are kept for `CATALOGUE_TOMBSTONE_RETENTION_DAYS`, so sync
+    clients polling the change feed learn about deletions.
+    """
+
+    class Kind(models.TextChoices):
+        PRODUCT = "product", "Product"
+        BRAND = "brand", "Brand"
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    key = models.CharField(max_length=100)
+    change_seq = models.BigIntegerField(db_index=True)
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        """
+        Return a string representation of the CatalogueTombstone instance.
+
+        Returns:
+            str: The kind and key of the deleted object.
+        """
+        return f"{self.kind} {self.key} (deleted)"
@@ -0,0 +1,37 @@
+from django.db import models
+from django.utils import timezone
+
+from .product import Product
+
+
+class ProductChangeEvent(models.Model):
+    """
+    Product change waiting to be included in the next staff digest.
+
+    The product details are copied at change time, so the digest describes
+    the product as it was edited even if it is changed again or deleted
+    before the digest is sent.
+    """
+
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="change_events",
+    )
+    sku = models.CharField(max_length=50)
+    name = models.CharField(max_length=255)
+    brand_name = models.CharField(max_length=100)
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    changed_by = models.EmailField(blank=True)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        """
+        Return a string representation of the ProductChangeEvent instance.
+
+        Returns:
+            str: The SKU and the time of the change.
+        """
+        return f"{self.sku} ({self.changed_at:%Y-%m-%d %H:%M})"
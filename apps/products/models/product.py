@@ -1,13 +1,36 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Now
+from django.utils import timezone
 
 from .brand import Brand
+from .changes import CatalogueChangeMixin
+from .visit import VisitLocation, VisitUserAgent
 
 
-class Product(models.Model):
+class Product(CatalogueChangeMixin, models.Model):
     sku = models.CharField(max_length=50, unique=True)
     name = models.CharField(max_length=255)
     price = models.DecimalField(max_digits=10, decimal_places=2)
-    brand = models.ForeignKey(Brand, on_delete=models.PROTECT, related_name="products")
+    brand = models.ForeignKey(
+        Brand,
+        on_delete=models.PROTECT,
+        related_name="products",
+        # Covered by the (brand, price) index.
+        db_index=False,
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+    # Position in the catalogue change feed, see `apps.products.changes`.
+    change_seq = models.BigIntegerField(default=0, db_index=True)
+    # Maintained by a database trigger on PostgreSQL, see `apps.products.search`.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["brand", "price"]),
+            models.Index(fields=["price", "id"]),
+            models.Index(fields=["name", "id"]),
+        ]
 
     def __str__(self):
         """
@@ -23,8 +46,59 @@ class Product(models.Model):
 
 
 class ProductRetrieve(models.Model):
-    visited_at = models.DateTimeField(auto_now_add=True)
-    metadata = models.JSONField()
+    """
+    Raw product visit.
+
+    Hot dimensions are stored in typed columns; repeated strings such as the
+    User-Agent and the location live in lookup tables. `metadata` only holds
+    the free-form data of visits stored before those columns existed, until
+    `backfill_visit_columns` moves it over.
+
+    On PostgreSQL the table is range-partitioned by month on `visited_at`;
+    see `apps.products.partitions`.
+    """
+
+    class DeviceType(models.IntegerChoices):
+        UNKNOWN = 0, "unknown"
+        MOBILE = 1, "mobile"
+        TABLET = 2, "tablet"
+        PC = 3, "pc"
+        BOT = 4, "bot"
+
+    visited_at = models.DateTimeField(default=timezone.now)
     product = models.ForeignKey(
         Product, on_delete=models.CASCADE, related_name="retrieves"
     )
+    ip = models.GenericIPAddressField(null=True, blank=True)
+    device_type = models.PositiveSmallIntegerField(
+        choices=DeviceType.choices, default=DeviceType.UNKNOWN
+    )
+    user_agent = models.ForeignKey(
+        VisitUserAgent,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="retrieves",
+    )
+    location = models.ForeignKey(
+        VisitLocation,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="retrieves",
+        # Covered by the (location, visited_at) index.
+        db_index=False,
+    )
+    referer = models.TextField(blank=True, default="")
+    metadata = models.JSONField(null=True, blank=True)
+    # Set by the database on insert. `visited_at` is the request time, so the
+    # visit rollup waits on this column for in-flight inserts to commit.
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["visited_at"]),
+            models.Index(fields=["product", "visited_at"]),
+            models.Index(fields=["location", "visited_at"]),
+            models.Index(fields=["device_type", "visited_at"]),
+        ]
@@ -0,0 +1,65 @@
+from django.db import models
+
+from .product import Product
+
+
+class ProductVisitStat(models.Model):
+    """
+    Pre-aggregated product visit counter.
+
+    Each row counts the visits to a product in one hour or day bucket for a
+    combination of country, device type and browser. Rows are maintained
+    incrementally from `ProductRetrieve` by the visit rollup task.
+    """
+
+    class Period(models.TextChoices):
+        HOUR = "hour", "Hour"
+        DAY = "day", "Day"
+
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="visit_stats"
+    )
+    period = models.CharField(max_length=4, choices=Period.choices)
+    bucket_start = models.DateTimeField()
+    country = models.CharField(max_length=100, blank=True)
+    device_type = models.CharField(max_length=20, blank=True)
+    browser = models.CharField(max_length=100, blank=True)
+    visits = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "product",
+                    "period",
+                    "bucket_start",
+                    "country",
+                    "device_type",
+                    "browser",
+                ],
+                name="unique_product_visit_stat",
+            )
+        ]
+        indexes = [models.Index(fields=["period", "bucket_start"])]
+
+
+class RollupCheckpoint(models.Model):
+    """
+    High-water mark of an incremental rollup.
+
+    Stores the last source row ID that has been aggregated, so each run only
+    reads rows added since the previous one.
+    """
+
+    name = models.CharField(max_length=100, primary_key=True)
+    last_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """
+        Return a string representation of the RollupCheckpoint instance.
+
+        Returns:
+            str: The rollup name and its high-water mark.
+        """
+        return f"{self.name} ({self.last_id})"
@@ -0,0 +1,68 @@
+import hashlib
+
+from django.db import models
+
+
+class VisitUserAgent(models.Model):
+    """
+    Distinct User-Agent seen in product visits, with its parsed details.
+
+    Visits reference this row instead of repeating the raw header. Rows are
+    unique by the MD5 digest of the header, which keeps the unique index
+    small no matter how long the header is.
+    """
+
+    user_agent_hash = models.CharField(max_length=32, unique=True)
+    user_agent = models.TextField()
+    device = models.CharField(max_length=100, blank=True)
+    os = models.CharField(max_length=100, blank=True)
+    browser = models.CharField(max_length=100, blank=True)
+
+    @staticmethod
+    def hash(user_agent: str) -> str:
+        """
+        Return the digest a User-Agent header is stored under.
+
+        Args:
+            user_agent (str): The raw User-Agent header.
+
+        Returns:
+            str: The MD5 hex digest of the header.
+        """
+        return hashlib.md5(user_agent.encode()).hexdigest()
+
+    def __str__(self):
+        """
+        Return a string representation of the VisitUserAgent instance.
+
+        Returns:
+            str: The browser and OS of the User-Agent.
+        """
+        return f"{self.browser} ({self.os})"
+
+
+class VisitLocation(models.Model):
+    """
+    Distinct country and city seen in product visits.
+
+    Visits reference this row instead of repeating the location names.
+    """
+
+    country = models.CharField(max_length=100)
+    city = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["country", "city"], name="unique_visit_location"
+            )
+        ]
+
+    def __str__(self):
+        """
+        Return a string representation of the VisitLocation instance.
+
+        Returns:
+            str: The city and country of the location.
+        """
+        return f"{self.city}, {self.country}"
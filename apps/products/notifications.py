@@ -0,0 +1,149 @@
+import datetime
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractBaseUser
+
+from apps.accounts.services import StaffRecipientService
+from apps.products.models import Product, ProductChangeEvent
+
+
+class ProductChangeDigest:
+    """
+    Coalescing of product change events into per-recipient staff digests.
+
+    Product updates are recorded as `ProductChangeEvent` rows instead of
+    being emailed one by one. Each digest window, the pending events are
+    grouped by SKU, keeping the latest product details and the number of
+    edits, and every active staff member receives one email listing the
+    changes made by other users.
+
+    Methods:
+    - record: Records a product change for the next digest.
+    - collect: Consumes the pending events and builds one digest per recipient.
+    - coalesce: Groups change events by SKU.
+    - build: Creates the subject and body of a digest email.
+    """
+
+    @classmethod
+    def record(cls, product: Product, user: AbstractBaseUser | None) -> None:
+        """
+        Record a product change for the next digest.
+
+        Args:
+            product (Product): The product that was changed.
+            user (AbstractBaseUser, optional): The user who made the change.
+
+        Returns:
+            None
+        """
+        ProductChangeEvent.objects.create(
+            product=product,
+            sku=product.sku,
+            name=product.name,
+            brand_name=product.brand.name,
+            price=product.price,
+            changed_by=getattr(user, "email", "") or "",
+        )
+
+    @classmethod
+    def collect(cls) -> list[tuple[str, str, list[str]]]:
+        """
+        Consume the pending change events and build the digests.
+
+        Must run inside a transaction: the events are locked and deleted, so
+        a concurrent run skips them instead of sending them twice.
+
+        Returns:
+            list[tuple[str, str, list[str]]]: The subject, body and recipient of each digest.
+        """
+        events = list(
+            ProductChangeEvent.objects.select_for_update(skip_locked=True).order_by(
+                "id"
+            )
+        )
+
+        if not events:
+            return []
+
+        ProductChangeEvent.objects.filter(id__in=[e.id for e in events]).delete()
+        digests = []
+
+        for recipient in StaffRecipientService.get_emails():
+            changes = cls.coalesce([e for e in events if e.changed_by != recipient])
+
+            if changes:
+                subject, body = cls.build(changes)
+                digests.append((subject, body, [recipient]))
+
+        return digests
+
+    @staticmethod
+    def coalesce(events: list[ProductChangeEvent]) -> list[dict]:
+        """
+        Group change events by SKU, keeping the latest product details.
+
+        Args:
+            events (list[ProductChangeEvent]): Change events in the order they happened.
+
+        Returns:
+            list[dict]: One change per SKU with its latest `name`, `brand_name` and `price`, the number of `edits` and the `editors`, in order of first change.
+        """
+        changes = {}
+
+        for event in events:
+            change = changes.setdefault(event.sku, {"edits": 0, "editors": []})
+            change.update(
+                sku=event.sku,
+                name=event.name,
+                brand_name=event.brand_name,
+                price=event.price,
+                edits=change["edits"] + 1,
+            )
+            editor = event.changed_by or "Desconocido"
+
+            if editor not in change["editors"]:
+                change["editors"].append(editor)
+
+        return list(changes.values())
+
+    @staticmethod
+    def build(changes: list[dict]) -> tuple[str, str]:
+        """
+        Build the subject and body of a digest email.
+
+        Args:
+            changes (list[dict]): The coalesced changes to report.
+
+        Returns:
+            tuple[str, str]: The email subject and body.
+        """
+        subject = (
+            f"[Catálogo] Resumen de cambios: {len(changes)} productos actualizados"
+        )
+        max_skus = settings.PRODUCT_CHANGE_DIGEST_MAX_SKUS
+        lines = "\n".join(
+            f"            🔖 {c['sku']} · {c['name']} ({c['brand_name']}) · "
+            f"${c['price']:.2f} · {c['edits']} cambio(s) por {', '.join(c['editors'])}"
+            for c in changes[:max_skus]
+        )
+        remaining = len(changes) - max_skus
+
+        if remaining > 0:
+            lines += f"\n            … y {remaining} productos más"
+
+        body = f"""
+            Hola equipo,
+
+            Se han realizado modificaciones en los siguientes productos:
+
+{lines}
+
+            Fecha y hora: {datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}
+
+            Si no reconoces alguna de estas acciones, por favor revisa el historial o contacta al equipo de soporte.
+
+            Saludos,
+            Catálogo Automatizado
+        """
+
+        return subject, body
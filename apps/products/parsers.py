@@ -0,0 +1,112 @@
+import threading
+
+from django.conf import settings
+from user_agents import parse
+from user_agents.parsers import UserAgent
+
+from apps.commons.cache import LRUCache
+
+
+class UserAgentParser:
+    """
+    Memoized User-Agent parser.
+
+    Parsing a User-Agent header runs a long list of regular expressions, while
+    traffic is dominated by a small set of distinct headers. Parsed results
+    are kept in a bounded per-process LRU cache (`USER_AGENT_CACHE_SIZE`).
+
+    Methods:
+    - parse: Returns the parsed User-Agent for a header value.
+    - describe: Returns the visit metadata derived from a parsed User-Agent.
+    - device_type: Returns the device type of a parsed User-Agent.
+    - stats: Returns the parse cache counters.
+    - reset: Drops the parse cache.
+    """
+
+    _lock = threading.Lock()
+    _cache = None
+
+    @classmethod
+    def parse(cls, user_agent: str) -> UserAgent:
+        """
+        Parse a User-Agent header, reusing previously parsed results.
+
+        Args:
+            user_agent (str): The raw User-Agent header.
+
+        Returns:
+            UserAgent: The parsed User-Agent.
+        """
+        return cls._get_cache().get_or_set(user_agent, lambda: parse(user_agent))
+
+    @classmethod
+    def describe(cls, ua: UserAgent) -> dict:
+        """
+        Build the visit metadata derived from a parsed User-Agent.
+
+        Args:
+            ua (UserAgent): The parsed User-Agent.
+
+        Returns:
+            dict: Device, device type, OS, browser and device class flags.
+        """
+        return {
+            "device": ua.device.family,
+            "device_type": cls.device_type(ua),
+            "os": ua.os.family,
+            "browser": ua.browser.family,
+            "is_mobile": ua.is_mobile,
+            "is_tablet": ua.is_tablet,
+            "is_pc": ua.is_pc,
+        }
+
+    @staticmethod
+    def device_type(ua: UserAgent) -> str:
+        """
+        Determine the type of device based on the user agent.
+
+        Args:
+            ua (UserAgent): The parsed User-Agent.
+
+        Returns:
+            str: The type of device (e.g., "mobile", "tablet", "pc", "bot", or "unknown").
+        """
+        if ua.is_mobile:
+            return "mobile"
+        elif ua.is_tablet:
+            return "tablet"
+        elif ua.is_pc:
+            return "pc"
+        elif ua.is_bot:
+            return "bot"
+        return "unknown"
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+        Return the parse cache counters.
+
+        Returns:
+            dict: Size, maximum size, hits, misses, evictions and hit rate.
+        """
+        return cls._get_cache().stats()
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Drop the parse cache so it is rebuilt from the settings.
+
+        Returns:
+            None
+        """
+        with cls._lock:
+            cls._cache = None
+
+    @classmethod
+    def _get_cache(cls) -> LRUCache:
+        if cls._cache is None:
+            with cls._lock:
+                if cls._cache is None:
+                    cls._cache = LRUCache(settings.USER_AGENT_CACHE_SIZE)
+
+        return cls._cache
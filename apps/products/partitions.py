@@ -0,0 +1,261 @@
+import datetime
+import logging
+import re
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.products.models import ProductRetrieve
+
+logger = logging.getLogger(__name__)
+
+PARTITION_NAME = re.compile(r"_p(?P<year>\d{4})(?P<month>\d{2})$")
+
+
+def month_start(value: datetime.date, offset: int = 0) -> datetime.date:
+    """
+    Return the first day of the month of `value`, shifted by `offset` months.
+
+    Args:
+        value (datetime.date): Any day of the month.
+        offset (int, optional): Months to shift by. Defaults to 0.
+
+    Returns:
+        datetime.date: The first day of the resulting month.
+    """
+    months = value.year * 12 + value.month - 1 + offset
+    return datetime.date(months // 12, months % 12 + 1, 1)
+
+
+class ProductRetrievePartitions:
+    """
+    Maintenance of the monthly `ProductRetrieve` partitions on PostgreSQL.
+
+    Visits are range-partitioned by `visited_at`, one partition per month
+    named `<table>_pYYYYMM`. Partitions are created ahead of time so inserts
+    never land in the default partition, and expired months are dropped (or
+    detached, to be archived) as a whole instead of running `DELETE`, which
+    leaves no dead tuples behind for vacuum.
+
+    Visits outside every monthly partition (e.g. when the scheduled creation
+    fell behind) land in the default partition. PostgreSQL then refuses to
+    create the partition for their month, so they are moved into monthly
+    partitions of their own on the next maintenance, with a warning, and the
+    retention period applies to them like to any other month.
+
+    On other databases, or before the table is partitioned, every method is
+    a no-op.
+
+    Methods:
+    - is_supported: Checks whether the visits table is partitioned.
+    - partitions: Returns the existing monthly partitions.
+    - drain_default: Moves the visits in the default partition into monthly partitions.
+    - create_partitions: Creates the partitions for the coming months.
+    - apply_retention: Drops or detaches the expired partitions.
+    - maintain: Creates future partitions and applies the retention.
+    """
+
+    table = ProductRetrieve._meta.db_table
+    default = f"{table}_default"
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        """
+        Check whether the visits table is a partitioned PostgreSQL table.
+
+        Returns:
+            bool: True if the partitions can be managed.
+        """
+        if connection.vendor != "postgresql":
+            return False
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = %s",
+                [cls.table],
+            )
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def partitions(cls) -> dict[datetime.date, str]:
+        """
+        Return the existing monthly partitions.
+
+        Returns:
+            dict[datetime.date, str]: Partition names keyed by the first day of their month.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = %s",
+                [cls.table],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+
+        partitions = {}
+
+        for name in names:
+            match = PARTITION_NAME.search(name)
+
+            if match:
+                start = datetime.date(int(match["year"]), int(match["month"]), 1)
+                partitions[start] = name
+
+        return partitions
+
+    @classmethod
+    def drain_default(cls) -> list[str]:
+        """
+        Move the visits in the default partition into monthly partitions.
+
+        For every month with visits in the default partition, a table is
+        created, the visits are moved into it and it is attached as the
+        partition of that month, all in one transaction.
+
+        Returns:
+            list[str]: The names of the partitions created.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT date_trunc('month', visited_at)::date, COUNT(*) "
+                f'FROM "{cls.default}" GROUP BY 1 ORDER BY 1'
+            )
+            months = cursor.fetchall()
+
+        if not months:
+            return []
+
+        logger.warning(
+            "%s visits landed in the default partition %s; moving them into "
+            "monthly partitions.",
+            sum(count for _, count in months),
+            cls.default,
+        )
+        created = []
+
+        for start, _ in months:
+            name = f"{cls.table}_p{start:%Y%m}"
+            end = month_start(start, 1)
+
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    f'CREATE TABLE "{name}" (LIKE "{cls.table}" INCLUDING DEFAULTS)'
+                )
+                cursor.execute(
+                    f'WITH moved AS (DELETE FROM "{cls.default}" '
+                    "WHERE visited_at >= %s AND visited_at < %s RETURNING *) "
+                    f'INSERT INTO "{name}" SELECT * FROM moved',
+                    [start, end],
+                )
+                cursor.execute(
+                    f'ALTER TABLE "{cls.table}" ATTACH PARTITION "{name}" '
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                )
+
+            created.append(name)
+
+        return created
+
+    @classmethod
+    def create_partitions(cls, months_ahead: int | None = None) -> list[str]:
+        """
+        Create the partitions for the current month and the coming ones.
+
+        Args:
+            months_ahead (int, optional): Months to create after the current one. Defaults to `PRODUCT_RETRIEVE_PARTITIONS_AHEAD`.
+
+        Returns:
+            list[str]: The names of the partitions created.
+        """
+        if months_ahead is None:
+            months_ahead = settings.PRODUCT_RETRIEVE_PARTITIONS_AHEAD
+
+        existing = cls.partitions()
+        today = timezone.now().date()
+        created = []
+
+        for offset in range(months_ahead + 1):
+            start = month_start(today, offset)
+
+            if start in existing:
+                continue
+
+            name = f"{cls.table}_p{start:%Y%m}"
+            end = month_start(start, 1)
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" '
+                    f'PARTITION OF "{cls.table}" '
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                )
+
+            created.append(name)
+
+        return created
+
+    @classmethod
+    def apply_retention(
+        cls, retention_months: int | None = None, mode: str | None = None
+    ) -> list[str]:
+        """
+        Drop or detach the partitions older than the retention period.
+
+        Detached partitions stay in the database as regular tables, so they
+        can be archived (e.g. with `pg_dump`) and dropped afterwards.
+
+        Args:
+            retention_months (int, optional): Months of visits to keep. Defaults to `PRODUCT_RETRIEVE_RETENTION_MONTHS`; 0 keeps everything.
+            mode (str, optional): "drop" or "detach". Defaults to `PRODUCT_RETRIEVE_RETENTION_MODE`.
+
+        Raises:
+            ValueError: If the mode is not supported.
+
+        Returns:
+            list[str]: The names of the partitions removed.
+        """
+        if retention_months is None:
+            retention_months = settings.PRODUCT_RETRIEVE_RETENTION_MONTHS
+
+        mode = mode or settings.PRODUCT_RETRIEVE_RETENTION_MODE
+
+        if mode not in ("drop", "detach"):
+            raise ValueError(f"Unsupported retention mode: {mode}")
+
+        if not retention_months:
+            return []
+
+        cutoff = month_start(timezone.now().date(), -retention_months)
+        expired = [
+            name for start, name in sorted(cls.partitions().items()) if start < cutoff
+        ]
+
+        for name in expired:
+            with transaction.atomic(), connection.cursor() as cursor:
+                if mode == "detach":
+                    cursor.execute(
+                        f'ALTER TABLE "{cls.table}" DETACH PARTITION "{name}"'
+                    )
+                else:
+                    cursor.execute(f'DROP TABLE "{name}"')
+
+        return expired
+
+    @classmethod
+    def maintain(cls) -> dict[str, list[str]]:
+        """
+        Drain the default partition, create the future partitions and apply the retention period.
+
+        Returns:
+            dict[str, list[str]]: The partitions created and removed.
+        """
+        if not cls.is_supported():
+            return {"created": [], "removed": []}
+
+        created = cls.drain_default() + cls.create_partitions()
+        return {"created": created, "removed": cls.apply_retention()}
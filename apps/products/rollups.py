@@ -0,0 +1,189 @@
+import datetime
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.products.models import ProductRetrieve, ProductVisitStat, RollupCheckpoint
+
+
+class ProductVisitRollup:
+    """
+    Incremental aggregation of `ProductRetrieve` rows into `ProductVisitStat`.
+
+    Each batch reads the visits stored after the `RollupCheckpoint` high-water
+    mark, counts them per product, hour/day bucket, country, device type and
+    browser, adds the counts to the existing rows and moves the high-water
+    mark forward, all in one transaction. The checkpoint row is locked for the
+    duration of the batch, so concurrent runs never count a visit twice.
+
+    Visits inserted less than `PRODUCT_VISIT_ROLLUP_LAG` seconds ago are left
+    for the next run, giving in-flight inserts time to commit: ids are
+    assigned at insert time but may commit out of order, so the high-water
+    mark only moves past rows whose database-assigned `created_at` is older
+    than the lag. `visited_at` is not used for this, since it is the request
+    time and buffered visits are inserted later.
+
+    Methods:
+    - run: Aggregates every pending visit in batches.
+    - run_batch: Aggregates one batch of pending visits.
+    """
+
+    CHECKPOINT = "product_visit_stats"
+    DIMENSIONS = ("country", "device_type", "browser")
+
+    @classmethod
+    def run(cls, batch_size: int | None = None) -> int:
+        """
+        Aggregate every pending visit, one batch at a time.
+
+        Args:
+            batch_size (int, optional): Visits per batch. Defaults to `PRODUCT_VISIT_ROLLUP_BATCH_SIZE`.
+
+        Returns:
+            int: The number of visits aggregated.
+        """
+        batch_size = batch_size or settings.PRODUCT_VISIT_ROLLUP_BATCH_SIZE
+        total = 0
+
+        while True:
+            aggregated = cls.run_batch(batch_size)
+            total += aggregated
+
+            if aggregated < batch_size:
+                return total
+
+    @classmethod
+    def run_batch(cls, batch_size: int) -> int:
+        """
+        Aggregate one batch of visits stored after the high-water mark.
+
+        Args:
+            batch_size (int): The maximum number of visits to aggregate.
+
+        Returns:
+            int: The number of visits aggregated.
+        """
+        cutoff = timezone.now() - datetime.timedelta(
+            seconds=settings.PRODUCT_VISIT_ROLLUP_LAG
+        )
+
+        with transaction.atomic():
+            checkpoint, _ = RollupCheckpoint.objects.select_for_update().get_or_create(
+                name=cls.CHECKPOINT
+            )
+            visits = list(
+                ProductRetrieve.objects.filter(id__gt=checkpoint.last_id)
+                .order_by("id")
+                .values(
+                    "id",
+                    "product_id",
+                    "visited_at",
+                    "created_at",
+                    "device_type",
+                    "location__country",
+                    "user_agent__browser",
+                    "metadata",
+                )[:batch_size]
+            )
+
+            # Only a contiguous prefix is aggregated, so the high-water mark
+            # never skips over a visit that may still be committing.
+            for index, visit in enumerate(visits):
+                if visit["created_at"] >= cutoff:
+                    visits = visits[:index]
+                    break
+
+            if not visits:
+                return 0
+
+            cls._add_counts(cls._count(visits))
+            checkpoint.last_id = visits[-1]["id"]
+            checkpoint.save(update_fields=["last_id", "updated_at"])
+
+        return len(visits)
+
+    @classmethod
+    def _count(cls, visits: list[dict]) -> Counter:
+        """
+        Count visits per product, period bucket and dimensions.
+
+        Args:
+            visits (list[dict]): Visits with `product_id`, `visited_at` and their dimension columns.
+
+        Returns:
+            Counter: Visit counts keyed by `(product_id, period, bucket_start, *dimensions)`.
+        """
+        counts = Counter()
+
+        for visit in visits:
+            dimensions = cls._dimensions(visit)
+            hour = visit["visited_at"].replace(minute=0, second=0, microsecond=0)
+            day = hour.replace(hour=0)
+
+            counts[
+                (visit["product_id"], ProductVisitStat.Period.HOUR, hour) + dimensions
+            ] += 1
+            counts[
+                (visit["product_id"], ProductVisitStat.Period.DAY, day) + dimensions
+            ] += 1
+
+        return counts
+
+    @classmethod
+    def _dimensions(cls, visit: dict) -> tuple[str, str, str]:
+        """
+        Return the country, device type and browser of a visit.
+
+        Visits not yet moved to the typed columns by `backfill_visit_columns`
+        are read from their legacy metadata.
+
+        Args:
+            visit (dict): The visit values.
+
+        Returns:
+            tuple[str, str, str]: The visit dimensions, empty when unknown.
+        """
+        if visit["metadata"] is not None:
+            metadata = visit["metadata"]
+            return tuple(str(metadata.get(d) or "") for d in cls.DIMENSIONS)
+
+        return (
+            visit["location__country"] or "",
+            ProductRetrieve.DeviceType(visit["device_type"]).label,
+            visit["user_agent__browser"] or "",
+        )
+
+    @classmethod
+    def _add_counts(cls, counts: Counter) -> None:
+        """
+        Add visit counts to the existing statistics rows, creating missing ones.
+
+        Args:
+            counts (Counter): Visit counts keyed by `(product_id, period, bucket_start, *dimensions)`.
+
+        Returns:
+            None
+        """
+        fields = ("product_id", "period", "bucket_start") + cls.DIMENSIONS
+        existing = ProductVisitStat.objects.filter(
+            product_id__in={key[0] for key in counts},
+            bucket_start__in={key[2] for key in counts},
+        )
+        stats = {tuple(getattr(stat, f) for f in fields): stat for stat in existing}
+        to_update, to_create = [], []
+
+        for key, visits in counts.items():
+            stat = stats.get(key)
+
+            if stat is None:
+                to_create.append(
+                    ProductVisitStat(visits=visits, **dict(zip(fields, key)))
+                )
+            else:
+                stat.visits += visits
+                to_update.append(stat)
+
+        ProductVisitStat.objects.bulk_update(to_update, ["visits"])
+        ProductVisitStat.objects.bulk_create(to_create)
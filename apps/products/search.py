@@ -0,0 +1,70 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db import connection
+from django.db.models import F, Q, QuerySet
+from django.db.models.functions import Upper
+
+
+class ProductSearch:
+    """
+    Product search over the SKU, the name and the brand name.
+
+    On PostgreSQL a term matches the stored `search_vector` (full-text,
+    maintained by a trigger and GIN indexed), a SKU prefix or a SKU within
+    trigram distance (typo tolerance, served by the trigram index on
+    `UPPER(sku)`). Results are ranked by text relevance plus SKU similarity.
+
+    On other databases it falls back to unranked case-insensitive matching.
+
+    Methods:
+    - is_supported: Checks whether the indexed search is available.
+    - search: Filters and ranks a product queryset.
+    """
+
+    # Must match the configuration used by the search vector trigger.
+    CONFIG = "spanish"
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        """
+        Check whether the indexed PostgreSQL search is available.
+
+        Returns:
+            bool: True on PostgreSQL.
+        """
+        return connection.vendor == "postgresql"
+
+    @classmethod
+    def search(cls, queryset: QuerySet, term: str) -> QuerySet:
+        """
+        Filter a product queryset by a search term, best matches first.
+
+        Args:
+            queryset (QuerySet): The products to search.
+            term (str): The search term, in web search syntax on PostgreSQL.
+
+        Returns:
+            QuerySet: The matching products, ordered by rank and then ID.
+        """
+        if not cls.is_supported():
+            return queryset.filter(
+                Q(sku__icontains=term)
+                | Q(name__icontains=term)
+                | Q(brand__name__icontains=term)
+            ).order_by("id")
+
+        query = SearchQuery(term, config=cls.CONFIG, search_type="websearch")
+        sku_term = term.upper()
+
+        return (
+            queryset.alias(sku_upper=Upper("sku"))
+            .filter(
+                Q(search_vector=query)
+                | Q(sku_upper__startswith=sku_term)
+                | Q(sku_upper__trigram_similar=sku_term)
+            )
+            .annotate(
+                rank=SearchRank(F("search_vector"), query)
+                + TrigramSimilarity(Upper("sku"), sku_term)
+            )
+            .order_by("-rank", "id")
+        )
@@ -11,3 +11,28 @@ class BrandSerializer(serializers.ModelSerializer):
             "name",
         )
         read_only_fields = ["id"]
+
+
+class BrandStatsSerializer(BrandSerializer):
+    """
+    Serializer for a brand with its product statistics.
+
+    The statistics are read from `product_count`, `min_price` and
+    `max_price` annotations, so serializing a page runs no extra queries.
+    Prices are null for brands without products.
+    """
+
+    product_count = serializers.IntegerField(read_only=True)
+    min_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, read_only=True
+    )
+    max_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, read_only=True
+    )
+
+    class Meta(BrandSerializer.Meta):
+        fields = BrandSerializer.Meta.fields + (
+            "product_count",
+            "min_price",
+            "max_price",
+        )
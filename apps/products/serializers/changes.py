@@ -0,0 +1,81 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+from apps.products.changes import CatalogueChangeFeed
+from apps.products.models import CatalogueTombstone, Product
+from apps.products.serializers.brand import BrandSerializer
+from apps.products.serializers.product import ProductSerializer
+
+
+class CatalogueChangeQuerySerializer(serializers.Serializer):
+    """
+    Serializer for the query parameters of the catalogue change feed.
+
+    Fields:
+        - cursor: The cursor returned by the previous poll; omitted for a full sync.
+        - limit: The maximum number of changes to return.
+    """
+
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+    def validate_cursor(self, value):
+        """
+        Decode the cursor into a sequence number.
+
+        Args:
+            value (str): The opaque cursor.
+
+        Raises:
+            serializers.ValidationError: If the cursor is malformed.
+
+        Returns:
+            int: The sequence number of the last change seen.
+        """
+        try:
+            return CatalogueChangeFeed.decode_cursor(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+
+class CatalogueChangeSerializer(serializers.Serializer):
+    """
+    Serializer for a single change of the catalogue change feed.
+
+    `data` holds the current product or brand, or null for a deletion.
+    """
+
+    kind = serializers.ChoiceField(choices=CatalogueTombstone.Kind.choices)
+    key = serializers.CharField()
+    deleted = serializers.BooleanField()
+    data = serializers.SerializerMethodField()
+
+    @extend_schema_field(OpenApiTypes.OBJECT)
+    def get_data(self, change):
+        """
+        Serialize the changed product or brand.
+
+        Args:
+            change (dict): The change, as returned by `CatalogueChangeFeed.read`.
+
+        Returns:
+            dict | None: The serialized instance, or None for a deletion.
+        """
+        instance = change["instance"]
+
+        if instance is None:
+            return None
+
+        if isinstance(instance, Product):
+            return ProductSerializer(instance).data
+
+        return BrandSerializer(instance).data
+
+
+class CatalogueChangePageSerializer(serializers.Serializer):
+    """Serializer for a page of the catalogue change feed."""
+
+    results = CatalogueChangeSerializer(many=True)
+    cursor = serializers.CharField()
+    has_more = serializers.BooleanField()
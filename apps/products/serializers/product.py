@@ -1,5 +1,9 @@
+from collections import Counter
+
+from django.conf import settings
 from rest_framework import serializers
 
+from apps.products.models.brand import Brand
 from apps.products.models.product import Product
 
 
@@ -12,3 +16,150 @@ class ProductSerializer(serializers.ModelSerializer):
             "price",
             "brand",
         )
+
+
+class ProductSearchQuerySerializer(serializers.Serializer):
+    """
+    Serializer for the query parameters of the product search.
+
+    Fields:
+        - q: The search term, matched against the SKU, name and brand name.
+    """
+
+    q = serializers.CharField(max_length=100)
+
+
+class ProductFilterQuerySerializer(serializers.Serializer):
+    """
+    Serializer for the product list filters.
+
+    Fields:
+        - min_price: Only products priced at or above this value.
+        - max_price: Only products priced at or below this value.
+        - brand: Only products of the brand with this ID.
+        - brand_name: Only products of the brand with this name.
+
+    Methods:
+        - validate: Rejects an empty price range.
+    """
+
+    min_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=0, required=False
+    )
+    max_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=0, required=False
+    )
+    brand = serializers.IntegerField(min_value=1, required=False)
+    brand_name = serializers.CharField(max_length=100, required=False)
+
+    def validate(self, attrs):
+        """
+        Reject a minimum price above the maximum price.
+
+        Args:
+            attrs (dict): The validated filters.
+
+        Raises:
+            serializers.ValidationError: If the price range is empty.
+
+        Returns:
+            dict: The validated filters.
+        """
+        min_price, max_price = attrs.get("min_price"), attrs.get("max_price")
+
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise serializers.ValidationError(
+                {"min_price": "Must not be greater than max_price."}
+            )
+
+        return attrs
+
+
+class ProductBulkItemSerializer(serializers.Serializer):
+    """
+    Serializer for a single product in a bulk upsert.
+
+    Plain (non-model) fields are used so validating thousands of items runs
+    no per-item queries; the brand is given by name and resolved for the
+    whole batch at once.
+    """
+
+    sku = serializers.CharField(max_length=50)
+    name = serializers.CharField(max_length=255)
+    price = serializers.DecimalField(max_digits=10, decimal_places=2)
+    brand = serializers.CharField(max_length=100)
+
+
+class ProductBulkUpsertSerializer(serializers.Serializer):
+    """
+    Serializer for bulk product upserts keyed by SKU.
+
+    Fields:
+        - products: The products to create or update.
+
+    Methods:
+        - validate_products: Rejects SKUs repeated in the payload.
+        - validate: Resolves every brand name with a single query.
+    """
+
+    products = ProductBulkItemSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=settings.PRODUCT_BULK_UPSERT_MAX_ITEMS,
+    )
+
+    def validate_products(self, products):
+        """
+        Reject SKUs that appear more than once in the payload.
+
+        Args:
+            products (list[dict]): The validated products.
+
+        Raises:
+            serializers.ValidationError: If a SKU is repeated.
+
+        Returns:
+            list[dict]: The validated products.
+        """
+        counts = Counter(product["sku"] for product in products)
+        duplicates = sorted(sku for sku, count in counts.items() if count > 1)
+
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Duplicated SKUs: {', '.join(duplicates)}"
+            )
+
+        return products
+
+    def validate(self, attrs):
+        """
+        Resolve the brand of every product with a single query.
+
+        Args:
+            attrs (dict): The validated data.
+
+        Raises:
+            serializers.ValidationError: If a brand name does not exist.
+
+        Returns:
+            dict: The validated data, including a `brands` map of name to ID.
+        """
+        names = {product["brand"] for product in attrs["products"]}
+        brands = dict(Brand.objects.filter(name__in=names).values_list("name", "id"))
+        missing = sorted(names - brands.keys())
+
+        if missing:
+            raise serializers.ValidationError(
+                {"products": f"Unknown brands: {', '.join(missing)}"}
+            )
+
+        attrs["brands"] = brands
+        return attrs
+
+
+class ProductBulkUpsertResultSerializer(serializers.Serializer):
+    """Serializer for the summary of a bulk product upsert."""
+
+    received = serializers.IntegerField()
+    created = serializers.IntegerField()
+    updated = serializers.IntegerField()
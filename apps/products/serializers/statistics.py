@@ -0,0 +1,60 @@
+from rest_framework import serializers
+
+from apps.products.models.statistics import ProductVisitStat
+from apps.products.rollups import ProductVisitRollup
+
+
+class ProductVisitStatQuerySerializer(serializers.Serializer):
+    """
+    Serializer for the query parameters of the product visit statistics.
+
+    Fields:
+        - period: The bucket size ("hour" or "day").
+        - since: Only buckets starting at or after this time.
+        - until: Only buckets starting before this time.
+        - breakdown: Comma-separated dimensions to group by.
+    """
+
+    period = serializers.ChoiceField(
+        choices=ProductVisitStat.Period.choices, default=ProductVisitStat.Period.DAY
+    )
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+    breakdown = serializers.CharField(required=False, default="")
+
+    def validate_breakdown(self, value):
+        """
+        Parse and validate the breakdown dimensions.
+
+        Args:
+            value (str): Comma-separated dimensions.
+
+        Raises:
+            serializers.ValidationError: If a dimension is not supported.
+
+        Returns:
+            list[str]: The requested dimensions.
+        """
+        dimensions = [d.strip() for d in value.split(",") if d.strip()]
+        unknown = [d for d in dimensions if d not in ProductVisitRollup.DIMENSIONS]
+
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unsupported dimensions: {', '.join(unknown)}"
+            )
+
+        return dimensions
+
+
+class ProductVisitStatSerializer(serializers.Serializer):
+    """
+    Serializer for an aggregated product visit statistic.
+
+    Dimension fields are only present when requested in the breakdown.
+    """
+
+    bucket_start = serializers.DateTimeField()
+    country = serializers.CharField(required=False)
+    device_type = serializers.CharField(required=False)
+    browser = serializers.CharField(required=False)
+    visits = serializers.IntegerField()
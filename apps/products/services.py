@@ -1,15 +1,23 @@
+import csv
 import datetime
-from typing import TypeAlias
+import json
+from typing import Iterator, TypeAlias
 
-from django.contrib.auth import get_user_model
+from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser
-from user_agents import parse
-
+from django.db import transaction
+from django.db.models import Case, Value, When
+from django.utils import timezone
+
+from apps.commons.outbox import Outbox
+from apps.products.buffers import get_visit_buffer
+from apps.products.cache import ProductCache
+from apps.products.changes import CatalogueChangeFeed
 from apps.products.models.product import Product
-from apps.products.tasks import send_product_update_email
+from apps.products.parsers import UserAgentParser
+from apps.products.tasks import flush_product_retrieves, send_staff_notification
 
 UserType: TypeAlias = AbstractBaseUser
-User = get_user_model()
 
 
 class ProductVisitMetadataBuilder:
@@ -18,11 +26,20 @@ class ProductVisitMetadataBuilder:
 
     This class extracts metadata from the request, such as IP address,
     user agent, device type, and other relevant information.
+
+    User-Agent parsing goes through the memoized `UserAgentParser`. When
+    `VISIT_DEFER_USER_AGENT_PARSING` is enabled, only the raw header is
+    captured and the worker parses it when the visit is stored.
     """
 
     def __init__(self, request):
         self.request = request
-        self.ua = parse(request.headers.get("User-Agent", ""))
+        self.user_agent = request.headers.get("User-Agent", "")
+        self.ua = (
+            None
+            if settings.VISIT_DEFER_USER_AGENT_PARSING
+            else UserAgentParser.parse(self.user_agent)
+        )
 
     def build(self) -> dict:
         """
@@ -31,19 +48,17 @@ class ProductVisitMetadataBuilder:
         Returns:
             dict: Metadata including IP address, user agent, device type, OS, browser, etc.
         """
-        return {
+        metadata = {
             "ip": self._get_ip(),
-            "user_agent": self.request.headers.get("User-Agent", ""),
-            "device": self.ua.device.family,
-            "device_type": self._get_device_type(),
-            "os": self.ua.os.family,
-            "browser": self.ua.browser.family,
-            "is_mobile": self.ua.is_mobile,
-            "is_tablet": self.ua.is_tablet,
-            "is_pc": self.ua.is_pc,
+            "user_agent": self.user_agent,
             "referer": self.request.headers.get("Referer"),
         }
 
+        if self.ua is not None:
+            metadata.update(UserAgentParser.describe(self.ua))
+
+        return metadata
+
     def _get_ip(self) -> str:
         """
         Retrieve the IP address from the request.
@@ -58,59 +73,92 @@ class ProductVisitMetadataBuilder:
 
         return self.request.META.get("REMOTE_ADDR")
 
-    def _get_device_type(self) -> str:
+
+class ProductVisitTracker:
+    """
+    Service class for recording product visits.
+
+    Visits are appended to the visit buffer and persisted in batches by the
+    `flush_product_retrieves` task, which runs periodically and whenever the
+    buffer length reaches a multiple of `VISIT_BUFFER_BATCH_SIZE`.
+
+    Methods:
+    - track: Buffers a visit to a product.
+    """
+
+    @classmethod
+    def track(cls, product_id: int, metadata: dict) -> None:
         """
-        Determine the type of device based on the user agent.
+        Buffer a product visit.
+
+        Args:
+            product_id (int): The ID of the visited product.
+            metadata (dict): Metadata about the visit.
 
         Returns:
-            str: The type of device (e.g., "mobile", "tablet", "pc", "bot", or "unknown").
+            None
         """
-        if self.ua.is_mobile:
-            return "mobile"
-        elif self.ua.is_tablet:
-            return "tablet"
-        elif self.ua.is_pc:
-            return "pc"
-        elif self.ua.is_bot:
-            return "bot"
-        return "unknown"
+        event = {
+            "product_id": product_id,
+            "metadata": metadata,
+            "visited_at": timezone.now().isoformat(),
+        }
+
+        length = get_visit_buffer().append(event)
+
+        # Once per full batch appended, so a buffer left past the batch size
+        # (e.g. by a failed flush) keeps triggering flushes without queueing
+        # one task per visit.
+        if length % settings.VISIT_BUFFER_BATCH_SIZE == 0:
+            flush_product_retrieves.delay()
 
 
 class ProductEmailService:
     """
     Service class for handling product-related email notifications.
 
-    This class provides methods to build and send email notifications
-    when a product is updated.
+    Single product updates are batched into periodic digests by
+    `ProductChangeDigest`; this class handles the bulk upsert summaries.
 
     Methods:
-    - build: Creates the subject and body of the email notification.
-    - send_email: Sends the email notification to administrators.
+    - build_bulk: Creates the subject and body of a bulk upsert summary.
+    - send_bulk_email: Sends a single bulk upsert summary to administrators.
     """
 
     @classmethod
-    def build(cls, product: Product, user: UserType) -> tuple[str, str]:
+    def build_bulk(
+        cls, summary: dict, skus: list[str], user: UserType
+    ) -> tuple[str, str]:
         """
-        Build the subject and body for a product update email.
+        Build the subject and body for a bulk upsert summary email.
 
         Args:
-            product (Product): The product that was updated.
-            user (UserType): The user who made the update.
+            summary (dict): The number of received, created and updated products.
+            skus (list[str]): The SKUs included in the upsert.
+            user (UserType): The user who ran the upsert.
 
         Returns:
             tuple[str, str]: The email subject and body.
         """
-        subject = f"[Catálogo] Producto actualizado: {product.name} ({product.sku})"
+        subject = (
+            f"[Catálogo] Carga masiva: {summary['created']} productos creados, "
+            f"{summary['updated']} actualizados"
+        )
+        sample = ", ".join(skus[: settings.PRODUCT_BULK_EMAIL_MAX_SKUS])
+        remaining = len(skus) - settings.PRODUCT_BULK_EMAIL_MAX_SKUS
+
+        if remaining > 0:
+            sample += f" y {remaining} más"
 
         body = f"""
             Hola equipo,
 
-            Se ha realizado una modificación en el siguiente producto:
+            Se ha realizado una carga masiva de productos:
 
-            🏍️ Nombre: {product.name}
-            🔖 SKU: {product.sku}
-            🏷️ Marca: {product.brand.name}
-            💰 Precio actual: ${product.price:.2f}
+            📦 Recibidos: {summary['received']}
+            🆕 Creados: {summary['created']}
+            ✏️ Actualizados: {summary['updated']}
+            🔖 SKUs: {sample}
 
             Modificado por: {user.email if user else 'Desconocido'}
             Fecha y hora: {datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}
@@ -124,22 +172,212 @@ class ProductEmailService:
         return subject, body
 
     @classmethod
-    def send_email(cls, product: Product, user: UserType) -> None:
+    def send_bulk_email(cls, summary: dict, skus: list[str], user: UserType) -> None:
+        """
+        Send a single summary of a bulk upsert to administrators.
+
+        The notification goes through the outbox, so it is only sent if the
+        surrounding transaction commits, and the recipients are resolved by
+        the notification task, off the request thread.
+
+        Args:
+            summary (dict): The number of received, created and updated products.
+            skus (list[str]): The SKUs included in the upsert.
+            user (UserType): The user who ran the upsert.
+
+        Returns:
+            None
+        """
+        subject, body = cls.build_bulk(summary=summary, skus=skus, user=user)
+        Outbox.enqueue(
+            send_staff_notification.name, subject, body, exclude_email=user.email
+        )
+
+
+class ProductBulkUpsertService:
+    """
+    Service class for creating or updating many products at once.
+
+    Products are written with `bulk_create(update_conflicts=True)` keyed by
+    SKU, in chunks of `PRODUCT_BULK_UPSERT_BATCH_SIZE`, inside a single
+    transaction. Since `bulk_create` sends no `pre_save` signals, the
+    products are stamped in the catalogue change feed afterwards, with one
+    range of the sequence reserved right before committing, so the sequence
+    lock is not held while the chunks are written.
+
+    Methods:
+    - upsert: Creates or updates the given products.
+    """
+
+    @classmethod
+    def upsert(cls, products: list[dict], brands: dict[str, int]) -> dict:
+        """
+        Create or update products keyed by SKU.
+
+        Args:
+            products (list[dict]): Validated products with `sku`, `name`, `price` and `brand` name.
+            brands (dict[str, int]): Brand IDs keyed by brand name.
+
+        Returns:
+            dict: The number of received, created and updated products.
+        """
+        batch_size = settings.PRODUCT_BULK_UPSERT_BATCH_SIZE
+        updated = 0
+
+        with transaction.atomic():
+            for start in range(0, len(products), batch_size):
+                end = start + batch_size
+                chunk = products[start:end]
+                skus = [product["sku"] for product in chunk]
+                updated += Product.objects.filter(sku__in=skus).count()
+                Product.objects.bulk_create(
+                    [
+                        Product(
+                            sku=product["sku"],
+                            name=product["name"],
+                            price=product["price"],
+                            brand_id=brands[product["brand"]],
+                        )
+                        for product in chunk
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["sku"],
+                    update_fields=["name", "price", "brand", "updated_at"],
+                )
+
+            cls._stamp([product["sku"] for product in products], batch_size)
+
+            # bulk_create sends no model signals.
+            ProductCache.invalidate()
+            transaction.on_commit(ProductCache.invalidate)
+
+        return {
+            "received": len(products),
+            "created": len(products) - updated,
+            "updated": updated,
+        }
+
+    @staticmethod
+    def _stamp(skus: list[str], batch_size: int) -> None:
         """
-        Send an email notification about a product update to administrators.
+        Stamp the upserted products in the catalogue change feed.
 
         Args:
-            product (Product): The product that was updated.
-            user (UserType): The user who made the update.
+            skus (list[str]): The SKUs of the upserted products, in order.
+            batch_size (int): Products updated per query.
 
         Returns:
             None
         """
-        admins = User.objects.filter(is_staff=True, is_active=True).exclude(
-            email=user.email
+        skus = list(dict.fromkeys(skus))
+        first_seq = CatalogueChangeFeed.allocate(len(skus))
+
+        for start in range(0, len(skus), batch_size):
+            end = start + batch_size
+            chunk = skus[start:end]
+            Product.objects.filter(sku__in=chunk).update(
+                change_seq=Case(
+                    *[
+                        When(sku=sku, then=Value(first_seq + start + offset))
+                        for offset, sku in enumerate(chunk)
+                    ]
+                )
+            )
+
+
+class ProductExportService:
+    """
+    Service class for streaming the full product catalogue.
+
+    Rows are read with `QuerySet.iterator(chunk_size=PRODUCT_EXPORT_CHUNK_SIZE)`
+    (a server-side cursor on PostgreSQL) and encoded one by one, so memory use
+    does not depend on the catalogue size.
+
+    Methods:
+    - rows: Yields the catalogue rows as dictionaries.
+    - fields: Returns the exported field names.
+    - as_ndjson: Yields the catalogue as newline-delimited JSON.
+    - as_csv: Yields the catalogue as CSV.
+    """
+
+    FIELDS = ("sku", "name", "price", "brand")
+    LOOKUPS = {
+        "sku": "sku",
+        "name": "name",
+        "price": "price",
+        "brand": "brand_id",
+        "brand_name": "brand__name",
+    }
+
+    @classmethod
+    def rows(cls, include_brand_name: bool = False) -> Iterator[dict]:
+        """
+        Yield every product as a dictionary of exported fields.
+
+        Args:
+            include_brand_name (bool, optional): Whether to add the brand name. Defaults to False.
+
+        Yields:
+            dict: The exported fields of a product, with the price as a string.
+        """
+        fields = cls.fields(include_brand_name)
+        queryset = Product.objects.order_by("id").values_list(
+            *[cls.LOOKUPS[field] for field in fields]
         )
-        to_emails = [admin.email for admin in admins]
 
-        if to_emails:
-            subject, body = cls.build(product=product, user=user)
-            send_product_update_email.delay(subject, body, to_emails)
+        for values in queryset.iterator(chunk_size=settings.PRODUCT_EXPORT_CHUNK_SIZE):
+            row = dict(zip(fields, values))
+            row["price"] = f"{row['price']:.2f}"
+            yield row
+
+    @classmethod
+    def fields(cls, include_brand_name: bool = False) -> tuple[str, ...]:
+        """
+        Return the exported field names.
+
+        Args:
+            include_brand_name (bool, optional): Whether to add the brand name. Defaults to False.
+
+        Returns:
+            tuple[str, ...]: The exported field names.
+        """
+        return cls.FIELDS + ("brand_name",) if include_brand_name else cls.FIELDS
+
+    @classmethod
+    def as_ndjson(cls, include_brand_name: bool = False) -> Iterator[str]:
+        """
+        Yield the catalogue as newline-delimited JSON, one product per line.
+
+        Args:
+            include_brand_name (bool, optional): Whether to add the brand name. Defaults to False.
+
+        Yields:
+            str: A JSON document followed by a newline.
+        """
+        for row in cls.rows(include_brand_name):
+            yield json.dumps(row, ensure_ascii=False) + "\n"
+
+    @classmethod
+    def as_csv(cls, include_brand_name: bool = False) -> Iterator[str]:
+        """
+        Yield the catalogue as CSV, starting with a header row.
+
+        Args:
+            include_brand_name (bool, optional): Whether to add the brand name. Defaults to False.
+
+        Yields:
+            str: A CSV line.
+        """
+        writer = csv.writer(_Echo())
+        fields = cls.fields(include_brand_name)
+        yield writer.writerow(fields)
+
+        for row in cls.rows(include_brand_name):
+            yield writer.writerow([row[field] for field in fields])
+
+
+class _Echo:
+    """File-like object whose `write` returns the value, used to stream CSV rows."""
+
+    def write(self, value: str) -> str:
+        return value
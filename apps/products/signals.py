@@ -0,0 +1,66 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.products.cache import ProductCache
+from apps.products.changes import CatalogueChangeFeed
+from apps.products.models import Brand, Product
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=Brand)
+@receiver(post_delete, sender=Brand)
+def invalidate_product_cache(sender, **kwargs):
+    """
+    Invalidate cached product representations when the catalogue changes.
+
+    The cache is invalidated right away and again once the transaction
+    commits, so a request reading the old rows before the commit cannot
+    leave a stale entry behind.
+
+    Args:
+        sender (Model): The model class that sent the signal.
+        **kwargs: Additional signal arguments.
+
+    Returns:
+        None
+    """
+    ProductCache.invalidate()
+    transaction.on_commit(ProductCache.invalidate)
+
+
+@receiver(pre_save, sender=Product)
+@receiver(pre_save, sender=Brand)
+def stamp_change_seq(sender, instance, raw=False, **kwargs):
+    """
+    Move a product or brand to the head of the catalogue change feed.
+
+    Args:
+        sender (Model): The model class that sent the signal.
+        instance (Product | Brand): The instance being saved.
+        raw (bool, optional): Whether the instance is being loaded from a fixture.
+        **kwargs: Additional signal arguments.
+
+    Returns:
+        None
+    """
+    if not raw:
+        CatalogueChangeFeed.stamp(instance)
+
+
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=Brand)
+def record_catalogue_tombstone(sender, instance, **kwargs):
+    """
+    Publish the deletion of a product or brand in the catalogue change feed.
+
+    Args:
+        sender (Model): The model class that sent the signal.
+        instance (Product | Brand): The deleted instance.
+        **kwargs: Additional signal arguments.
+
+    Returns:
+        None
+    """
+    CatalogueChangeFeed.record_deletion(instance)
@@ -1,23 +1,70 @@
+import logging
+from functools import partial
+
 from celery import shared_task
+from celery.signals import worker_shutting_down
 from django.conf import settings
-from geoip2.database import Reader
+from django.db import InterfaceError, OperationalError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
+from apps.accounts.services import StaffRecipientService
+from apps.commons.geolocation import GeoLocationService
 from apps.commons.services import EmailService
 
+from .buffers import get_visit_buffer
+from .changes import CatalogueChangeFeed
 from .models import Product, ProductRetrieve
+from .notifications import ProductChangeDigest
+from .parsers import UserAgentParser
+from .partitions import ProductRetrievePartitions
+from .rollups import ProductVisitRollup
+from .visits import VisitColumns
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_COUNTRY = "México"
 DEFAULT_CITY = "Ciudad de México"
 
 
+def _enrich_metadata(metadata: dict) -> dict:
+    """
+    Add geolocation information to the visit metadata.
+
+    User-Agent details are also added when the web tier deferred parsing.
+
+    Args:
+        metadata (dict): Metadata about the retrieval event, including the client's IP address.
+
+    Returns:
+        dict: The same metadata, updated with the country and city.
+    """
+    if "user_agent" in metadata and "device_type" not in metadata:
+        ua = UserAgentParser.parse(metadata["user_agent"])
+        metadata.update(UserAgentParser.describe(ua))
+
+    country, city = GeoLocationService.locate(metadata.get("ip"))
+    metadata.update(
+        {
+            "country": country or DEFAULT_COUNTRY,
+            "city": city or DEFAULT_CITY,
+        }
+    )
+
+    return metadata
+
+
 @shared_task
 def track_product_retrieve(product_id: int, metadata: dict):
     """
     Tracks a product retrieval event and stores metadata.
 
-    This task retrieves a product by its ID, enriches the provided metadata
-    with geolocation information based on the client's IP address, and stores
-    the data in the `ProductRetrieve` model.
+    This task enriches the provided metadata with geolocation information
+    based on the client's IP address and stores the visit in the
+    `ProductRetrieve` model, unless the product no longer exists.
+
+    New visits go through the visit buffer and `flush_product_retrieves`;
+    this task is kept to consume messages enqueued before that change.
 
     Args:
         product_id (int): The ID of the product being retrieved.
@@ -26,26 +73,188 @@ def track_product_retrieve(product_id: int, metadata: dict):
     Returns:
         None
     """
+    _write_product_retrieves(
+        [
+            {
+                "product_id": product_id,
+                "metadata": metadata,
+                "visited_at": timezone.now().isoformat(),
+            }
+        ]
+    )
+
+
+def _write_product_retrieves(events: list[dict]) -> int:
+    """
+    Persist a chunk of buffered visit events with a single `bulk_create`.
+
+    The metadata is enriched and split into the typed visit columns. Events
+    pointing to products that no longer exist are discarded.
+
+    Args:
+        events (list[dict]): Visit events with `product_id`, `metadata` and `visited_at`.
+
+    Returns:
+        int: The number of `ProductRetrieve` rows created.
+    """
+    product_ids = {event["product_id"] for event in events}
+    existing_ids = set(
+        Product.objects.filter(id__in=product_ids).values_list("id", flat=True)
+    )
+
+    events = [event for event in events if event["product_id"] in existing_ids]
+    columns = VisitColumns.from_metadata(
+        [_enrich_metadata(event["metadata"]) for event in events]
+    )
+
+    retrieves = [
+        ProductRetrieve(
+            product_id=event["product_id"],
+            visited_at=parse_datetime(event["visited_at"]),
+            **values,
+        )
+        for event, values in zip(events, columns)
+    ]
+
+    ProductRetrieve.objects.bulk_create(retrieves)
+    return len(retrieves)
+
+
+def _write_or_dead_letter(buffer, events: list[dict]) -> int:
+    """
+    Store the events of a failed chunk, setting aside the ones that fail.
+
+    The chunk is split in halves until the failing events are isolated, so
+    the other events are still stored. Each event that fails on its own is
+    logged and moved to the buffer's dead letters.
+
+    Args:
+        buffer (VisitBuffer): The visit buffer the events were drained from.
+        events (list[dict]): The visit events to store.
+
+    Returns:
+        int: The number of `ProductRetrieve` rows created.
+    """
     try:
-        product = Product.objects.get(id=product_id)
-        reader = Reader(settings.GEOIP_DB_PATH)
-        ip = metadata.get("ip")
+        with transaction.atomic():
+            return _write_product_retrieves(events)
+    except Exception:
+        if len(events) > 1:
+            middle = len(events) // 2
+            return _write_or_dead_letter(
+                buffer, events[:middle]
+            ) + _write_or_dead_letter(buffer, events[middle:])
+
+        logger.exception("Dead-lettering visit event %s", events[0])
+        buffer.dead_letter(events)
+        return 0
+
+
+@shared_task
+def flush_product_retrieves(batch_size: int | None = None) -> int:
+    """
+    Drain the visit buffer and store its events in chunks.
+
+    Each chunk of at most `batch_size` events is written with one
+    `bulk_create`. If the database is unreachable, the chunk is put back in
+    the buffer so it is retried on the next flush. Any other failure is
+    caused by the events themselves: the chunk is split to store the valid
+    events and dead-letter the failing ones, so a bad event is never
+    retried ahead of the rest.
+
+    Args:
+        batch_size (int, optional): Events per chunk. Defaults to `VISIT_BUFFER_BATCH_SIZE`.
+
+    Returns:
+        int: The number of `ProductRetrieve` rows created.
+    """
+    batch_size = batch_size or settings.VISIT_BUFFER_BATCH_SIZE
+    buffer = get_visit_buffer()
+    created = 0
+
+    while True:
+        events = buffer.drain(batch_size)
+        if not events:
+            break
 
         try:
-            response = reader.city(ip)
-            metadata.update(
-                {
-                    "country": response.country.name or DEFAULT_COUNTRY,
-                    "city": response.city.name or DEFAULT_CITY,
-                }
-            )
+            with transaction.atomic():
+                created += _write_product_retrieves(events)
+        except (InterfaceError, OperationalError):
+            buffer.requeue(events)
+            raise
         except Exception:
-            metadata.update({"country": DEFAULT_COUNTRY, "city": DEFAULT_CITY})
+            created += _write_or_dead_letter(buffer, events)
+
+        if len(events) < batch_size:
+            break
+
+    return created
+
+
+@worker_shutting_down.connect
+def flush_product_retrieves_on_shutdown(**kwargs):
+    """
+    Drain the visit buffer when a Celery worker shuts down cleanly.
+
+    Returns:
+        None
+    """
+    flush_product_retrieves()
+
+
+@shared_task
+def rollup_product_visits() -> int:
+    """
+    Aggregate new product visits into the visit statistics.
+
+    Returns:
+        int: The number of visits aggregated.
+    """
+    return ProductVisitRollup.run()
+
+
+@shared_task
+def maintain_product_retrieve_partitions() -> dict[str, list[str]]:
+    """
+    Create the upcoming visit partitions and remove the expired ones.
+
+    Returns:
+        dict[str, list[str]]: The partitions created and removed.
+    """
+    return ProductRetrievePartitions.maintain()
+
+
+@shared_task
+def purge_catalogue_tombstones() -> int:
+    """
+    Delete the catalogue tombstones past their retention period.
+
+    Returns:
+        int: The number of tombstones deleted.
+    """
+    return CatalogueChangeFeed.purge_tombstones()
+
+
+@shared_task
+def send_product_change_digest() -> int:
+    """
+    Send the pending product changes as one digest email per staff member.
+
+    The digests are sent together by `send_product_update_emails` once the
+    consumed change events are deleted; that task retries the digests that
+    fail to send, so they are not lost with the events.
+
+    Returns:
+        int: The number of digests sent.
+    """
+    with transaction.atomic():
+        digests = ProductChangeDigest.collect()
 
-        reader.close()
-        ProductRetrieve.objects.create(product=product, metadata=metadata)
-    except Product.DoesNotExist:
-        pass
+        if digests:
+            transaction.on_commit(partial(send_product_update_emails.delay, digests))
+
+    return len(digests)
 
 
 @shared_task
@@ -65,3 +274,63 @@ def send_product_update_email(subject: str, content: str, to_emails: list[str]):
         None
     """
     EmailService.send_email(subject, content, to_emails)
+
+
+@shared_task(bind=True, max_retries=5)
+def send_product_update_emails(self, messages: list[tuple[str, str, list[str]]]) -> int:
+    """
+    Send many product notification emails over the shared SES client.
+
+    The messages that fail are retried with an exponential backoff, since
+    their source (e.g. the consumed change events of a digest) is gone.
+
+    Args:
+        messages (list[tuple[str, str, list[str]]]): The subject, content and recipients of each email.
+
+    Raises:
+        Retry: If some emails failed and will be sent again.
+        RuntimeError: If some emails still fail after the last retry.
+
+    Returns:
+        int: The number of emails sent.
+    """
+    results = EmailService.send_bulk(messages)
+    failed = [
+        message
+        for message, result in zip(messages, results)
+        if result["error"] is not None
+    ]
+
+    if failed:
+        raise self.retry(
+            args=[failed],
+            countdown=60 * 2**self.request.retries,
+            exc=RuntimeError(f"Failed to send {len(failed)} product emails"),
+        )
+
+    return len(messages)
+
+
+@shared_task
+def send_staff_notification(
+    subject: str, content: str, exclude_email: str | None = None
+) -> int:
+    """
+    Send an email notification to the active staff members.
+
+    Args:
+        subject (str): The subject of the email.
+        content (str): The body content of the email.
+        exclude_email (str, optional): An email left out, usually the author of the change.
+
+    Returns:
+        int: The number of recipients.
+    """
+    to_emails = [
+        email for email in StaffRecipientService.get_emails() if email != exclude_email
+    ]
+
+    if to_emails:
+        EmailService.send_email(subject, content, to_emails)
+
+    return len(to_emails)
@@ -1,15 +1,36 @@
+from django.db.models import Count, Max, Min
 from django.db.models.deletion import ProtectedError
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from apps.commons.atomic import AtomicWriteMixin
+from apps.commons.conditional import ConditionalGetMixin, content_etag
+from apps.commons.pagination import CursorOrLimitOffsetPagination
+from apps.products.cache import ProductCache
 from apps.products.models.brand import Brand
-from apps.products.serializers.brand import BrandSerializer
+from apps.products.serializers.brand import BrandSerializer, BrandStatsSerializer
+
+INCLUDE_STATS = OpenApiParameter(
+    "include_stats",
+    OpenApiTypes.BOOL,
+    description="Add the product count and price range of every brand.",
+)
 
 
 @extend_schema(tags=["brands"])
-class BrandViewSet(ModelViewSet):
+@extend_schema_view(
+    list=extend_schema(
+        parameters=[INCLUDE_STATS],
+        responses={200: BrandStatsSerializer(many=True)},
+    ),
+    retrieve=extend_schema(
+        parameters=[INCLUDE_STATS], responses={200: BrandStatsSerializer}
+    ),
+)
+class BrandViewSet(AtomicWriteMixin, ConditionalGetMixin, ModelViewSet):
     """
     ViewSet for managing product brands.
 
@@ -21,15 +42,120 @@ class BrandViewSet(ModelViewSet):
         queryset (QuerySet): The set of all `Brand` objects.
         serializer_class (Serializer): The serializer used for brand data.
         lookup_field (str): Specifies that the `name` field is used for lookups.
+        pagination_class (Pagination): Limit/offset pagination with opt-in
+            keyset pagination (`?pagination=cursor`) and count skipping (`?count=false`).
+
+    With `?include_stats=true`, brands carry their product count and price
+    range, annotated in the same query that reads them. Those responses are
+    cached with the product cache, whose generation every product and brand
+    write bumps, and answered with a 304 when unchanged.
 
     Methods:
+        - get_queryset: Annotates the product statistics when requested.
+        - get_serializer_class: Picks the serializer with statistics when requested.
+        - list: Lists brands, answering conditional requests from an aggregate.
+        - retrieve: Retrieves a brand, answering conditional requests from its timestamp.
         - destroy: Handles deletion of a brand and prevents deletion if it is
           referenced by other objects.
     """
 
-    queryset = Brand.objects.all()
+    queryset = Brand.objects.order_by("id")
     serializer_class = BrandSerializer
     lookup_field = "name"
+    pagination_class = CursorOrLimitOffsetPagination
+
+    def get_queryset(self):
+        """
+        Return the brands, annotated with their product statistics if requested.
+
+        Returns:
+            QuerySet: The brands.
+        """
+        queryset = super().get_queryset()
+
+        if self._include_stats():
+            queryset = queryset.annotate(
+                product_count=Count("products"),
+                min_price=Min("products__price"),
+                max_price=Max("products__price"),
+            )
+
+        return queryset
+
+    def get_serializer_class(self):
+        """
+        Return the serializer with product statistics if they were requested.
+
+        Returns:
+            type[Serializer]: The serializer class.
+        """
+        return BrandStatsSerializer if self._include_stats() else BrandSerializer
+
+    def list(self, request, *args, **kwargs):
+        """
+        List brands.
+
+        The validators are computed from the number of matching brands and
+        their latest modification, so an unchanged list is answered with a
+        304 response after a single aggregate query.
+
+        Args:
+            request (Request): The HTTP request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Response: The serialized page of brands, or a 304 response.
+        """
+        if self._include_stats():
+            return self._cached_response(request, super().list, *args, **kwargs)
+
+        version = self.filter_queryset(self.get_queryset()).aggregate(
+            count=Count("id"), updated_at=Max("updated_at")
+        )
+        last_modified = version["updated_at"] and version["updated_at"].timestamp()
+        etag = content_etag([request.get_full_path(), version])
+
+        return self.not_modified(request, etag, last_modified) or self.add_validators(
+            super().list(request, *args, **kwargs), etag, last_modified
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve a brand by its name.
+
+        The brand's modification time is looked up first, so a conditional
+        request for an unchanged brand is answered with a 304 response
+        without loading or serializing the row.
+
+        Args:
+            request (Request): The HTTP request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Response: The serialized brand, or a 304 response.
+        """
+        if self._include_stats():
+            return self._cached_response(request, super().retrieve, *args, **kwargs)
+
+        name = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        updated_at = (
+            self.get_queryset()
+            .filter(name=name)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+
+        if updated_at is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        last_modified = updated_at.timestamp()
+        etag = content_etag([name, updated_at])
+
+        return self.not_modified(request, etag, last_modified) or self.add_validators(
+            super().retrieve(request, *args, **kwargs), etag, last_modified
+        )
 
     def destroy(self, request, *args, **kwargs):
         """
@@ -60,3 +186,32 @@ class BrandViewSet(ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def _include_stats(self) -> bool:
+        return (
+            self.action in ("list", "retrieve")
+            and self.request.query_params.get("include_stats") == "true"
+        )
+
+    def _cached_response(self, request, handler, *args, **kwargs):
+        """
+        Serve a response with product statistics from the product cache.
+
+        Args:
+            request (Request): The HTTP request object.
+            handler (Callable): Builds the response on a cache miss.
+            *args: Additional positional arguments for `handler`.
+            **kwargs: Additional keyword arguments for `handler`.
+
+        Returns:
+            Response: The cached response data, or a 304 response.
+        """
+
+        def build_entry():
+            data = handler(request, *args, **kwargs).data
+            return {"data": data, "etag": content_etag(data)}
+
+        entry = ProductCache.get_list(request, build_entry)
+        return self.not_modified(request, entry["etag"]) or self.add_validators(
+            Response(entry["data"]), entry["etag"]
+        )
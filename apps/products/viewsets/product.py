@@ -1,16 +1,102 @@
-from drf_spectacular.utils import extend_schema
+from django.db import transaction
+from django.db.models import Sum
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+    extend_schema_view,
+)
 from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from apps.commons.atomic import AtomicWriteMixin
+from apps.commons.conditional import ConditionalGetMixin, content_etag
+from apps.commons.filters import StableOrderingFilter
+from apps.commons.pagination import CursorOrLimitOffsetPagination
+from apps.products.cache import ProductCache
+from apps.products.changes import CatalogueChangeFeed
+from apps.products.filters import ProductFilterBackend
 from apps.products.models.product import Product
-from apps.products.serializers.product import ProductSerializer
-from apps.products.services import ProductEmailService, ProductVisitMetadataBuilder
-from apps.products.tasks import track_product_retrieve
+from apps.products.models.statistics import ProductVisitStat
+from apps.products.notifications import ProductChangeDigest
+from apps.products.search import ProductSearch
+from apps.products.serializers.changes import (
+    CatalogueChangePageSerializer,
+    CatalogueChangeQuerySerializer,
+)
+from apps.products.serializers.product import (
+    ProductBulkUpsertResultSerializer,
+    ProductBulkUpsertSerializer,
+    ProductFilterQuerySerializer,
+    ProductSearchQuerySerializer,
+    ProductSerializer,
+)
+from apps.products.serializers.statistics import (
+    ProductVisitStatQuerySerializer,
+    ProductVisitStatSerializer,
+)
+from apps.products.services import (
+    ProductBulkUpsertService,
+    ProductEmailService,
+    ProductExportService,
+    ProductVisitMetadataBuilder,
+    ProductVisitTracker,
+)
 
 
 @extend_schema(tags=["products"])
-class ProductViewSet(ModelViewSet):
+@extend_schema_view(
+    bulk_upsert=extend_schema(
+        request=ProductBulkUpsertSerializer,
+        responses={200: ProductBulkUpsertResultSerializer},
+        description="Create or update many products keyed by SKU in one request.",
+    ),
+    export=extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "output",
+                OpenApiTypes.STR,
+                enum=["ndjson", "csv"],
+                description="Export format. Defaults to `ndjson`.",
+            ),
+            OpenApiParameter(
+                "include_brand",
+                OpenApiTypes.BOOL,
+                description="Add the brand name to every row.",
+            ),
+        ],
+        responses={200: OpenApiResponse(description="The streamed catalogue.")},
+        description="Stream the full product catalogue as NDJSON or CSV.",
+    ),
+    stats=extend_schema(
+        parameters=[ProductVisitStatQuerySerializer],
+        responses={200: ProductVisitStatSerializer(many=True)},
+        description="Aggregated visits of a product per hour or day.",
+    ),
+    search=extend_schema(
+        parameters=[ProductSearchQuerySerializer, ProductFilterQuerySerializer],
+        responses={200: ProductSerializer(many=True)},
+        description="Search products by SKU, name or brand name, best matches first.",
+    ),
+    changes=extend_schema(
+        parameters=[CatalogueChangeQuerySerializer],
+        responses={
+            200: CatalogueChangePageSerializer,
+            410: OpenApiResponse(description="The cursor expired; sync again."),
+        },
+        description=(
+            "Products and brands changed or deleted since a cursor, "
+            "in the order the changes happened."
+        ),
+    ),
+)
+class ProductViewSet(AtomicWriteMixin, ConditionalGetMixin, ModelViewSet):
     """
     ViewSet for managing products.
 
@@ -22,23 +108,72 @@ class ProductViewSet(ModelViewSet):
         queryset (QuerySet): The set of all products in the database.
         serializer_class (Serializer): The serializer used for product data.
         lookup_field (str): The field used to look up a product (SKU in this case).
+        pagination_class (Pagination): Limit/offset pagination with opt-in
+            keyset pagination (`?pagination=cursor`) and count skipping (`?count=false`).
+        filter_backends (list): Price range and brand filters, and ordering
+            by price or name (`?ordering=-price`), backed by composite indexes.
 
     Methods:
+        - list: Lists products, serving the response from the product cache.
         - retrieve: Retrieves a product and tracks unauthenticated user visits.
-        - update: Updates a product and sends an email notification to administrators.
+        - update: Updates a product and records the change for the staff digest.
+        - bulk_upsert: Creates or updates many products and sends a single summary.
+        - export: Streams the full catalogue as NDJSON or CSV.
+        - stats: Returns the aggregated visit statistics of a product.
+        - search: Searches products by SKU, name or brand name.
+        - changes: Returns the catalogue changes since a cursor.
+
+    List and detail responses carry `ETag` (and, for details, `Last-Modified`)
+    validators computed when the response is cached, so conditional requests
+    for unchanged resources get a 304 without any query or serialization.
     """
 
-    queryset = Product.objects.all()
+    queryset = (
+        Product.objects.select_related("brand").defer("search_vector").order_by("id")
+    )
     serializer_class = ProductSerializer
     lookup_field = "sku"
+    pagination_class = CursorOrLimitOffsetPagination
+    filter_backends = [ProductFilterBackend, StableOrderingFilter]
+    ordering_fields = ["price", "name", "id"]
+    ordering = ["id"]
+
+    def list(self, request, *args, **kwargs):
+        """
+        List products.
+
+        The paginated response data and its ETag are cached per request path
+        and query string until the catalogue changes.
+
+        Args:
+            request (Request): The HTTP request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Response: The serialized page of products.
+        """
+        list_products = super().list
+
+        def build_entry():
+            data = list_products(request, *args, **kwargs).data
+            return {"data": data, "etag": content_etag(data)}
+
+        entry = ProductCache.get_list(request, build_entry)
+        return self.not_modified(request, entry["etag"]) or self.add_validators(
+            Response(entry["data"]), entry["etag"]
+        )
 
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve a product by its SKU.
 
-        If the user is not authenticated, it tracks the product visit by
-        collecting metadata (e.g., IP address, device type) and sending it
-        to a background task.
+        The serialized product is served from the product cache. On a miss the
+        product is resolved once (with its brand joined) and serialized. If
+        the user is not authenticated, it tracks the product visit by
+        collecting metadata (e.g., IP address, device type) and buffering it
+        for the batched visit ingestion, on cache hits as well. A client
+        whose copy is current gets a 304 response.
 
         Args:
             request (Request): The HTTP request object.
@@ -48,21 +183,42 @@ class ProductViewSet(ModelViewSet):
         Returns:
             Response: The serialized product data.
         """
-        product = self.get_object()
-        response = super().retrieve(request, *args, **kwargs)
+        sku = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        entry = ProductCache.get_detail(sku, self._build_detail_entry)
 
         if not request.user.is_authenticated:
             metadata = ProductVisitMetadataBuilder(request).build()
-            track_product_retrieve.delay(product.id, metadata)
+            ProductVisitTracker.track(entry["id"], metadata)
 
-        return response
+        validators = (entry["etag"], entry["last_modified"])
+        return self.not_modified(request, *validators) or self.add_validators(
+            Response(entry["data"]), *validators
+        )
+
+    def _build_detail_entry(self) -> dict:
+        """
+        Build the cacheable detail entry for the requested product.
+
+        Returns:
+            dict: The product ID, used for visit tracking, its serialized data and its validators.
+        """
+        product = self.get_object()
+        data = self.get_serializer(product).data
+        last_modified = max(product.updated_at, product.brand.updated_at)
+        return {
+            "id": product.id,
+            "data": data,
+            "etag": content_etag(data),
+            "last_modified": last_modified.timestamp(),
+        }
 
     def update(self, request, *args, **kwargs):
         """
-        Update a product and sends an email notification.
+        Update a product and record the change for the staff digest.
 
-        This method updates the product with the provided data and sends an
-        email notification to administrators about the update.
+        This method updates the product with the provided data and records
+        the change in the same transaction; it is emailed to administrators
+        in the next digest.
 
         Args:
             request (Request): The HTTP request object.
@@ -76,7 +232,187 @@ class ProductViewSet(ModelViewSet):
         partial = kwargs.pop("partial", False)
         serializer = self.get_serializer(product, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
-        ProductEmailService.send_email(product, request.user)
+
+        with transaction.atomic():
+            self.perform_update(serializer)
+            ProductChangeDigest.record(product, request.user)
 
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["post"], url_path="bulk-upsert")
+    def bulk_upsert(self, request):
+        """
+        Create or update many products keyed by SKU.
+
+        The whole payload is validated in one pass, brands are resolved by
+        name with a single query and products are written in chunks. A single
+        summary email is queued in the same transaction for the whole batch.
+
+        Args:
+            request (Request): The HTTP request object with the products to upsert.
+
+        Returns:
+            Response: The number of received, created and updated products.
+        """
+        serializer = ProductBulkUpsertSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        products = serializer.validated_data["products"]
+
+        with transaction.atomic():
+            summary = ProductBulkUpsertService.upsert(
+                products, serializer.validated_data["brands"]
+            )
+            ProductEmailService.send_bulk_email(
+                summary, [product["sku"] for product in products], request.user
+            )
+
+        return Response(
+            ProductBulkUpsertResultSerializer(summary).data, status=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        Stream the full product catalogue.
+
+        The `output` query parameter selects NDJSON (default) or CSV, and
+        `include_brand=true` adds the brand name to every row. Products are
+        read in chunks and streamed, so memory use is constant regardless of
+        the catalogue size.
+
+        Args:
+            request (Request): The HTTP request object.
+
+        Returns:
+            StreamingHttpResponse: The streamed catalogue, or a 400 response
+            for an unknown format.
+        """
+        output = request.query_params.get("output", "ndjson")
+        include_brand = request.query_params.get("include_brand") == "true"
+        formats = {
+            "ndjson": (ProductExportService.as_ndjson, "application/x-ndjson"),
+            "csv": (ProductExportService.as_csv, "text/csv"),
+        }
+
+        if output not in formats:
+            return Response(
+                {"detail": f"Unsupported export format: {output}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        stream, content_type = formats[output]
+        response = StreamingHttpResponse(
+            stream(include_brand), content_type=content_type
+        )
+        response["Content-Disposition"] = f'attachment; filename="products.{output}"'
+        return response
+
+    @action(
+        detail=True,
+        methods=["get"],
+        permission_classes=[IsAuthenticated],
+        pagination_class=None,
+    )
+    def stats(self, request, sku=None):
+        """
+        Return the aggregated visit statistics of a product.
+
+        Statistics are read from the pre-aggregated `ProductVisitStat` rows,
+        summed per bucket and per requested breakdown dimension.
+
+        Args:
+            request (Request): The HTTP request object.
+            sku (str): The SKU of the product.
+
+        Returns:
+            Response: The visit counts per bucket, ordered by bucket start.
+        """
+        product = self.get_object()
+        query = ProductVisitStatQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        dimensions = params["breakdown"]
+
+        stats = ProductVisitStat.objects.filter(
+            product=product, period=params["period"]
+        )
+
+        if "since" in params:
+            stats = stats.filter(bucket_start__gte=params["since"])
+
+        if "until" in params:
+            stats = stats.filter(bucket_start__lt=params["until"])
+
+        rows = (
+            stats.values("bucket_start", *dimensions)
+            .annotate(visits=Sum("visits"))
+            .order_by("bucket_start", *dimensions)
+        )
+
+        return Response(ProductVisitStatSerializer(rows, many=True).data)
+
+    @action(detail=False, methods=["get"], pagination_class=LimitOffsetPagination)
+    def search(self, request):
+        """
+        Search products by SKU, name or brand name.
+
+        Results can be narrowed with the list filters, are ranked by
+        relevance, paginated with limit/offset (keyset pagination cannot
+        follow a rank) and cached like the product list.
+
+        Args:
+            request (Request): The HTTP request object.
+
+        Returns:
+            Response: The serialized page of matching products.
+        """
+        query = ProductSearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        def build_entry():
+            products = ProductSearch.search(
+                ProductFilterBackend().filter_queryset(
+                    request, self.get_queryset(), self
+                ),
+                query.validated_data["q"],
+            )
+            page = self.paginate_queryset(products)
+            data = self.get_paginated_response(
+                self.get_serializer(page, many=True).data
+            ).data
+            return {"data": data, "etag": content_etag(data)}
+
+        entry = ProductCache.get_list(request, build_entry)
+        return self.not_modified(request, entry["etag"]) or self.add_validators(
+            Response(entry["data"]), entry["etag"]
+        )
+
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def changes(self, request):
+        """
+        Return the products and brands changed or deleted since a cursor.
+
+        Without a cursor the feed starts from the beginning, which is a full
+        sync. Each page carries the cursor to poll with next; only the rows
+        stamped after it are read. A cursor older than the purged tombstones
+        gets a 410 response, since deletions may have been missed.
+
+        Args:
+            request (Request): The HTTP request object.
+
+        Returns:
+            Response: The changes in sequence order, the next cursor and whether more changes are pending.
+        """
+        query = CatalogueChangeQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        since = query.validated_data.get("cursor")
+
+        if since is not None and CatalogueChangeFeed.is_expired(since):
+            return Response(
+                {"detail": "The cursor has expired; sync again without a cursor."},
+                status=status.HTTP_410_GONE,
+            )
+
+        page = CatalogueChangeFeed.read(since or 0, query.validated_data["limit"])
+        return Response(CatalogueChangePageSerializer(page).data)
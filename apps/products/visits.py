@@ -0,0 +1,144 @@
+import ipaddress
+
+from apps.products.models import ProductRetrieve, VisitLocation, VisitUserAgent
+
+
+class VisitColumns:
+    """
+    Conversion of visit metadata into the typed `ProductRetrieve` columns.
+
+    The User-Agents and locations of a whole batch are resolved with one
+    `bulk_create` and one query per lookup table, so storing a batch of
+    visits costs a constant number of queries.
+
+    Methods:
+    - from_metadata: Returns the column values for a batch of metadata.
+    """
+
+    @classmethod
+    def from_metadata(cls, metadatas: list[dict]) -> list[dict]:
+        """
+        Return the `ProductRetrieve` column values for a batch of metadata.
+
+        Args:
+            metadatas (list[dict]): Enriched visit metadata, as built by `ProductVisitMetadataBuilder` and the visit tasks.
+
+        Returns:
+            list[dict]: The column values of each visit, in the same order.
+        """
+        user_agents = cls._user_agents(metadatas)
+        locations = cls._locations(metadatas)
+
+        return [
+            {
+                "ip": cls._ip(metadata.get("ip")),
+                "device_type": cls._device_type(metadata.get("device_type")),
+                "user_agent_id": user_agents.get(metadata.get("user_agent")),
+                "location_id": locations.get(cls._location_key(metadata)),
+                "referer": metadata.get("referer") or "",
+                "metadata": None,
+            }
+            for metadata in metadatas
+        ]
+
+    @staticmethod
+    def _ip(value: str | None) -> str | None:
+        """
+        Return the visit IP address, or None if it is not a valid address.
+
+        The IP may come from the client-supplied `X-Forwarded-For` header, so
+        it is validated before reaching the `inet` column.
+
+        Args:
+            value (str, optional): The IP address from the visit metadata.
+
+        Returns:
+            str | None: The normalized IP address.
+        """
+        try:
+            return str(ipaddress.ip_address(value.strip()))
+        except (AttributeError, ValueError):
+            return None
+
+    @staticmethod
+    def _device_type(label: str | None) -> int:
+        for value, device_label in ProductRetrieve.DeviceType.choices:
+            if device_label == label:
+                return value
+
+        return ProductRetrieve.DeviceType.UNKNOWN
+
+    @staticmethod
+    def _location_key(metadata: dict) -> tuple[str, str] | None:
+        if not metadata.get("country"):
+            return None
+
+        return metadata["country"], metadata.get("city") or ""
+
+    @classmethod
+    def _user_agents(cls, metadatas: list[dict]) -> dict[str, int]:
+        """
+        Return the lookup IDs of the User-Agents, creating the missing ones.
+
+        Args:
+            metadatas (list[dict]): Enriched visit metadata.
+
+        Returns:
+            dict[str, int]: Lookup IDs keyed by the raw User-Agent header.
+        """
+        rows = {}
+
+        for metadata in metadatas:
+            user_agent = metadata.get("user_agent")
+
+            if not user_agent:
+                continue
+
+            user_agent_hash = VisitUserAgent.hash(user_agent)
+
+            if user_agent_hash not in rows:
+                rows[user_agent_hash] = VisitUserAgent(
+                    user_agent_hash=user_agent_hash,
+                    user_agent=user_agent,
+                    device=metadata.get("device") or "",
+                    os=metadata.get("os") or "",
+                    browser=metadata.get("browser") or "",
+                )
+
+        if not rows:
+            return {}
+
+        VisitUserAgent.objects.bulk_create(rows.values(), ignore_conflicts=True)
+        return dict(
+            VisitUserAgent.objects.filter(user_agent_hash__in=rows).values_list(
+                "user_agent", "id"
+            )
+        )
+
+    @classmethod
+    def _locations(cls, metadatas: list[dict]) -> dict[tuple[str, str], int]:
+        """
+        Return the lookup IDs of the locations, creating the missing ones.
+
+        Args:
+            metadatas (list[dict]): Enriched visit metadata.
+
+        Returns:
+            dict[tuple[str, str], int]: Lookup IDs keyed by `(country, city)`.
+        """
+        keys = {cls._location_key(metadata) for metadata in metadatas} - {None}
+
+        if not keys:
+            return {}
+
+        VisitLocation.objects.bulk_create(
+            [VisitLocation(country=country, city=city) for country, city in keys],
+            ignore_conflicts=True,
+        )
+        rows = VisitLocation.objects.filter(
+            country__in={country for country, _ in keys},
+            city__in={city for _, city in keys},
+        ).values_list("id", "country", "city")
+        return {
+            (country, city): pk for pk, country, city in rows if (country, city) in keys
+        }
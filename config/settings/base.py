@@ -10,10 +10,13 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import importlib.util
 import os
 from datetime import timedelta
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -39,6 +42,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 THIRD_PARTY_APPS = [
     "rest_framework",
@@ -89,9 +93,45 @@ DATABASES = {
         "PORT": os.getenv("DATABASE_PORT", "5432"),
         "USER": os.getenv("DATABASE_USER", "root"),
         "PASSWORD": os.getenv("DATABASE_PASS", "root"),
+        # Web requests and Celery tasks reuse their connection for
+        # CONN_MAX_AGE seconds, checking it is alive before reusing it.
+        "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": (
+            os.getenv("DATABASE_CONN_HEALTH_CHECKS", "True").lower() == "true"
+        ),
+        "OPTIONS": {},
     }
 }
 
+# A per-process connection pool replaces persistent connections. Requires
+# psycopg 3 with its pool extra (`pip install "psycopg[pool]"`).
+if os.getenv("DATABASE_POOL", "False").lower() == "true":
+    if importlib.util.find_spec("psycopg_pool") is None:
+        raise ImproperlyConfigured(
+            'DATABASE_POOL requires psycopg 3: pip install "psycopg[pool]"'
+        )
+
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", "10")),
+        "timeout": int(os.getenv("DATABASE_POOL_TIMEOUT", "10")),
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("CACHE_URL", "redis://redis:6379/1"),
+    }
+}
+
+PRODUCT_CACHE_TIMEOUT = int(os.getenv("PRODUCT_CACHE_TIMEOUT", "300"))
+PRODUCT_CACHE_LOCK_TIMEOUT = int(os.getenv("PRODUCT_CACHE_LOCK_TIMEOUT", "10"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -142,10 +182,19 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticatedOrReadOnly"
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
     "PAGE_SIZE": 10,
+    # Proxies in front of the app. Throttles take the client IP from the
+    # matching X-Forwarded-For entry, or REMOTE_ADDR when 0, so clients
+    # cannot pick their own identity.
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "0")),
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": os.getenv("LOGIN_IP_THROTTLE_RATE", "20/min"),
+        "login_email": os.getenv("LOGIN_EMAIL_THROTTLE_RATE", "5/min"),
+        "token_refresh": os.getenv("TOKEN_REFRESH_THROTTLE_RATE", "30/min"),
+    },
 }
 
 SPECTACULAR_SETTINGS = {
@@ -156,7 +205,7 @@ SPECTACULAR_SETTINGS = {
     "COMPONENT_SPLIT_REQUEST": True,
     "SWAGGER_UI_SETTINGS": {"persistAuthorization": True},
     "AUTHENTICATION_WHITELIST": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication"
+        "apps.accounts.authentication.CachedJWTAuthentication"
     ],
     "SECURITY": [{"jwtAuth": []}],
     "COMPONENTS": {
@@ -173,12 +222,96 @@ SPECTACULAR_SETTINGS = {
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
+CELERY_BEAT_SCHEDULE = {
+    "relay-outbox": {
+        "task": "apps.commons.tasks.relay_outbox",
+        "schedule": float(os.getenv("OUTBOX_RELAY_INTERVAL", "1")),
+    },
+    "flush-product-retrieves": {
+        "task": "apps.products.tasks.flush_product_retrieves",
+        "schedule": float(os.getenv("VISIT_BUFFER_FLUSH_INTERVAL", "10")),
+    },
+    "rollup-product-visits": {
+        "task": "apps.products.tasks.rollup_product_visits",
+        "schedule": float(os.getenv("PRODUCT_VISIT_ROLLUP_INTERVAL", "300")),
+    },
+    "send-product-change-digest": {
+        "task": "apps.products.tasks.send_product_change_digest",
+        "schedule": float(os.getenv("PRODUCT_CHANGE_DIGEST_INTERVAL", "300")),
+    },
+    "maintain-product-retrieve-partitions": {
+        "task": "apps.products.tasks.maintain_product_retrieve_partitions",
+        "schedule": 60 * 60 * 24,
+    },
+    "purge-catalogue-tombstones": {
+        "task": "apps.products.tasks.purge_catalogue_tombstones",
+        "schedule": 60 * 60 * 24,
+    },
+    "purge-revoked-tokens": {
+        "task": "apps.accounts.tasks.purge_revoked_tokens",
+        "schedule": 60 * 60 * 24,
+    },
+}
+
+OUTBOX_RELAY_BATCH_SIZE = int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "500"))
+
+VISIT_BUFFER_BACKEND = os.getenv("VISIT_BUFFER_BACKEND", "redis")
+VISIT_BUFFER_URL = os.getenv("VISIT_BUFFER_URL", CELERY_BROKER_URL)
+VISIT_BUFFER_KEY = os.getenv("VISIT_BUFFER_KEY", "products:visits")
+VISIT_BUFFER_BATCH_SIZE = int(os.getenv("VISIT_BUFFER_BATCH_SIZE", "500"))
+VISIT_BUFFER_DEAD_LETTER_MAX_SIZE = int(
+    os.getenv("VISIT_BUFFER_DEAD_LETTER_MAX_SIZE", "10000")
+)
+VISIT_DEFER_USER_AGENT_PARSING = (
+    os.getenv("VISIT_DEFER_USER_AGENT_PARSING", "False").lower() == "true"
+)
+USER_AGENT_CACHE_SIZE = int(os.getenv("USER_AGENT_CACHE_SIZE", "1024"))
+PRODUCT_VISIT_ROLLUP_BATCH_SIZE = int(
+    os.getenv("PRODUCT_VISIT_ROLLUP_BATCH_SIZE", "5000")
+)
+PRODUCT_VISIT_ROLLUP_LAG = int(os.getenv("PRODUCT_VISIT_ROLLUP_LAG", "60"))
+PRODUCT_RETRIEVE_PARTITIONS_AHEAD = int(
+    os.getenv("PRODUCT_RETRIEVE_PARTITIONS_AHEAD", "3")
+)
+PRODUCT_RETRIEVE_RETENTION_MONTHS = int(
+    os.getenv("PRODUCT_RETRIEVE_RETENTION_MONTHS", "12")
+)
+PRODUCT_RETRIEVE_RETENTION_MODE = os.getenv("PRODUCT_RETRIEVE_RETENTION_MODE", "drop")
+
+PRODUCT_BULK_UPSERT_MAX_ITEMS = int(os.getenv("PRODUCT_BULK_UPSERT_MAX_ITEMS", "10000"))
+PRODUCT_BULK_UPSERT_BATCH_SIZE = int(
+    os.getenv("PRODUCT_BULK_UPSERT_BATCH_SIZE", "1000")
+)
+PRODUCT_BULK_EMAIL_MAX_SKUS = 50
+STAFF_EMAILS_CACHE_TIMEOUT = int(os.getenv("STAFF_EMAILS_CACHE_TIMEOUT", "3600"))
+# Expose the login timings in a Server-Timing header (for benchmark_login).
+LOGIN_SERVER_TIMING = os.getenv("LOGIN_SERVER_TIMING", "False").lower() == "true"
+JWT_USER_CACHE_TIMEOUT = int(os.getenv("JWT_USER_CACHE_TIMEOUT", "60"))
+TOKEN_REVOCATION_BACKEND = os.getenv("TOKEN_REVOCATION_BACKEND", "redis")
+TOKEN_REVOCATION_URL = os.getenv("TOKEN_REVOCATION_URL", CELERY_BROKER_URL)
+TOKEN_REVOCATION_KEY_PREFIX = os.getenv(
+    "TOKEN_REVOCATION_KEY_PREFIX", "accounts:revoked"
+)
+PRODUCT_CHANGE_DIGEST_MAX_SKUS = int(os.getenv("PRODUCT_CHANGE_DIGEST_MAX_SKUS", "50"))
+PRODUCT_EXPORT_CHUNK_SIZE = int(os.getenv("PRODUCT_EXPORT_CHUNK_SIZE", "2000"))
+CATALOGUE_TOMBSTONE_RETENTION_DAYS = int(
+    os.getenv("CATALOGUE_TOMBSTONE_RETENTION_DAYS", "30")
+)
+
 GEOIP_DB_PATH = BASE_DIR.parent / "GeoLite2-City.mmdb"
+GEOIP_CACHE_SIZE = int(os.getenv("GEOIP_CACHE_SIZE", "10000"))
+GEOIP_CACHE_IPV4_PREFIX = int(os.getenv("GEOIP_CACHE_IPV4_PREFIX", "24"))
+GEOIP_RELOAD_CHECK_INTERVAL = float(os.getenv("GEOIP_RELOAD_CHECK_INTERVAL", "60"))
 
 AWS_REGION_NAME = os.environ.get("AWS_REGION_NAME", "us-east-1")
 AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.environ.get("AWS_SECRET_ACCESS_KEY")
 FROM_EMAIL = os.getenv("FROM_EMAIL", "no-reply@example.com")
+AWS_SES_ENDPOINT_URL = os.getenv("AWS_SES_ENDPOINT_URL")
+AWS_SES_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_SES_MAX_POOL_CONNECTIONS", "10"))
+AWS_SES_MAX_ATTEMPTS = int(os.getenv("AWS_SES_MAX_ATTEMPTS", "5"))
+AWS_SES_CONNECT_TIMEOUT = float(os.getenv("AWS_SES_CONNECT_TIMEOUT", "5"))
+AWS_SES_READ_TIMEOUT = float(os.getenv("AWS_SES_READ_TIMEOUT", "10"))
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=5),
@@ -8,12 +8,19 @@ DATABASES = {
         "NAME": ":memory:",
     }
 }
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
 
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
+VISIT_BUFFER_BACKEND = "local"
+TOKEN_REVOCATION_BACKEND = "local"
 AWS_ACCESS_KEY_ID = "fake-key"
 AWS_SECRET_ACCESS_KEY = "fake-secret"
 AWS_REGION_NAME = "us-east-1"
@@ -19,7 +19,7 @@ from django.urls import include, path
 from django.views.generic import RedirectView
 from drf_spectacular.views import SpectacularJSONAPIView, SpectacularSwaggerView
 
-from apps.accounts.authentication import (
+from apps.accounts.viewsets.token import (
     CustomTokenObtainPairView,
     CustomTokenRefreshView,
 )
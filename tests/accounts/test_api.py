@@ -1,13 +1,28 @@
+from unittest.mock import patch
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accounts.revocation import reset_revocation_store
+from apps.accounts.throttles import (
+    LoginEmailRateThrottle,
+    LoginIPRateThrottle,
+    TokenRefreshRateThrottle,
+)
 
 User = get_user_model()
 
 
 class CustomTokenObtainPairTest(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             email="user@example.com",
             password="testpassword",
@@ -25,6 +40,45 @@ class CustomTokenObtainPairTest(APITestCase):
         self.assertEqual(response.data["email"], self.user.email)
         self.assertEqual(response.data["user_id"], self.user.id)
 
+    def test_login_verifies_the_password_once(self):
+        with patch(
+            "django.contrib.auth.base_user.check_password", wraps=check_password
+        ) as mock_check, self.assertNumQueries(1):
+            response = self.client.post(
+                self.url, {"email": "user@example.com", "password": "testpassword"}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        mock_check.assert_called_once()
+
+    @override_settings(DEBUG=False, LOGIN_SERVER_TIMING=True)
+    def test_login_reports_hash_and_database_time(self):
+        for password in ("testpassword", "wrongpass"):
+            response = self.client.post(
+                self.url, {"email": "user@example.com", "password": password}
+            )
+
+            self.assertRegex(
+                response["Server-Timing"],
+                r"^hash;dur=[\d.]+, db;dur=[\d.]+, total;dur=[\d.]+$",
+            )
+
+    @override_settings(DEBUG=False, LOGIN_SERVER_TIMING=False)
+    def test_login_timings_are_only_logged_by_default(self):
+        with self.assertLogs("apps.accounts.viewsets.token", "INFO") as logs:
+            response = self.client.post(
+                self.url, {"email": "user@example.com", "password": "wrongpass"}
+            )
+
+        self.assertNotIn("Server-Timing", response)
+        self.assertIn("Login failed", logs.output[0])
+
+    def test_login_with_a_non_object_body_returns_error(self):
+        for body in (["user@example.com", "testpassword"], "user@example.com"):
+            response = self.client.post(self.url, body, format="json")
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_login_with_invalid_credentials_returns_error(self):
         response = self.client.post(
             self.url, {"email": "user@example.com", "password": "wrongpass"}
@@ -33,6 +87,120 @@ class CustomTokenObtainPairTest(APITestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.data, {"non_field_errors": ["Invalid credentials"]})
 
+    @patch.object(LoginEmailRateThrottle, "rate", "2/min", create=True)
+    def test_login_attempts_are_throttled_per_email_before_hashing(self):
+        for _ in range(2):
+            self.client.post(
+                self.url, {"email": "USER@example.com", "password": "wrongpass"}
+            )
+
+        with patch(
+            "django.contrib.auth.base_user.check_password"
+        ) as mock_check, self.assertNumQueries(0):
+            response = self.client.post(
+                self.url, {"email": "user@example.com", "password": "testpassword"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response)
+        mock_check.assert_not_called()
+
+        response = self.client.post(
+            self.url, {"email": "other@example.com", "password": "wrongpass"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(LoginIPRateThrottle, "rate", "2/min", create=True)
+    def test_login_attempts_are_throttled_per_ip(self):
+        for email in ("a@example.com", "b@example.com"):
+            self.client.post(self.url, {"email": email, "password": "wrongpass"})
+
+        response = self.client.post(
+            self.url, {"email": "c@example.com", "password": "wrongpass"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @patch.object(LoginIPRateThrottle, "rate", "2/min", create=True)
+    def test_spoofed_forwarded_for_does_not_reset_the_ip_limit(self):
+        for n in range(3):
+            response = self.client.post(
+                self.url,
+                {"email": f"{n}@example.com", "password": "wrongpass"},
+                HTTP_X_FORWARDED_FOR=f"10.0.0.{n}",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @patch.object(LoginIPRateThrottle, "rate", "1/min", create=True)
+    def test_ip_limit_uses_the_address_added_by_the_trusted_proxy(self):
+        with self.settings(
+            REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+        ):
+            for n in range(2):
+                response = self.client.post(
+                    self.url,
+                    {"email": f"{n}@example.com", "password": "wrongpass"},
+                    HTTP_X_FORWARDED_FOR=f"10.0.0.{n}, 203.0.113.7",
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+            response = self.client.post(
+                self.url,
+                {"email": "other@example.com", "password": "wrongpass"},
+                HTTP_X_FORWARDED_FOR="203.0.113.8",
+            )
+
+        self.assertEqual(response.status_code, 400)
+
+
+class CustomTokenRefreshTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        reset_revocation_store()
+        self.addCleanup(reset_revocation_store)
+        self.user = User.objects.create_user(
+            email="user@example.com", password="testpassword"
+        )
+        self.refresh = str(RefreshToken.for_user(self.user))
+        self.url = reverse("token_refresh")
+
+    def test_refresh_rotates_the_refresh_token(self):
+        response = self.client.post(self.url, {"refresh": self.refresh})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access", response.data)
+        self.assertNotEqual(response.data["refresh"], self.refresh)
+
+        response = self.client.post(self.url, {"refresh": response.data["refresh"]})
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_a_rotated_refresh_token_cannot_be_reused(self):
+        self.client.post(self.url, {"refresh": self.refresh})
+
+        response = self.client.post(self.url, {"refresh": self.refresh})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_for_an_inactive_user_is_rejected(self):
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.post(self.url, {"refresh": self.refresh})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @patch.object(TokenRefreshRateThrottle, "rate", "1/min", create=True)
+    def test_refreshes_are_throttled_per_ip(self):
+        self.client.post(self.url, {"refresh": self.refresh})
+
+        response = self.client.post(self.url, {"refresh": self.refresh})
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
 
 class UserAdminTests(APITestCase):
     def setUp(self):
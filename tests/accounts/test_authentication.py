@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.accounts.authentication import CachedJWTAuthentication
+from apps.accounts.services import AuthenticatedUserCache
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="admin@example.com", password="admin123", is_staff=True
+        )
+        self.token = str(AccessToken.for_user(self.user))
+
+    def _authenticate(self, token=None):
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {token or self.token}"
+        )
+        return CachedJWTAuthentication().authenticate(request)[0]
+
+    def test_repeated_requests_resolve_the_user_from_the_cache(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self._authenticate(), self.user)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self._authenticate(), self.user)
+
+    def test_deactivating_the_user_invalidates_the_cache(self):
+        self._authenticate()
+
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+
+        self.assertIsNone(AuthenticatedUserCache.get(self.user.id))
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_login_timestamp_updates_keep_the_cache(self):
+        self._authenticate()
+
+        self.user.last_login = timezone.now()
+        self.user.save(update_fields=["last_login"])
+
+        self.assertIsNotNone(AuthenticatedUserCache.get(self.user.id))
+
+    def test_password_reset_invalidates_the_cache(self):
+        self._authenticate()
+
+        response = self.client.post(
+            reverse("user-reset-password", args=[self.user.id]),
+            {"current_password": "admin123", "new_password": "newpassword123"},
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {self.token}",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(AuthenticatedUserCache.get(self.user.id))
+
+    def test_cached_user_rejects_tokens_issued_before_a_password_change(self):
+        with patch.object(api_settings, "CHECK_REVOKE_TOKEN", True):
+            token = str(AccessToken.for_user(self.user))
+            self._authenticate(token)
+            self.user.set_password("changed")
+            AuthenticatedUserCache.set(self.user)
+
+            with self.assertRaises(AuthenticationFailed):
+                self._authenticate(token)
+
+    def test_cache_holds_no_password_hash(self):
+        self._authenticate()
+
+        entry = cache.get(AuthenticatedUserCache._key(self.user.id))
+
+        self.assertNotIn(self.user.password, repr(entry))
+        self.assertNotIn("password", entry[0])
+
+    def test_cached_user_loads_other_fields_from_the_database(self):
+        self._authenticate()
+        User.objects.filter(pk=self.user.pk).update(first_name="Updated")
+
+        with self.assertNumQueries(0):
+            user = self._authenticate()
+
+        self.assertEqual(user.email, self.user.email)
+        self.assertTrue(user.is_staff)
+        self.assertIn("password", user.get_deferred_fields())
+        self.assertEqual(user.first_name, "Updated")
+
+    def test_saving_the_cached_user_keeps_newer_data(self):
+        self._authenticate()
+        user = self._authenticate()
+        User.objects.filter(pk=self.user.pk).update(first_name="Updated")
+
+        user.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, "Updated")
+        self.assertTrue(self.user.check_password("admin123"))
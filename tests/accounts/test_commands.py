@@ -0,0 +1,59 @@
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+
+class BenchmarkLoginCommandTest(SimpleTestCase):
+    def _response(self, status=200):
+        response = MagicMock(status=status)
+        response.headers = {
+            "Server-Timing": "hash;dur=40.0, db;dur=2.0, total;dur=43.0"
+        }
+        response.__enter__.return_value = response
+        return response
+
+    def test_reports_throughput_and_server_timings(self):
+        out = StringIO()
+
+        with patch("urllib.request.urlopen", return_value=self._response()) as urlopen:
+            call_command(
+                "benchmark_login",
+                email="admin@example.com",
+                password="secret",
+                requests=4,
+                concurrency=2,
+                stdout=out,
+            )
+
+        self.assertEqual(urlopen.call_count, 4)
+        self.assertIn("4/4 logins", out.getvalue())
+        self.assertIn("hash 40.0 ms, db 2.0 ms, total 43.0 ms", out.getvalue())
+
+    def test_reports_missing_server_timings(self):
+        response = self._response()
+        response.headers = {}
+        out = StringIO()
+
+        with patch("urllib.request.urlopen", return_value=response):
+            call_command(
+                "benchmark_login",
+                email="admin@example.com",
+                password="secret",
+                requests=1,
+                stdout=out,
+            )
+
+        self.assertIn("Server time: not reported", out.getvalue())
+
+    def test_fails_when_no_login_succeeds(self):
+        with patch("urllib.request.urlopen", return_value=self._response(status=401)):
+            with self.assertRaisesMessage(CommandError, "No login succeeded"):
+                call_command(
+                    "benchmark_login",
+                    email="admin@example.com",
+                    password="wrong",
+                    requests=1,
+                    stdout=StringIO(),
+                )
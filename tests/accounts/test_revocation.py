@@ -0,0 +1,126 @@
+import time
+from datetime import timedelta
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.test import TestCase as DjangoTestCase
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.accounts.models import RevokedToken
+from apps.accounts.revocation import (
+    DatabaseTokenRevocationStore,
+    LocalTokenRevocationStore,
+    RedisTokenRevocationStore,
+    TokenRevocationStore,
+    get_revocation_store,
+    reset_revocation_store,
+)
+from apps.accounts.tasks import purge_revoked_tokens
+
+
+class TokenRevocationStoreTest(TestCase):
+    def test_incomplete_stores_cannot_be_created(self):
+        class IncompleteStore(TokenRevocationStore):
+            def revoke(self, jti, expires_at):
+                return True
+
+        with self.assertRaises(TypeError):
+            IncompleteStore()
+
+
+class LocalTokenRevocationStoreTest(TestCase):
+    def test_a_token_is_revoked_only_once(self):
+        store = LocalTokenRevocationStore()
+        expires_at = int(time.time()) + 60
+
+        self.assertFalse(store.is_revoked("a"))
+        self.assertTrue(store.revoke("a", expires_at))
+        self.assertFalse(store.revoke("a", expires_at))
+        self.assertTrue(store.is_revoked("a"))
+
+    def test_purge_drops_expired_tokens(self):
+        store = LocalTokenRevocationStore()
+        store.revoke("expired", int(time.time()) - 1)
+        store.revoke("alive", int(time.time()) + 60)
+
+        self.assertFalse(store.is_revoked("expired"))
+        self.assertEqual(store.purge(), 1)
+        self.assertTrue(store.is_revoked("alive"))
+
+
+class RedisTokenRevocationStoreTest(TestCase):
+    @patch("apps.accounts.revocation.redis.Redis.from_url")
+    def setUp(self, mock_from_url):
+        self.store = RedisTokenRevocationStore("redis://localhost:6379/0", "revoked")
+        self.client = mock_from_url.return_value
+
+    def test_revoke_sets_the_key_until_the_token_expires(self):
+        expires_at = int(time.time()) + 60
+        self.client.set.side_effect = [True, None]
+
+        self.assertTrue(self.store.revoke("a", expires_at))
+        self.assertFalse(self.store.revoke("a", expires_at))
+        self.client.set.assert_called_with("revoked:a", 1, exat=expires_at, nx=True)
+
+    def test_is_revoked_checks_the_key(self):
+        self.client.exists.return_value = 1
+
+        self.assertTrue(self.store.is_revoked("a"))
+        self.client.exists.assert_called_once_with("revoked:a")
+
+
+class DatabaseTokenRevocationStoreTest(DjangoTestCase):
+    def setUp(self):
+        self.store = DatabaseTokenRevocationStore()
+
+    def test_a_token_is_revoked_only_once(self):
+        expires_at = int(time.time()) + 60
+
+        self.assertTrue(self.store.revoke("a", expires_at))
+        self.assertFalse(self.store.revoke("a", expires_at))
+        self.assertTrue(self.store.is_revoked("a"))
+        self.assertFalse(self.store.is_revoked("b"))
+
+    def test_expired_rows_are_ignored_and_purged(self):
+        RevokedToken.objects.create(
+            jti="expired", expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        self.store.revoke("alive", int(time.time()) + 60)
+
+        self.assertFalse(self.store.is_revoked("expired"))
+        self.assertEqual(self.store.purge(), 1)
+        self.assertEqual(
+            list(RevokedToken.objects.values_list("jti", flat=True)), ["alive"]
+        )
+
+    @override_settings(TOKEN_REVOCATION_BACKEND="database")
+    def test_purge_task_uses_the_configured_store(self):
+        reset_revocation_store()
+        self.addCleanup(reset_revocation_store)
+        RevokedToken.objects.create(
+            jti="expired", expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        self.assertEqual(purge_revoked_tokens.delay().get(), 1)
+        self.assertFalse(RevokedToken.objects.exists())
+
+
+class GetRevocationStoreTest(TestCase):
+    def tearDown(self):
+        reset_revocation_store()
+
+    @override_settings(TOKEN_REVOCATION_BACKEND="local")
+    def test_returns_a_shared_instance(self):
+        reset_revocation_store()
+        store = get_revocation_store()
+
+        self.assertIsInstance(store, LocalTokenRevocationStore)
+        self.assertIs(get_revocation_store(), store)
+
+    @override_settings(TOKEN_REVOCATION_BACKEND="unknown")
+    def test_unknown_backend_raises(self):
+        reset_revocation_store()
+
+        with self.assertRaises(ValueError):
+            get_revocation_store()
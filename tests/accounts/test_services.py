@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.accounts.services import StaffRecipientService
+
+User = get_user_model()
+
+
+class StaffRecipientServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            email="admin@example.com", password="pass", is_staff=True
+        )
+        User.objects.create_user(email="customer@example.com", password="pass")
+        User.objects.create_user(
+            email="inactive@example.com",
+            password="pass",
+            is_staff=True,
+            is_active=False,
+        )
+
+    def test_get_emails_returns_active_staff_from_the_cache(self):
+        self.assertEqual(StaffRecipientService.get_emails(), ["admin@example.com"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(StaffRecipientService.get_emails(), ["admin@example.com"])
+
+    def test_staff_changes_invalidate_the_cache(self):
+        StaffRecipientService.get_emails()
+        other = User.objects.create_user(
+            email="other@example.com", password="pass", is_staff=True
+        )
+        self.assertEqual(
+            StaffRecipientService.get_emails(),
+            ["admin@example.com", "other@example.com"],
+        )
+
+        other.is_active = False
+        other.save(update_fields=["is_active"])
+        self.assertEqual(StaffRecipientService.get_emails(), ["admin@example.com"])
+
+        self.admin.delete()
+        self.assertEqual(StaffRecipientService.get_emails(), [])
+
+    def test_unrelated_updates_keep_the_cache(self):
+        StaffRecipientService.get_emails()
+        self.admin.first_name = "Admin"
+        self.admin.save(update_fields=["first_name", "last_login"])
+
+        with self.assertNumQueries(0):
+            StaffRecipientService.get_emails()
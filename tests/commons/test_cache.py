@@ -0,0 +1,119 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from apps.commons.cache import MISSING, LRUCache, get_or_set_locked
+
+
+class LRUCacheTest(TestCase):
+    def test_get_returns_missing_for_unknown_keys(self):
+        cache = LRUCache(maxsize=2)
+
+        self.assertIs(cache.get("a"), MISSING)
+        self.assertIsNone(cache.get("a", None))
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIs(cache.get("b"), MISSING)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_get_or_set_computes_only_on_miss(self):
+        cache = LRUCache(maxsize=10)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return "value"
+
+        self.assertEqual(cache.get_or_set("key", factory), "value")
+        self.assertEqual(cache.get_or_set("key", factory), "value")
+        self.assertEqual(len(calls), 1)
+
+    def test_caches_none_values(self):
+        cache = LRUCache(maxsize=10)
+        cache.set("key", None)
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_zero_size_disables_caching(self):
+        cache = LRUCache(maxsize=0)
+        cache.set("key", "value")
+
+        self.assertIs(cache.get("key"), MISSING)
+
+    def test_stats_and_clear(self):
+        cache = LRUCache(maxsize=10)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+        cache.clear()
+
+        self.assertEqual(
+            cache.stats(),
+            {
+                "size": 0,
+                "maxsize": 10,
+                "hits": 1,
+                "misses": 1,
+                "evictions": 0,
+                "hit_rate": 0.5,
+            },
+        )
+
+
+class GetOrSetLockedTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_computes_and_caches_value_on_miss(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return {"value": 1}
+
+        self.assertEqual(get_or_set_locked("key", factory, timeout=60), {"value": 1})
+        self.assertEqual(get_or_set_locked("key", factory, timeout=60), {"value": 1})
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(cache.get("key:lock"))
+
+    def test_waits_for_the_lock_holder_to_fill_the_cache(self):
+        cache.add("key:lock", 1, 10)
+
+        def fill_cache(seconds):
+            cache.set("key", "from-other-worker")
+
+        with patch("apps.commons.cache.time.sleep", side_effect=fill_cache):
+            value = get_or_set_locked("key", lambda: "computed", timeout=60)
+
+        self.assertEqual(value, "from-other-worker")
+
+    def test_computes_value_when_the_lock_holder_is_too_slow(self):
+        cache.add("key:lock", 1, 10)
+
+        value = get_or_set_locked(
+            "key", lambda: "computed", timeout=60, wait_timeout=0.01
+        )
+
+        self.assertEqual(value, "computed")
+        self.assertIs(cache.get("key", MISSING), MISSING)
+
+    def test_releases_the_lock_when_the_factory_fails(self):
+        def factory():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            get_or_set_locked("key", factory, timeout=60)
+
+        self.assertIsNone(cache.get("key:lock"))
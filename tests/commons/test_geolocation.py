@@ -0,0 +1,92 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from apps.commons.geolocation import MODE_MMAP, GeoLocationService
+
+
+@patch("apps.commons.geolocation.Reader")
+class GeoLocationServiceTest(TestCase):
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".mmdb")
+        os.close(handle)
+        self.settings = override_settings(
+            GEOIP_DB_PATH=self.db_path,
+            GEOIP_CACHE_SIZE=100,
+            GEOIP_CACHE_IPV4_PREFIX=24,
+            GEOIP_RELOAD_CHECK_INTERVAL=0,
+        )
+        self.settings.enable()
+        GeoLocationService.reset()
+
+    def tearDown(self):
+        GeoLocationService.reset()
+        self.settings.disable()
+        os.remove(self.db_path)
+
+    def _set_location(self, mock_reader_cls, country, city):
+        response = mock_reader_cls.return_value.city.return_value
+        response.country.name = country
+        response.city.name = city
+
+    def test_opens_database_once_in_mmap_mode(self, mock_reader_cls):
+        self._set_location(mock_reader_cls, "Ecuador", "Quito")
+
+        self.assertEqual(GeoLocationService.locate("1.2.3.4"), ("Ecuador", "Quito"))
+        GeoLocationService.locate("5.6.7.8")
+
+        mock_reader_cls.assert_called_once_with(self.db_path, mode=MODE_MMAP)
+        mock_reader_cls.return_value.close.assert_not_called()
+
+    def test_caches_lookups_by_ipv4_prefix(self, mock_reader_cls):
+        self._set_location(mock_reader_cls, "Ecuador", "Quito")
+
+        GeoLocationService.locate("1.2.3.4")
+        GeoLocationService.locate("1.2.3.200")
+
+        mock_reader_cls.return_value.city.assert_called_once_with("1.2.3.4")
+        stats = GeoLocationService.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    @override_settings(GEOIP_CACHE_IPV4_PREFIX=0)
+    def test_caches_lookups_by_address_without_prefix(self, mock_reader_cls):
+        self._set_location(mock_reader_cls, "Ecuador", "Quito")
+
+        GeoLocationService.locate("1.2.3.4")
+        GeoLocationService.locate("1.2.3.200")
+
+        self.assertEqual(mock_reader_cls.return_value.city.call_count, 2)
+
+    def test_reloads_database_when_file_changes(self, mock_reader_cls):
+        self._set_location(mock_reader_cls, "Ecuador", "Quito")
+        GeoLocationService.locate("1.2.3.4")
+
+        stat = os.stat(self.db_path)
+        os.utime(self.db_path, (stat.st_atime, stat.st_mtime + 10))
+        GeoLocationService.locate("1.2.3.4")
+
+        self.assertEqual(mock_reader_cls.call_count, 2)
+        self.assertEqual(mock_reader_cls.return_value.city.call_count, 2)
+
+    def test_lookup_errors_return_unknown_location(self, mock_reader_cls):
+        mock_reader_cls.return_value.city.side_effect = Exception("not found")
+
+        self.assertEqual(GeoLocationService.locate("1.2.3.4"), (None, None))
+
+    def test_invalid_ip_is_not_looked_up(self, mock_reader_cls):
+        self.assertEqual(GeoLocationService.locate(None), (None, None))
+        self.assertEqual(GeoLocationService.locate("unknown"), (None, None))
+
+        mock_reader_cls.assert_not_called()
+
+    def test_missing_database_returns_unknown_location(self, mock_reader_cls):
+        with override_settings(GEOIP_DB_PATH=self.db_path + ".missing"):
+            with self.assertLogs("apps.commons.geolocation", level="WARNING"):
+                location = GeoLocationService.locate("2001:db8::1")
+
+        self.assertEqual(location, (None, None))
+        mock_reader_cls.assert_not_called()
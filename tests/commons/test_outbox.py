@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from apps.commons.models import OutboxMessage
+from apps.commons.outbox import Outbox
+from apps.commons.tasks import relay_outbox
+
+
+@override_settings(OUTBOX_RELAY_BATCH_SIZE=2)
+class OutboxTest(TestCase):
+    def test_enqueue_stores_the_task_call(self):
+        message = Outbox.enqueue("tasks.notify", "subject", exclude_email="a@b.com")
+
+        message.refresh_from_db()
+        self.assertEqual(message.task, "tasks.notify")
+        self.assertEqual(message.args, ["subject"])
+        self.assertEqual(message.kwargs, {"exclude_email": "a@b.com"})
+
+    @patch("apps.commons.outbox.current_app.signature")
+    def test_relay_publishes_every_message_in_order(self, mock_signature):
+        for index in range(5):
+            Outbox.enqueue("tasks.notify", index)
+
+        self.assertEqual(relay_outbox(), 5)
+
+        self.assertEqual(
+            [c.kwargs["args"] for c in mock_signature.call_args_list],
+            [[0], [1], [2], [3], [4]],
+        )
+        self.assertEqual(mock_signature.return_value.apply_async.call_count, 5)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    @patch("apps.commons.outbox.current_app.signature")
+    def test_relay_keeps_messages_the_broker_rejects(self, mock_signature):
+        mock_signature.return_value.apply_async.side_effect = [None, OSError("down")]
+        first = Outbox.enqueue("tasks.notify", 1)
+        second = Outbox.enqueue("tasks.notify", 2)
+
+        with self.assertLogs("apps.commons.outbox", "ERROR"):
+            self.assertEqual(Outbox.relay(), 1)
+
+        self.assertFalse(OutboxMessage.objects.filter(id=first.id).exists())
+        self.assertTrue(OutboxMessage.objects.filter(id=second.id).exists())
+
+    def test_relay_runs_registered_tasks(self):
+        Outbox.enqueue("apps.products.tasks.maintain_product_retrieve_partitions")
+
+        self.assertEqual(Outbox.relay(), 1)
+        self.assertFalse(OutboxMessage.objects.exists())
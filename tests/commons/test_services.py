@@ -1,12 +1,17 @@
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
+from botocore.stub import Stubber
 from django.test import override_settings
 
 from apps.commons.services import EmailService
 
 
 class EmailServiceTest(TestCase):
+    def setUp(self):
+        EmailService.reset_client()
+        self.addCleanup(EmailService.reset_client)
+
     @patch("apps.commons.services.boto3.client")
     def test_send_email_success(self, mock_boto_client):
         mock_ses = MagicMock()
@@ -23,6 +28,8 @@ class EmailServiceTest(TestCase):
             region_name="us-east-1",
             aws_access_key_id="fake-key",
             aws_secret_access_key="fake-secret",
+            endpoint_url=None,
+            config=ANY,
         )
         mock_ses.send_email.assert_called_once()
 
@@ -34,3 +41,49 @@ class EmailServiceTest(TestCase):
 
         mock_boto_client.assert_not_called()
         self.assertIn("Missing AWS SES credentials", str(ctx.exception))
+
+    @override_settings(AWS_SES_MAX_POOL_CONNECTIONS=4, AWS_SES_MAX_ATTEMPTS=3)
+    @patch("apps.commons.services.boto3.client")
+    def test_client_is_created_once_with_pool_and_retry_config(self, mock_boto_client):
+        EmailService.send_email("A", "Body", ["a@example.com"])
+        EmailService.send_email("B", "Body", ["b@example.com"])
+
+        mock_boto_client.assert_called_once()
+        config = mock_boto_client.call_args.kwargs["config"]
+        self.assertEqual(config.max_pool_connections, 4)
+        self.assertEqual(config.retries, {"max_attempts": 3, "mode": "adaptive"})
+
+    @override_settings(AWS_SES_ENDPOINT_URL="http://localhost:4566")
+    def test_send_bulk_returns_per_message_results(self):
+        client = EmailService.get_client()
+        self.assertEqual(client.meta.endpoint_url, "http://localhost:4566")
+
+        with Stubber(client) as stubber:
+            stubber.add_response("send_email", {"MessageId": "msg-1"})
+            stubber.add_client_error(
+                "send_email", service_message="Address blacklisted."
+            )
+
+            with self.assertLogs("apps.commons.services", "WARNING"):
+                results = EmailService.send_bulk(
+                    [
+                        ("A", "Body", ["a@example.com"]),
+                        ("B", "Body", ["b@example.com"]),
+                    ],
+                    max_workers=1,
+                )
+
+        self.assertEqual(
+            results,
+            [
+                {"to": ["a@example.com"], "message_id": "msg-1", "error": None},
+                {
+                    "to": ["b@example.com"],
+                    "message_id": None,
+                    "error": "Failed to send email: Address blacklisted.",
+                },
+            ],
+        )
+
+    def test_send_bulk_without_messages_does_nothing(self):
+        self.assertEqual(EmailService.send_bulk([]), [])
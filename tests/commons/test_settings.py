@@ -0,0 +1,26 @@
+import os
+import runpy
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+
+import config.settings.base
+
+BASE_SETTINGS = config.settings.base.__file__
+
+
+class DatabasePoolSettingsTest(TestCase):
+    @patch.dict(os.environ, {"DATABASE_POOL": "True"})
+    def test_pool_requires_psycopg_pool(self):
+        with patch("importlib.util.find_spec", return_value=None):
+            with self.assertRaisesRegex(ImproperlyConfigured, "psycopg 3"):
+                runpy.run_path(BASE_SETTINGS)
+
+    @patch.dict(os.environ, {"DATABASE_POOL": "True", "DATABASE_POOL_MAX_SIZE": "4"})
+    def test_pool_replaces_persistent_connections(self):
+        with patch("importlib.util.find_spec", return_value=object()):
+            databases = runpy.run_path(BASE_SETTINGS)["DATABASES"]
+
+        self.assertEqual(databases["default"]["CONN_MAX_AGE"], 0)
+        self.assertEqual(databases["default"]["OPTIONS"]["pool"]["max_size"], 4)
@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory
+
+from apps.commons.throttling import SlidingWindowRateThrottle
+
+
+class FakeClockThrottle(SlidingWindowRateThrottle):
+    rate = "4/min"
+    scope = "test"
+    now = 0.0
+
+    def get_cache_key(self, request, view):
+        return "throttle_test"
+
+    def timer(self):
+        return self.now
+
+
+class SlidingWindowRateThrottleTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.request = APIRequestFactory().get("/")
+
+    def _allow(self, now):
+        throttle = FakeClockThrottle()
+        throttle.now = now
+        return throttle.allow_request(self.request, None), throttle.wait()
+
+    def test_rejects_requests_over_the_rate_without_counting_them(self):
+        for second in range(4):
+            self.assertEqual(self._allow(second), (True, None))
+
+        allowed, wait = self._allow(10)
+
+        self.assertFalse(allowed)
+        self.assertEqual(wait, 50)
+        self.assertEqual(cache.get("throttle_test:0"), 4)
+
+    def test_previous_window_is_weighted_by_its_overlap(self):
+        for second in range(4):
+            self._allow(second)
+
+        # A quarter into the next window, 3 of the 4 previous requests count.
+        self.assertEqual(self._allow(75), (True, None))
+        self.assertEqual(self._allow(76), (True, None))
+
+        allowed, wait = self._allow(77)
+
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 13)
+        self.assertEqual(self._allow(91), (True, None))
+
+    def test_concurrent_requests_cannot_exceed_the_rate(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: self._allow(5)[0], range(20)))
+
+        self.assertEqual(results.count(True), 4)
+        self.assertEqual(cache.get("throttle_test:0"), 4)
@@ -1,11 +1,21 @@
+import datetime
+import json
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from apps.products.models import Brand, Product
+from apps.commons.models import OutboxMessage
+from apps.products.buffers import get_visit_buffer, reset_visit_buffer
+from apps.products.changes import CatalogueChangeFeed
+from apps.products.models import Brand, Product, ProductVisitStat
 
 User = get_user_model()
 
@@ -20,26 +30,64 @@ class ProductRetrieveAPITest(APITestCase):
             brand=self.brand,
         )
         self.url = reverse("product-detail", args=[self.product.sku])
+        reset_visit_buffer()
+        cache.clear()
 
-    @patch("apps.products.tasks.track_product_retrieve.delay")
+    @patch("apps.products.services.ProductVisitTracker.track")
     @patch(
         "apps.products.services.ProductVisitMetadataBuilder.build",
         return_value={"ip": "1.1.1.1"},
     )
-    def test_retrieve_as_anonymous_triggers_tracking(self, mock_build, mock_delay):
+    def test_retrieve_as_anonymous_triggers_tracking(self, mock_build, mock_track):
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         mock_build.assert_called_once()
-        mock_delay.assert_called_once_with(self.product.id, {"ip": "1.1.1.1"})
+        mock_track.assert_called_once_with(self.product.id, {"ip": "1.1.1.1"})
 
-    @patch("apps.products.tasks.track_product_retrieve.delay")
+    def test_retrieve_as_anonymous_runs_a_single_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["sku"], self.product.sku)
+        self.assertEqual(response.data["brand"], self.brand.id)
+        self.assertEqual(len(get_visit_buffer()), 1)
+
+    @patch("apps.products.services.ProductVisitTracker.track")
+    def test_retrieve_cache_hit_runs_no_query_and_still_tracks(self, mock_track):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], "Test Product")
+        self.assertEqual(mock_track.call_count, 2)
+        self.assertEqual(mock_track.call_args.args[0], self.product.id)
+
+    @patch("apps.products.services.ProductVisitTracker.track")
+    def test_retrieve_cache_is_invalidated_on_product_save(self, mock_track):
+        self.client.get(self.url)
+
+        self.product.name = "Renamed Product"
+        self.product.save()
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data["name"], "Renamed Product")
+
+    def test_retrieve_unknown_sku_returns_not_found(self):
+        response = self.client.get(reverse("product-detail", args=["MISSING"]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @patch("apps.products.services.ProductVisitTracker.track")
     @patch(
         "apps.products.services.ProductVisitMetadataBuilder.build",
         return_value={"ip": "1.1.1.1"},
     )
     def test_retrieve_as_authenticated_does_not_trigger_tracking(
-        self, mock_build, mock_delay
+        self, mock_build, mock_track
     ):
         user = User.objects.create_user(email="user@example.com", password="pass123")
         self.client.force_authenticate(user=user)
@@ -48,10 +96,29 @@ class ProductRetrieveAPITest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         mock_build.assert_not_called()
-        mock_delay.assert_not_called()
+        mock_track.assert_not_called()
+
+    def test_retrieve_returns_not_modified_without_queries(self):
+        response = self.client.get(self.url)
+        self.assertIn("Last-Modified", response)
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(
+                self.url, HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+
+        self.product.price = 120
+        self.product.save()
 
-    @patch("apps.products.services.ProductEmailService.send_email")
-    def test_update_product_call_email_service(self, mock_service):
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data["price"], "120.00")
+
+    @patch("apps.products.viewsets.product.ProductChangeDigest.record")
+    def test_update_product_records_the_change(self, mock_record):
         user = User.objects.create_user(email="user@example.com", password="pass123")
         self.client.force_authenticate(user=user)
         response = self.client.patch(
@@ -62,4 +129,555 @@ class ProductRetrieveAPITest(APITestCase):
         data = response.json()
 
         self.assertEqual(data.get("name"), "New Product Name")
-        mock_service.assert_called_with(self.product, user)
+        mock_record.assert_called_with(self.product, user)
+
+
+class ProductListAPITest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.brand = Brand.objects.create(name="ListBrand")
+        Product.objects.create(sku="LIST1", name="First", price=10, brand=self.brand)
+        self.url = reverse("product-list")
+
+    def test_list_is_served_from_cache(self):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+
+    def test_list_cache_is_keyed_by_query_string(self):
+        Product.objects.create(sku="LIST2", name="Second", price=20, brand=self.brand)
+
+        first = self.client.get(self.url, {"limit": 1})
+        second = self.client.get(self.url, {"limit": 1, "offset": 1})
+
+        self.assertEqual(first.data["results"][0]["sku"], "LIST1")
+        self.assertEqual(second.data["results"][0]["sku"], "LIST2")
+
+    def test_list_cache_is_invalidated_on_brand_and_product_writes(self):
+        self.client.get(self.url)
+
+        Product.objects.create(sku="LIST2", name="Second", price=20, brand=self.brand)
+        self.assertEqual(self.client.get(self.url).data["count"], 2)
+
+        self.brand.name = "Renamed"
+        self.brand.save()
+
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    def test_cursor_pagination_walks_the_catalogue_without_counting(self):
+        for n in range(2, 6):
+            Product.objects.create(
+                sku=f"LIST{n}", name=f"Product {n}", price=n, brand=self.brand
+            )
+
+        skus = []
+        url = f"{self.url}?pagination=cursor&limit=2"
+
+        while url:
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            self.assertNotIn("count", response.data)
+            skus += [item["sku"] for item in response.data["results"]]
+            url = response.data["next"]
+
+        self.assertEqual(skus, ["LIST1", "LIST2", "LIST3", "LIST4", "LIST5"])
+
+    def _skus(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["sku"] for item in response.data["results"]]
+
+    def test_list_filters_by_price_range_and_brand(self):
+        other = Brand.objects.create(name="OtherBrand")
+        Product.objects.create(sku="LIST2", name="Second", price=20, brand=self.brand)
+        Product.objects.create(sku="LIST3", name="Third", price=30, brand=other)
+
+        self.assertEqual(self._skus({"min_price": 15}), ["LIST2", "LIST3"])
+        self.assertEqual(self._skus({"max_price": "20.00"}), ["LIST1", "LIST2"])
+        self.assertEqual(self._skus({"brand": other.id}), ["LIST3"])
+        self.assertEqual(
+            self._skus({"brand_name": "ListBrand", "max_price": 15}), ["LIST1"]
+        )
+
+    def test_list_rejects_invalid_filters(self):
+        for params in ({"min_price": "cheap"}, {"min_price": 20, "max_price": 10}):
+            response = self.client.get(self.url, params)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("min_price", response.data)
+
+    def test_list_orders_by_price_with_ties_broken_by_id(self):
+        Product.objects.create(sku="LIST2", name="Second", price=30, brand=self.brand)
+        Product.objects.create(sku="LIST3", name="Third", price=10, brand=self.brand)
+
+        self.assertEqual(
+            self._skus({"ordering": "-price"}), ["LIST2", "LIST1", "LIST3"]
+        )
+        self.assertEqual(self._skus({"ordering": "name"}), ["LIST1", "LIST2", "LIST3"])
+
+        skus, url = [], f"{self.url}?pagination=cursor&limit=1&ordering=price"
+
+        while url:
+            response = self.client.get(url)
+            skus += [item["sku"] for item in response.data["results"]]
+            url = response.data["next"]
+
+        self.assertEqual(skus, ["LIST1", "LIST3", "LIST2"])
+
+    def test_limit_offset_can_skip_the_count(self):
+        Product.objects.create(sku="LIST2", name="Second", price=20, brand=self.brand)
+
+        with self.assertNumQueries(1):
+            first = self.client.get(self.url, {"limit": 1, "count": "false"})
+        last = self.client.get(first.data["next"])
+
+        self.assertNotIn("count", first.data)
+        self.assertEqual(first.data["results"][0]["sku"], "LIST1")
+        self.assertEqual(last.data["results"][0]["sku"], "LIST2")
+        self.assertIsNone(last.data["next"])
+        self.assertIsNotNone(last.data["previous"])
+
+    def test_unchanged_list_returns_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Product.objects.create(sku="LIST2", name="Second", price=20, brand=self.brand)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_limit_offset_keeps_the_count_by_default(self):
+        response = self.client.get(self.url, {"limit": 1, "offset": 0})
+
+        self.assertEqual(response.data["count"], 1)
+        self.assertIsNone(response.data["next"])
+
+
+class BrandListAPITest(APITestCase):
+    def setUp(self):
+        for name in ("Alpha", "Beta", "Gamma"):
+            Brand.objects.create(name=name)
+        self.url = reverse("brand-list")
+
+    def test_list_includes_product_stats_in_one_cached_query(self):
+        alpha = Brand.objects.get(name="Alpha")
+        for sku, price in (("STAT1", 10), ("STAT2", 25)):
+            Product.objects.create(sku=sku, name=sku, price=price, brand=alpha)
+        cache.clear()
+        params = {"include_stats": "true", "count": "false"}
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, params)
+
+        self.assertEqual(
+            response.data["results"][:2],
+            [
+                {
+                    "id": alpha.id,
+                    "name": "Alpha",
+                    "product_count": 2,
+                    "min_price": "10.00",
+                    "max_price": "25.00",
+                },
+                {
+                    "id": Brand.objects.get(name="Beta").id,
+                    "name": "Beta",
+                    "product_count": 0,
+                    "min_price": None,
+                    "max_price": None,
+                },
+            ],
+        )
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(
+                self.url, params, HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Product.objects.create(sku="STAT3", name="STAT3", price=5, brand=alpha)
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.data["results"][0]["product_count"], 3)
+        self.assertEqual(response.data["results"][0]["min_price"], "5.00")
+
+    def test_retrieve_includes_product_stats_on_request(self):
+        url = reverse("brand-detail", args=["Gamma"])
+
+        self.assertNotIn("product_count", self.client.get(url).data)
+        self.assertEqual(
+            self.client.get(url, {"include_stats": "true"}).data["product_count"], 0
+        )
+        self.assertEqual(
+            self.client.get(
+                reverse("brand-detail", args=["Nope"]), {"include_stats": "true"}
+            ).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+
+    def test_unchanged_list_returns_not_modified_after_one_query(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Brand.objects.get(name="Gamma").delete()
+
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_200_OK,
+        )
+
+    def test_retrieve_supports_etag_and_last_modified(self):
+        url = reverse("brand-detail", args=["Alpha"])
+        response = self.client.get(url)
+
+        self.assertEqual(response.data["name"], "Alpha")
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(
+            self.client.get(
+                url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+            ).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+        Brand.objects.filter(name="Alpha").update(
+            updated_at=timezone.now() + datetime.timedelta(seconds=5)
+        )
+
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code,
+            status.HTTP_200_OK,
+        )
+
+    def test_retrieve_unknown_brand_returns_not_found(self):
+        response = self.client.get(reverse("brand-detail", args=["Nope"]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_pagination(self):
+        response = self.client.get(self.url, {"pagination": "cursor", "limit": 2})
+        next_page = self.client.get(response.data["next"])
+
+        self.assertEqual(
+            [b["name"] for b in response.data["results"]], ["Alpha", "Beta"]
+        )
+        self.assertEqual([b["name"] for b in next_page.data["results"]], ["Gamma"])
+        self.assertIsNone(next_page.data["next"])
+
+
+class ProductBulkUpsertAPITest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.brand = Brand.objects.create(name="Acme")
+        self.other_brand = Brand.objects.create(name="Globex")
+        Product.objects.create(sku="OLD1", name="Old", price=5, brand=self.brand)
+        self.user = User.objects.create_user(
+            email="importer@example.com", password="pass123", is_staff=True
+        )
+        User.objects.create_user(
+            email="admin@example.com", password="pass123", is_staff=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("product-bulk-upsert")
+        self.payload = {
+            "products": [
+                {"sku": "OLD1", "name": "Updated", "price": "7.50", "brand": "Globex"},
+                {"sku": "NEW1", "name": "New 1", "price": "10.00", "brand": "Acme"},
+                {"sku": "NEW2", "name": "New 2", "price": "12.00", "brand": "Acme"},
+            ]
+        }
+
+    @override_settings(PRODUCT_BULK_UPSERT_BATCH_SIZE=2)
+    def test_bulk_upsert_creates_and_updates_products(self):
+        response = self.client.post(self.url, self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"received": 3, "created": 2, "updated": 1})
+        self.assertEqual(Product.objects.count(), 3)
+
+        updated = Product.objects.get(sku="OLD1")
+        self.assertEqual(updated.name, "Updated")
+        self.assertEqual(str(updated.price), "7.50")
+        self.assertEqual(updated.brand, self.other_brand)
+
+        message = OutboxMessage.objects.get()
+        subject, body = message.args
+        self.assertEqual(message.task, "apps.products.tasks.send_staff_notification")
+        self.assertIn("2 productos creados, 1 actualizados", subject)
+        self.assertIn("NEW1", body)
+        self.assertEqual(message.kwargs, {"exclude_email": "importer@example.com"})
+
+    @patch(
+        "apps.products.viewsets.product.ProductEmailService.send_bulk_email",
+        side_effect=RuntimeError("boom"),
+    )
+    def test_bulk_upsert_rolls_back_with_its_notification(self, mock_send):
+        with self.assertRaises(RuntimeError):
+            self.client.post(self.url, self.payload, format="json")
+
+        self.assertFalse(Product.objects.filter(sku="NEW1").exists())
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_bulk_upsert_resolves_brands_in_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, self.payload, format="json")
+
+        brand_queries = [q for q in queries if 'FROM "products_brand"' in q["sql"]]
+        self.assertEqual(len(brand_queries), 1)
+
+    def test_bulk_upsert_invalidates_the_product_cache(self):
+        detail_url = reverse("product-detail", args=["OLD1"])
+        self.client.get(detail_url)
+
+        self.client.post(self.url, self.payload, format="json")
+
+        self.assertEqual(self.client.get(detail_url).data["name"], "Updated")
+
+    def test_bulk_upsert_rejects_unknown_brands(self):
+        self.payload["products"][1]["brand"] = "Initech"
+
+        response = self.client.post(self.url, self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Unknown brands: Initech", str(response.data))
+        self.assertFalse(Product.objects.filter(sku="NEW1").exists())
+
+    def test_bulk_upsert_rejects_duplicated_skus(self):
+        self.payload["products"][2]["sku"] = "NEW1"
+
+        response = self.client.post(self.url, self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Duplicated SKUs: NEW1", str(response.data))
+
+    def test_bulk_upsert_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+
+        response = self.client.post(self.url, self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ProductExportAPITest(APITestCase):
+    def setUp(self):
+        self.brand = Brand.objects.create(name="Export Brand")
+        Product.objects.create(sku="EXP1", name="Tornillo", price=1.5, brand=self.brand)
+        Product.objects.create(sku="EXP2", name="Tuerca", price=2, brand=self.brand)
+        self.url = reverse("product-export")
+
+    def _content(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    @override_settings(PRODUCT_EXPORT_CHUNK_SIZE=1)
+    def test_export_streams_ndjson_by_default(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in self._content(response).splitlines()]
+        self.assertEqual(
+            lines,
+            [
+                {
+                    "sku": "EXP1",
+                    "name": "Tornillo",
+                    "price": "1.50",
+                    "brand": self.brand.id,
+                },
+                {
+                    "sku": "EXP2",
+                    "name": "Tuerca",
+                    "price": "2.00",
+                    "brand": self.brand.id,
+                },
+            ],
+        )
+
+    def test_export_streams_csv_with_brand_names(self):
+        response = self.client.get(self.url, {"output": "csv", "include_brand": "true"})
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="products.csv"', response["Content-Disposition"])
+        self.assertEqual(
+            self._content(response).splitlines(),
+            [
+                "sku,name,price,brand,brand_name",
+                f"EXP1,Tornillo,1.50,{self.brand.id},Export Brand",
+                f"EXP2,Tuerca,2.00,{self.brand.id},Export Brand",
+            ],
+        )
+
+    def test_export_rejects_unknown_formats(self):
+        response = self.client.get(self.url, {"output": "xml"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ProductStatsAPITest(APITestCase):
+    def setUp(self):
+        brand = Brand.objects.create(name="Stats Brand")
+        self.product = Product.objects.create(
+            sku="STAT1", name="Stats", price=1, brand=brand
+        )
+        self.user = User.objects.create_user(
+            email="analyst@example.com", password="pass123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("product-stats", args=[self.product.sku])
+        self.day = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+        for days, country, device_type, visits in [
+            (0, "Ecuador", "Mobile", 3),
+            (0, "Ecuador", "Desktop", 2),
+            (0, "Perú", "Mobile", 1),
+            (1, "Ecuador", "Mobile", 4),
+        ]:
+            ProductVisitStat.objects.create(
+                product=self.product,
+                period=ProductVisitStat.Period.DAY,
+                bucket_start=self.day + datetime.timedelta(days=days),
+                country=country,
+                device_type=device_type,
+                browser="Firefox",
+                visits=visits,
+            )
+
+    def test_stats_sums_visits_per_bucket(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(row["bucket_start"][:10], row["visits"]) for row in response.data],
+            [("2025-01-01", 6), ("2025-01-02", 4)],
+        )
+        self.assertNotIn("country", response.data[0])
+
+    def test_stats_breaks_down_by_dimension_within_range(self):
+        response = self.client.get(
+            self.url,
+            {"breakdown": "country", "until": "2025-01-02T00:00:00Z"},
+        )
+
+        self.assertEqual(
+            [(row["country"], row["visits"]) for row in response.data],
+            [("Ecuador", 5), ("Perú", 1)],
+        )
+
+    def test_stats_rejects_unknown_dimensions(self):
+        response = self.client.get(self.url, {"breakdown": "country,ip"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("breakdown", response.data)
+
+    def test_stats_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ProductChangesAPITest(APITestCase):
+    def setUp(self):
+        self.brand = Brand.objects.create(name="Sync")
+        self.product = Product.objects.create(
+            sku="SYNC1", name="Casco", price=50, brand=self.brand
+        )
+        self.url = reverse("product-changes")
+
+    def test_full_sync_then_incremental_poll(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(
+            {
+                "kind": "product",
+                "key": "SYNC1",
+                "deleted": False,
+                "data": {
+                    "sku": "SYNC1",
+                    "name": "Casco",
+                    "price": "50.00",
+                    "brand": self.brand.id,
+                },
+            },
+            response.data["results"],
+        )
+
+        self.product.delete()
+        polled = self.client.get(self.url, {"cursor": response.data["cursor"]})
+
+        self.assertEqual(
+            polled.data["results"],
+            [{"kind": "product", "key": "SYNC1", "deleted": True, "data": None}],
+        )
+        self.assertFalse(polled.data["has_more"])
+
+    def test_invalid_cursor_returns_bad_request(self):
+        response = self.client.get(self.url, {"cursor": "nope"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cursor", response.data)
+
+    @patch(
+        "apps.products.viewsets.product.CatalogueChangeFeed.is_expired",
+        return_value=True,
+    )
+    def test_expired_cursor_returns_gone(self, mock_is_expired):
+        cursor = CatalogueChangeFeed.encode_cursor(1)
+        response = self.client.get(self.url, {"cursor": cursor})
+
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        mock_is_expired.assert_called_once_with(1)
+
+
+class ProductSearchAPITest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        brand = Brand.objects.create(name="Search")
+        for index, name in enumerate(["Casco integral", "Casco urbano", "Botas"]):
+            Product.objects.create(sku=f"SRCH{index}", name=name, price=10, brand=brand)
+        self.url = reverse("product-search")
+
+    def test_search_returns_a_cached_page_of_matches(self):
+        response = self.client.get(self.url, {"q": "casco", "limit": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual([p["sku"] for p in response.data["results"]], ["SRCH0"])
+        self.assertIn("ETag", response)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.url, {"q": "casco", "limit": 1})
+
+        self.assertEqual(cached.data, response.data)
+
+    def test_search_can_be_filtered(self):
+        Product.objects.filter(sku="SRCH0").update(price=50)
+
+        response = self.client.get(self.url, {"q": "casco", "max_price": 20})
+
+        self.assertEqual([p["sku"] for p in response.data["results"]], ["SRCH1"])
+
+    def test_search_requires_a_term(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("q", response.data)
@@ -0,0 +1,131 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from apps.products.buffers import (
+    LocalVisitBuffer,
+    RedisVisitBuffer,
+    VisitBuffer,
+    get_visit_buffer,
+    reset_visit_buffer,
+)
+
+
+class VisitBufferTest(TestCase):
+    def test_incomplete_buffers_cannot_be_created(self):
+        class IncompleteBuffer(VisitBuffer):
+            def append(self, event):
+                return 1
+
+        with self.assertRaises(TypeError):
+            IncompleteBuffer()
+
+
+class LocalVisitBufferTest(TestCase):
+    def test_append_and_drain_in_order(self):
+        buffer = LocalVisitBuffer()
+
+        self.assertEqual(buffer.append({"n": 1}), 1)
+        self.assertEqual(buffer.append({"n": 2}), 2)
+        buffer.append({"n": 3})
+
+        self.assertEqual(buffer.drain(2), [{"n": 1}, {"n": 2}])
+        self.assertEqual(len(buffer), 1)
+        self.assertEqual(buffer.drain(10), [{"n": 3}])
+        self.assertEqual(buffer.drain(10), [])
+
+    def test_requeue_restores_events_at_the_head(self):
+        buffer = LocalVisitBuffer()
+        for n in range(4):
+            buffer.append({"n": n})
+
+        events = buffer.drain(2)
+        buffer.requeue(events)
+
+        self.assertEqual([e["n"] for e in buffer.drain(10)], [0, 1, 2, 3])
+
+    def test_dead_letters_are_capped(self):
+        buffer = LocalVisitBuffer(dead_letter_max_size=2)
+
+        buffer.dead_letter([{"n": 1}, {"n": 2}, {"n": 3}])
+
+        self.assertEqual(list(buffer.dead_letters), [{"n": 2}, {"n": 3}])
+
+
+class RedisVisitBufferTest(TestCase):
+    @patch("apps.products.buffers.redis.Redis.from_url")
+    def setUp(self, mock_from_url):
+        self.buffer = RedisVisitBuffer("redis://localhost:6379/0", "visits")
+        self.client = mock_from_url.return_value
+
+    def test_append_pushes_json_to_the_tail(self):
+        self.client.rpush.return_value = 1
+
+        self.assertEqual(self.buffer.append({"product_id": 1}), 1)
+        self.client.rpush.assert_called_once_with("visits", '{"product_id": 1}')
+
+    def test_drain_reads_and_trims_in_one_transaction(self):
+        pipeline = self.client.pipeline.return_value
+        pipeline.execute.return_value = [[b'{"n": 1}', b'{"n": 2}'], True]
+
+        events = self.buffer.drain(2)
+
+        self.assertEqual(events, [{"n": 1}, {"n": 2}])
+        self.client.pipeline.assert_called_once_with(transaction=True)
+        pipeline.lrange.assert_called_once_with("visits", 0, 1)
+        pipeline.ltrim.assert_called_once_with("visits", 2, -1)
+
+    def test_requeue_pushes_events_back_to_the_head(self):
+        self.buffer.requeue([{"n": 1}, {"n": 2}])
+
+        self.client.lpush.assert_called_once_with(
+            "visits", json.dumps({"n": 2}), json.dumps({"n": 1})
+        )
+
+    def test_requeue_without_events_is_a_noop(self):
+        self.buffer.requeue([])
+        self.client.lpush.assert_not_called()
+
+    def test_dead_letter_pushes_to_a_capped_list(self):
+        pipeline = self.client.pipeline.return_value
+
+        self.buffer.dead_letter([{"n": 1}])
+
+        pipeline.rpush.assert_called_once_with("visits:dead", '{"n": 1}')
+        pipeline.ltrim.assert_called_once_with("visits:dead", -10000, -1)
+        pipeline.execute.assert_called_once()
+
+    def test_len_uses_llen(self):
+        self.client.llen.return_value = 7
+        self.assertEqual(len(self.buffer), 7)
+
+
+class GetVisitBufferTest(TestCase):
+    def tearDown(self):
+        reset_visit_buffer()
+
+    @override_settings(VISIT_BUFFER_BACKEND="local")
+    def test_returns_a_shared_local_buffer(self):
+        reset_visit_buffer()
+        buffer = get_visit_buffer()
+
+        self.assertIsInstance(buffer, LocalVisitBuffer)
+        self.assertIs(get_visit_buffer(), buffer)
+
+    @override_settings(VISIT_BUFFER_BACKEND="redis", VISIT_BUFFER_KEY="visits")
+    @patch("apps.products.buffers.redis.Redis.from_url")
+    def test_returns_a_redis_buffer(self, mock_from_url):
+        reset_visit_buffer()
+        buffer = get_visit_buffer()
+
+        self.assertIsInstance(buffer, RedisVisitBuffer)
+        self.assertEqual(buffer.key, "visits")
+
+    @override_settings(VISIT_BUFFER_BACKEND="memcached")
+    def test_unknown_backend_raises(self):
+        reset_visit_buffer()
+
+        with self.assertRaises(ValueError):
+            get_visit_buffer()
@@ -0,0 +1,162 @@
+import datetime
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db.transaction import TransactionManagementError
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from apps.products.changes import CatalogueChangeFeed
+from apps.products.models import Brand, CatalogueTombstone, Product
+from apps.products.services import ProductBulkUpsertService
+from apps.products.tasks import purge_catalogue_tombstones
+
+
+class CatalogueChangeFeedTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.brand = Brand.objects.create(name="Feed")
+        self.product = Product.objects.create(
+            sku="FEED1", name="Casco", price=50, brand=self.brand
+        )
+        self.since = self.product.change_seq
+
+    def _keys(self, page):
+        return [(c["kind"], c["key"], c["deleted"]) for c in page["results"]]
+
+    def test_writes_are_stamped_in_order(self):
+        other = Product.objects.create(
+            sku="FEED2", name="Guantes", price=20, brand=self.brand
+        )
+        self.product.price = 60
+        self.product.save()
+
+        self.assertGreater(self.product.change_seq, other.change_seq)
+        self.assertGreater(other.change_seq, self.brand.change_seq)
+
+    def test_read_returns_only_later_changes_in_order(self):
+        other = Product.objects.create(
+            sku="FEED2", name="Guantes", price=20, brand=self.brand
+        )
+        self.brand.name = "Feed 2"
+        self.brand.save()
+        other.delete()
+
+        with self.assertNumQueries(3):
+            page = CatalogueChangeFeed.read(self.since, limit=10)
+
+        self.assertEqual(
+            self._keys(page),
+            [("brand", "Feed 2", False), ("product", "FEED2", True)],
+        )
+        self.assertFalse(page["has_more"])
+        self.assertEqual(
+            CatalogueChangeFeed.read(
+                CatalogueChangeFeed.decode_cursor(page["cursor"]), limit=10
+            )["results"],
+            [],
+        )
+
+    def test_read_pages_through_the_changes(self):
+        for index in range(3):
+            Product.objects.create(
+                sku=f"PAGE{index}", name="Item", price=1, brand=self.brand
+            )
+
+        first = CatalogueChangeFeed.read(self.since, limit=2)
+        second = CatalogueChangeFeed.read(
+            CatalogueChangeFeed.decode_cursor(first["cursor"]), limit=2
+        )
+
+        self.assertTrue(first["has_more"])
+        self.assertFalse(second["has_more"])
+        self.assertEqual(
+            [c["key"] for c in first["results"] + second["results"]],
+            ["PAGE0", "PAGE1", "PAGE2"],
+        )
+
+    def test_empty_page_keeps_the_cursor(self):
+        page = CatalogueChangeFeed.read(self.since, limit=10)
+
+        self.assertEqual(page["cursor"], CatalogueChangeFeed.encode_cursor(self.since))
+
+    def test_bulk_upsert_stamps_every_product(self):
+        ProductBulkUpsertService.upsert(
+            [
+                {"sku": "FEED1", "name": "Casco", "price": 55, "brand": "Feed"},
+                {"sku": "BULK1", "name": "Botas", "price": 80, "brand": "Feed"},
+            ],
+            {"Feed": self.brand.id},
+        )
+
+        page = CatalogueChangeFeed.read(self.since, limit=10)
+
+        self.assertEqual(
+            self._keys(page),
+            [("product", "FEED1", False), ("product", "BULK1", False)],
+        )
+
+    @override_settings(PRODUCT_BULK_UPSERT_BATCH_SIZE=2)
+    def test_bulk_upsert_reserves_the_sequence_once_after_writing(self):
+        products = [
+            {"sku": f"BULK{index}", "name": "Botas", "price": 80, "brand": "Feed"}
+            for index in range(5)
+        ]
+
+        with patch(
+            "apps.products.services.CatalogueChangeFeed.allocate",
+            wraps=CatalogueChangeFeed.allocate,
+        ) as mock_allocate:
+            ProductBulkUpsertService.upsert(products, {"Feed": self.brand.id})
+
+        mock_allocate.assert_called_once_with(5)
+        self.assertEqual(
+            list(
+                Product.objects.filter(sku__startswith="BULK")
+                .order_by("sku")
+                .values_list("change_seq", flat=True)
+            ),
+            list(range(self.since + 1, self.since + 6)),
+        )
+
+    def test_decode_cursor_rejects_malformed_cursors(self):
+        for cursor in ("not-base64!", "c2VxOmFiYw==", "Zm9vOjE="):
+            with self.assertRaises(ValueError):
+                CatalogueChangeFeed.decode_cursor(cursor)
+
+        self.assertEqual(
+            CatalogueChangeFeed.decode_cursor(CatalogueChangeFeed.encode_cursor(42)),
+            42,
+        )
+
+    @override_settings(CATALOGUE_TOMBSTONE_RETENTION_DAYS=30)
+    def test_purge_deletes_old_tombstones_and_expires_older_cursors(self):
+        self.product.delete()
+        tombstone = CatalogueTombstone.objects.get()
+        CatalogueTombstone.objects.filter(pk=tombstone.pk).update(
+            deleted_at=timezone.now() - datetime.timedelta(days=31)
+        )
+        Product.objects.create(sku="NEW", name="Nuevo", price=1, brand=self.brand)
+
+        self.assertEqual(purge_catalogue_tombstones(), 1)
+        self.assertEqual(purge_catalogue_tombstones(), 0)
+        self.assertFalse(CatalogueTombstone.objects.exists())
+        self.assertTrue(CatalogueChangeFeed.is_expired(self.since))
+        self.assertFalse(CatalogueChangeFeed.is_expired(tombstone.change_seq))
+
+
+class CatalogueChangeTransactionTest(TransactionTestCase):
+    def test_allocating_outside_a_transaction_is_refused(self):
+        with self.assertRaises(TransactionManagementError):
+            CatalogueChangeFeed.allocate()
+
+    def test_saves_outside_a_transaction_are_stamped_atomically(self):
+        brand = Brand.objects.create(name="Autocommit")
+        product = Product.objects.create(
+            sku="AUTO1", name="Casco", price=50, brand=brand
+        )
+
+        self.assertGreater(product.change_seq, brand.change_seq)
+        self.assertEqual(
+            Product.objects.get(sku="AUTO1").change_seq, product.change_seq
+        )
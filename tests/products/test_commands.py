@@ -0,0 +1,116 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+
+from apps.products.buffers import get_visit_buffer, reset_visit_buffer
+from apps.products.cache import ProductCache
+from apps.products.models import (
+    Brand,
+    Product,
+    ProductRetrieve,
+    VisitLocation,
+    VisitUserAgent,
+)
+
+
+class BackfillVisitColumnsCommandTest(TestCase):
+    def setUp(self):
+        brand = Brand.objects.create(name="Backfill")
+        self.product = Product.objects.create(
+            sku="BACK1", name="Backfill", price=1, brand=brand
+        )
+        self.user_agent = "Mozilla/5.0 (iPhone; CPU iPhone OS 15_5 like Mac OS X)"
+
+    def _legacy_visit(self, country="Ecuador", device_type="mobile"):
+        return ProductRetrieve.objects.create(
+            product=self.product,
+            metadata={
+                "ip": "10.0.0.1",
+                "user_agent": self.user_agent,
+                "device": "iPhone",
+                "device_type": device_type,
+                "os": "iOS",
+                "browser": "Mobile Safari",
+                "referer": None,
+                "country": country,
+                "city": "Quito",
+            },
+        )
+
+    def test_backfill_moves_metadata_to_typed_columns_in_batches(self):
+        for country in ["Ecuador", "Ecuador", "Perú"]:
+            self._legacy_visit(country)
+        out = StringIO()
+
+        call_command("backfill_visit_columns", batch_size=2, stdout=out)
+
+        self.assertIn("Backfilled 3 visits", out.getvalue())
+        self.assertFalse(ProductRetrieve.objects.filter(metadata__isnull=False))
+        self.assertEqual(VisitUserAgent.objects.count(), 1)
+        self.assertEqual(VisitLocation.objects.count(), 2)
+
+        visit = ProductRetrieve.objects.select_related("user_agent", "location").first()
+        self.assertEqual(visit.ip, "10.0.0.1")
+        self.assertEqual(visit.device_type, ProductRetrieve.DeviceType.MOBILE)
+        self.assertEqual(visit.user_agent.browser, "Mobile Safari")
+        self.assertEqual(visit.location.country, "Ecuador")
+        self.assertEqual(visit.referer, "")
+
+    def test_backfill_skips_backfilled_visits(self):
+        self._legacy_visit(device_type="tablet")
+        call_command("backfill_visit_columns", stdout=StringIO())
+        out = StringIO()
+
+        call_command("backfill_visit_columns", stdout=out)
+
+        self.assertIn("Backfilled 0 visits", out.getvalue())
+        self.assertEqual(
+            ProductRetrieve.objects.get().device_type,
+            ProductRetrieve.DeviceType.TABLET,
+        )
+
+
+class BenchmarkProductSearchCommandTest(TestCase):
+    def test_requires_postgresql(self):
+        with self.assertRaisesMessage(CommandError, "requires PostgreSQL"):
+            call_command("benchmark_product_search", products=10, stdout=StringIO())
+
+
+class BenchmarkProductRetrieveCommandTest(TestCase):
+    def setUp(self):
+        reset_visit_buffer()
+        self.addCleanup(reset_visit_buffer)
+        brand = Brand.objects.create(name="Bench")
+        Product.objects.create(sku="BENCH1", name="Bench", price=1, brand=brand)
+
+    def test_reports_both_connection_modes_and_restores_the_settings(self):
+        settings_dict = connection.settings_dict
+        configured = (settings_dict["CONN_MAX_AGE"], settings_dict["OPTIONS"])
+        out = StringIO()
+
+        with patch.object(
+            ProductCache, "evict_detail", wraps=ProductCache.evict_detail
+        ) as mock_evict, patch.object(ProductCache, "invalidate") as mock_invalidate:
+            call_command("benchmark_product_retrieve", requests=3, stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertRegex(
+            lines[0], r"^New connection per request: median .*\(3 requests\)$"
+        )
+        self.assertTrue(lines[1].startswith("Configured (CONN_MAX_AGE=0, no reuse)"))
+        self.assertEqual(mock_evict.call_count, 8)
+        mock_evict.assert_called_with("BENCH1")
+        mock_invalidate.assert_not_called()
+        self.assertEqual(len(get_visit_buffer()), 0)
+        self.assertFalse(ProductRetrieve.objects.exists())
+        self.assertEqual(
+            (settings_dict["CONN_MAX_AGE"], settings_dict["OPTIONS"]), configured
+        )
+
+    def test_fails_without_products(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_product_retrieve", sku="MISSING", stdout=StringIO())
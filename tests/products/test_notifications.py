@@ -0,0 +1,108 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.products.models import Brand, Product, ProductChangeEvent
+from apps.products.notifications import ProductChangeDigest
+from apps.products.tasks import send_product_change_digest
+
+User = get_user_model()
+
+
+class ProductChangeDigestTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.brand = Brand.objects.create(name="Digest")
+        self.product = Product.objects.create(
+            sku="DIG1", name="Casco", price=50, brand=self.brand
+        )
+        self.other = Product.objects.create(
+            sku="DIG2", name="Guantes", price=20, brand=self.brand
+        )
+        self.editor = User.objects.create_user(
+            email="editor@example.com", password="pass", is_staff=True
+        )
+        self.admin = User.objects.create_user(
+            email="admin@example.com", password="pass", is_staff=True
+        )
+        User.objects.create_user(email="customer@example.com", password="pass")
+
+    def _edit(self, product, user, price):
+        product.price = price
+        product.save()
+        ProductChangeDigest.record(product, user)
+
+    def test_record_copies_the_product_details(self):
+        ProductChangeDigest.record(self.product, self.editor)
+
+        event = ProductChangeEvent.objects.get()
+        self.assertEqual(
+            (event.sku, event.name, event.brand_name, event.changed_by),
+            ("DIG1", "Casco", "Digest", "editor@example.com"),
+        )
+
+    def test_coalesce_deduplicates_edits_of_the_same_sku(self):
+        self._edit(self.product, self.editor, 55)
+        self._edit(self.other, self.admin, 25)
+        self._edit(self.product, self.admin, 60)
+
+        changes = ProductChangeDigest.coalesce(
+            ProductChangeEvent.objects.order_by("id")
+        )
+
+        self.assertEqual([c["sku"] for c in changes], ["DIG1", "DIG2"])
+        self.assertEqual(changes[0]["price"], 60)
+        self.assertEqual(changes[0]["edits"], 2)
+        self.assertEqual(
+            changes[0]["editors"], ["editor@example.com", "admin@example.com"]
+        )
+
+    def test_collect_builds_one_digest_per_recipient_without_own_changes(self):
+        self._edit(self.product, self.editor, 55)
+        self._edit(self.product, self.editor, 56)
+        self._edit(self.other, self.admin, 25)
+
+        digests = {to[0]: body for _, body, to in ProductChangeDigest.collect()}
+
+        self.assertEqual(set(digests), {"admin@example.com", "editor@example.com"})
+        self.assertIn(
+            "DIG1 · Casco (Digest) · $56.00 · 2 cambio(s)", digests["admin@example.com"]
+        )
+        self.assertNotIn("DIG2", digests["admin@example.com"])
+        self.assertIn("DIG2", digests["editor@example.com"])
+        self.assertFalse(ProductChangeEvent.objects.exists())
+
+    @override_settings(PRODUCT_CHANGE_DIGEST_MAX_SKUS=1)
+    def test_build_lists_a_sample_of_skus(self):
+        changes = ProductChangeDigest.coalesce(
+            [
+                ProductChangeEvent(sku="A1", name="A", brand_name="B", price=1),
+                ProductChangeEvent(sku="A2", name="A", brand_name="B", price=1),
+            ]
+        )
+
+        subject, body = ProductChangeDigest.build(changes)
+
+        self.assertIn("2 productos actualizados", subject)
+        self.assertIn("Desconocido", body)
+        self.assertIn("y 1 productos más", body)
+        self.assertNotIn("A2", body)
+
+    @patch("apps.products.tasks.send_product_update_emails.delay")
+    def test_digest_task_sends_one_email_per_recipient(self, mock_delay):
+        for price in range(10):
+            self._edit(self.product, self.editor, price)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(send_product_change_digest(), 1)
+
+        mock_delay.assert_called_once()
+        (digest,) = mock_delay.call_args.args[0]
+        self.assertEqual(digest[2], ["admin@example.com"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(send_product_change_digest(), 0)
+
+        mock_delay.assert_called_once()
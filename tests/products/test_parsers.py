@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from user_agents import parse
+
+from apps.products.parsers import UserAgentParser
+
+IPHONE_UA = "Mozilla/5.0 (iPhone; CPU iPhone OS 15_5 like Mac OS X)"
+
+
+class UserAgentParserTest(TestCase):
+    def setUp(self):
+        UserAgentParser.reset()
+
+    def tearDown(self):
+        UserAgentParser.reset()
+
+    def test_parse_reuses_cached_result(self):
+        with patch("apps.products.parsers.parse", wraps=parse) as mock_parse:
+            first = UserAgentParser.parse(IPHONE_UA)
+            second = UserAgentParser.parse(IPHONE_UA)
+
+        self.assertIs(first, second)
+        mock_parse.assert_called_once_with(IPHONE_UA)
+        stats = UserAgentParser.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    @override_settings(USER_AGENT_CACHE_SIZE=1)
+    def test_cache_is_bounded(self):
+        UserAgentParser.parse(IPHONE_UA)
+        UserAgentParser.parse("curl/8.0")
+
+        stats = UserAgentParser.stats()
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["evictions"], 1)
+
+    def test_describe_returns_visit_fields(self):
+        metadata = UserAgentParser.describe(UserAgentParser.parse(IPHONE_UA))
+
+        self.assertEqual(metadata["device"], "iPhone")
+        self.assertEqual(metadata["device_type"], "mobile")
+        self.assertEqual(metadata["os"], "iOS")
+        self.assertTrue(metadata["is_mobile"])
+        self.assertFalse(metadata["is_pc"])
@@ -0,0 +1,240 @@
+import datetime
+from unittest import skipUnless
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.products.models import Brand, Product, ProductRetrieve
+from apps.products.partitions import ProductRetrievePartitions, month_start
+from apps.products.tasks import maintain_product_retrieve_partitions
+
+TABLE = "products_productretrieve"
+
+
+class MonthStartTest(TestCase):
+    def test_month_start_shifts_across_years(self):
+        day = datetime.date(2025, 11, 17)
+
+        self.assertEqual(month_start(day), datetime.date(2025, 11, 1))
+        self.assertEqual(month_start(day, 3), datetime.date(2026, 2, 1))
+        self.assertEqual(month_start(day, -11), datetime.date(2024, 12, 1))
+
+
+@override_settings(
+    PRODUCT_RETRIEVE_PARTITIONS_AHEAD=2,
+    PRODUCT_RETRIEVE_RETENTION_MONTHS=12,
+    PRODUCT_RETRIEVE_RETENTION_MODE="drop",
+)
+class ProductRetrievePartitionsTest(TestCase):
+    def setUp(self):
+        self.this_month = month_start(timezone.now().date())
+        patcher = patch("apps.products.partitions.connection")
+        self.connection = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.connection.vendor = "postgresql"
+        self.cursor = MagicMock()
+        self.connection.cursor.return_value.__enter__.return_value = self.cursor
+
+    def _name(self, start):
+        return f"{TABLE}_p{start:%Y%m}"
+
+    def _existing(self, *starts):
+        self.cursor.fetchall.return_value = [(f"{TABLE}_default",)] + [
+            (self._name(start),) for start in starts
+        ]
+
+    def _statements(self):
+        return [c.args[0] for c in self.cursor.execute.call_args_list[1:]]
+
+    def test_is_supported_checks_the_vendor_and_the_table(self):
+        self.cursor.fetchone.return_value = (1,)
+        self.assertTrue(ProductRetrievePartitions.is_supported())
+
+        self.cursor.fetchone.return_value = None
+        self.assertFalse(ProductRetrievePartitions.is_supported())
+
+        self.connection.vendor = "sqlite"
+        self.assertFalse(ProductRetrievePartitions.is_supported())
+
+    def test_partitions_ignores_the_default_partition(self):
+        self._existing(self.this_month)
+
+        self.assertEqual(
+            ProductRetrievePartitions.partitions(),
+            {self.this_month: self._name(self.this_month)},
+        )
+
+    def test_drain_default_moves_visits_into_monthly_partitions(self):
+        stray = month_start(self.this_month, -30)
+        self.cursor.fetchall.return_value = [(stray, 3)]
+
+        with self.assertLogs("apps.products.partitions", "WARNING") as logs:
+            created = ProductRetrievePartitions.drain_default()
+
+        name = self._name(stray)
+        end = month_start(stray, 1)
+        self.assertEqual(created, [name])
+        self.assertIn("3 visits landed in the default partition", logs.output[0])
+        self.assertEqual(
+            self._statements(),
+            [
+                f'CREATE TABLE "{name}" (LIKE "{TABLE}" INCLUDING DEFAULTS)',
+                f'WITH moved AS (DELETE FROM "{TABLE}_default" '
+                "WHERE visited_at >= %s AND visited_at < %s RETURNING *) "
+                f'INSERT INTO "{name}" SELECT * FROM moved',
+                f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{name}" '
+                f"FOR VALUES FROM ('{stray.isoformat()}') TO ('{end.isoformat()}')",
+            ],
+        )
+        self.assertEqual(self.cursor.execute.call_args_list[2].args[1], [stray, end])
+
+    def test_drain_default_does_nothing_when_empty(self):
+        self.cursor.fetchall.return_value = []
+
+        self.assertEqual(ProductRetrievePartitions.drain_default(), [])
+        self.assertEqual(self._statements(), [])
+
+    def test_create_partitions_creates_missing_months(self):
+        self._existing(self.this_month)
+        next_month = month_start(self.this_month, 1)
+        last_month = month_start(self.this_month, 2)
+
+        created = ProductRetrievePartitions.create_partitions()
+
+        self.assertEqual(created, [self._name(next_month), self._name(last_month)])
+        self.assertEqual(
+            self._statements()[0],
+            f'CREATE TABLE IF NOT EXISTS "{self._name(next_month)}" '
+            f'PARTITION OF "{TABLE}" FOR VALUES FROM '
+            f"('{next_month.isoformat()}') TO ('{last_month.isoformat()}')",
+        )
+
+    def test_apply_retention_drops_expired_partitions(self):
+        expired = month_start(self.this_month, -13)
+        kept = month_start(self.this_month, -12)
+        self._existing(expired, kept, self.this_month)
+
+        removed = ProductRetrievePartitions.apply_retention()
+
+        self.assertEqual(removed, [self._name(expired)])
+        self.assertEqual(self._statements(), [f'DROP TABLE "{self._name(expired)}"'])
+
+    def test_apply_retention_can_detach_partitions(self):
+        expired = month_start(self.this_month, -2)
+        self._existing(expired)
+
+        removed = ProductRetrievePartitions.apply_retention(1, mode="detach")
+
+        self.assertEqual(removed, [self._name(expired)])
+        self.assertEqual(
+            self._statements(),
+            [f'ALTER TABLE "{TABLE}" DETACH PARTITION "{self._name(expired)}"'],
+        )
+
+    def test_apply_retention_is_disabled_with_zero_months(self):
+        self.assertEqual(ProductRetrievePartitions.apply_retention(0), [])
+        self.cursor.execute.assert_not_called()
+
+    def test_apply_retention_rejects_unknown_modes(self):
+        with self.assertRaises(ValueError):
+            ProductRetrievePartitions.apply_retention(mode="archive")
+
+    def test_maintain_creates_and_removes_partitions(self):
+        self.cursor.fetchone.return_value = (1,)
+        self._existing(month_start(self.this_month, -24))
+        existing = self.cursor.fetchall.return_value
+        self.cursor.fetchall.side_effect = [[], existing, existing]
+
+        result = maintain_product_retrieve_partitions()
+
+        self.assertEqual(len(result["created"]), 3)
+        self.assertEqual(
+            result["removed"], [self._name(month_start(self.this_month, -24))]
+        )
+
+    def test_maintain_applies_retention_to_drained_visits(self):
+        stray = month_start(self.this_month, -24)
+        self.cursor.fetchone.return_value = (1,)
+        self._existing(self.this_month)
+        existing = self.cursor.fetchall.return_value
+        self.cursor.fetchall.side_effect = [
+            [(stray, 1)],
+            existing,
+            existing + [(self._name(stray),)],
+        ]
+
+        with self.assertLogs("apps.products.partitions", "WARNING"):
+            result = ProductRetrievePartitions.maintain()
+
+        self.assertEqual(result["created"][0], self._name(stray))
+        self.assertEqual(result["removed"], [self._name(stray)])
+
+    def test_maintain_is_a_noop_without_partitioning(self):
+        self.connection.vendor = "sqlite"
+
+        self.assertEqual(
+            ProductRetrievePartitions.maintain(), {"created": [], "removed": []}
+        )
+        self.cursor.execute.assert_not_called()
+
+
+@skipUnless(connection.vendor == "postgresql", "Partitioning requires PostgreSQL.")
+@override_settings(
+    PRODUCT_RETRIEVE_PARTITIONS_AHEAD=2,
+    PRODUCT_RETRIEVE_RETENTION_MONTHS=12,
+    PRODUCT_RETRIEVE_RETENTION_MODE="drop",
+)
+class ProductRetrievePartitionsPostgreSQLTest(TestCase):
+    def setUp(self):
+        brand = Brand.objects.create(name="Brand")
+        self.product = Product.objects.create(
+            sku="PART1", name="Partitioned", price=10, brand=brand
+        )
+        self.this_month = month_start(timezone.now().date())
+
+    def _visit(self, month):
+        visited_at = datetime.datetime.combine(
+            month_start(self.this_month, month) + datetime.timedelta(days=14),
+            datetime.time(12),
+            tzinfo=datetime.timezone.utc,
+        )
+        return ProductRetrieve.objects.create(
+            product=self.product, visited_at=visited_at, metadata={}
+        )
+
+    def _partition_of(self, visit):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT tableoid::regclass::text FROM {TABLE} WHERE id = %s",
+                [visit.id],
+            )
+            row = cursor.fetchone()
+
+        return row[0] if row else None
+
+    def test_table_is_partitioned(self):
+        self.assertTrue(ProductRetrievePartitions.is_supported())
+        self.assertIn(self.this_month, ProductRetrievePartitions.partitions())
+
+    def test_maintain_moves_visits_out_of_the_default_partition(self):
+        future = self._visit(60)
+        self.assertEqual(self._partition_of(future), f"{TABLE}_default")
+
+        with self.assertLogs("apps.products.partitions", "WARNING"):
+            result = ProductRetrievePartitions.maintain()
+
+        name = f"{TABLE}_p{month_start(self.this_month, 60):%Y%m}"
+        self.assertIn(name, result["created"])
+        self.assertEqual(self._partition_of(future), name)
+
+    def test_maintain_applies_retention_to_the_default_partition(self):
+        expired = self._visit(-24)
+        kept = self._visit(0)
+
+        with self.assertLogs("apps.products.partitions", "WARNING"):
+            ProductRetrievePartitions.maintain()
+
+        self.assertIsNone(self._partition_of(expired))
+        self.assertIsNotNone(self._partition_of(kept))
@@ -0,0 +1,160 @@
+import datetime
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.products.models import (
+    Brand,
+    Product,
+    ProductRetrieve,
+    ProductVisitStat,
+    RollupCheckpoint,
+    VisitLocation,
+    VisitUserAgent,
+)
+from apps.products.rollups import ProductVisitRollup
+from apps.products.tasks import rollup_product_visits
+
+
+@override_settings(PRODUCT_VISIT_ROLLUP_LAG=60)
+class ProductVisitRollupTest(TestCase):
+    def setUp(self):
+        brand = Brand.objects.create(name="Brand")
+        self.product = Product.objects.create(
+            sku="ROLL1", name="Rollup", price=10, brand=brand
+        )
+        self.start = timezone.now().replace(
+            minute=0, second=0, microsecond=0
+        ) - datetime.timedelta(days=1)
+
+    def _visit(self, minutes, country="Ecuador", device_type="Mobile", **kwargs):
+        visited_at = self.start + datetime.timedelta(minutes=minutes)
+        kwargs.setdefault("created_at", visited_at)
+        return ProductRetrieve.objects.create(
+            product=self.product,
+            visited_at=visited_at,
+            **kwargs,
+            metadata={
+                "country": country,
+                "device_type": device_type,
+                "browser": "Firefox",
+            },
+        )
+
+    def _stats(self, period):
+        return {
+            (stat.bucket_start, stat.country, stat.device_type): stat.visits
+            for stat in ProductVisitStat.objects.filter(period=period)
+        }
+
+    def test_run_counts_visits_per_hour_and_day(self):
+        self._visit(5)
+        self._visit(10)
+        self._visit(70, country="Perú")
+
+        self.assertEqual(ProductVisitRollup.run(), 3)
+
+        next_hour = self.start + datetime.timedelta(hours=1)
+        day = self.start.replace(hour=0)
+        self.assertEqual(
+            self._stats(ProductVisitStat.Period.HOUR),
+            {
+                (self.start, "Ecuador", "Mobile"): 2,
+                (next_hour, "Perú", "Mobile"): 1,
+            },
+        )
+        self.assertEqual(
+            self._stats(ProductVisitStat.Period.DAY),
+            {(day, "Ecuador", "Mobile"): 2, (day, "Perú", "Mobile"): 1},
+        )
+
+    def test_run_is_incremental(self):
+        self._visit(5)
+        ProductVisitRollup.run()
+        last = self._visit(15)
+
+        self.assertEqual(ProductVisitRollup.run(), 1)
+        self.assertEqual(ProductVisitRollup.run(), 0)
+        self.assertEqual(
+            self._stats(ProductVisitStat.Period.HOUR),
+            {(self.start, "Ecuador", "Mobile"): 2},
+        )
+        self.assertEqual(
+            RollupCheckpoint.objects.get(name=ProductVisitRollup.CHECKPOINT).last_id,
+            last.id,
+        )
+
+    def test_run_processes_every_batch(self):
+        for minutes in range(5):
+            self._visit(minutes, device_type="Desktop")
+
+        self.assertEqual(ProductVisitRollup.run(batch_size=2), 5)
+        self.assertEqual(
+            self._stats(ProductVisitStat.Period.HOUR),
+            {(self.start, "Ecuador", "Desktop"): 5},
+        )
+
+    def test_run_leaves_recent_visits_for_the_next_run(self):
+        self._visit(5)
+        recent = ProductRetrieve.objects.create(product=self.product, metadata={})
+        self._visit(10)
+
+        self.assertEqual(ProductVisitRollup.run(), 1)
+        self.assertEqual(
+            RollupCheckpoint.objects.get(name=ProductVisitRollup.CHECKPOINT).last_id,
+            recent.id - 1,
+        )
+
+        with override_settings(PRODUCT_VISIT_ROLLUP_LAG=0):
+            self.assertEqual(ProductVisitRollup.run(), 2)
+
+        now_bucket = recent.visited_at.replace(minute=0, second=0, microsecond=0)
+        self.assertEqual(
+            ProductVisitStat.objects.get(
+                period=ProductVisitStat.Period.HOUR, bucket_start=now_bucket
+            ).country,
+            "",
+        )
+
+    def test_run_waits_for_visits_committed_out_of_order(self):
+        # A flush commits a higher id while an older flush is still open.
+        committed = self._visit(5, id=20, created_at=timezone.now())
+
+        self.assertEqual(ProductVisitRollup.run(), 0)
+
+        # The older flush commits later, with a lower id.
+        late = self._visit(1, id=10, created_at=timezone.now())
+        ProductRetrieve.objects.filter(id__in=[committed.id, late.id]).update(
+            created_at=self.start
+        )
+
+        self.assertEqual(ProductVisitRollup.run(), 2)
+        self.assertEqual(
+            self._stats(ProductVisitStat.Period.HOUR),
+            {(self.start, "Ecuador", "Mobile"): 2},
+        )
+
+    @patch("apps.products.tasks.ProductVisitRollup.run", return_value=4)
+    def test_rollup_task_runs_the_rollup(self, mock_run):
+        self.assertEqual(rollup_product_visits(), 4)
+        mock_run.assert_called_once_with()
+
+    def test_run_reads_the_typed_columns(self):
+        ProductRetrieve.objects.create(
+            product=self.product,
+            visited_at=self.start,
+            created_at=self.start,
+            device_type=ProductRetrieve.DeviceType.PC,
+            location=VisitLocation.objects.create(country="Chile", city="Santiago"),
+            user_agent=VisitUserAgent.objects.create(
+                user_agent_hash="hash", user_agent="ua", browser="Chrome"
+            ),
+        )
+
+        ProductVisitRollup.run()
+
+        stat = ProductVisitStat.objects.get(period=ProductVisitStat.Period.HOUR)
+        self.assertEqual(
+            (stat.country, stat.device_type, stat.browser), ("Chile", "pc", "Chrome")
+        )
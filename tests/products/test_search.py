@@ -0,0 +1,38 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from apps.products.models import Brand, Product
+from apps.products.search import ProductSearch
+
+
+class ProductSearchTest(TestCase):
+    def setUp(self):
+        moto = Brand.objects.create(name="MotoRacer")
+        other = Brand.objects.create(name="Other")
+        Product.objects.create(
+            sku="CAS-001", name="Casco integral", price=1, brand=moto
+        )
+        Product.objects.create(sku="GUA-002", name="Guantes", price=1, brand=other)
+        Product.objects.create(sku="BOT-003", name="Botas", price=1, brand=moto)
+
+    def _skus(self, term):
+        return list(
+            ProductSearch.search(Product.objects.all(), term).values_list(
+                "sku", flat=True
+            )
+        )
+
+    def test_fallback_matches_sku_name_and_brand(self):
+        self.assertEqual(self._skus("gua"), ["GUA-002"])
+        self.assertEqual(self._skus("CASCO"), ["CAS-001"])
+        self.assertEqual(self._skus("racer"), ["CAS-001", "BOT-003"])
+        self.assertEqual(self._skus("nothing"), [])
+
+    def test_postgresql_search_is_ranked(self):
+        with patch.object(ProductSearch, "is_supported", return_value=True):
+            products = ProductSearch.search(Product.objects.all(), "cas-00")
+
+        self.assertIn("rank", products.query.annotations)
+        self.assertIn("sku_upper", products.query.annotations)
+        self.assertEqual(products.query.order_by, ("-rank", "id"))
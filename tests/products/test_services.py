@@ -1,11 +1,17 @@
 from unittest.mock import MagicMock, patch
 
 from django.contrib.auth import get_user_model
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, TestCase, override_settings
 
+from apps.commons.models import OutboxMessage
+from apps.products.buffers import get_visit_buffer, reset_visit_buffer
 from apps.products.models.brand import Brand
 from apps.products.models.product import Product
-from apps.products.services import ProductEmailService, ProductVisitMetadataBuilder
+from apps.products.services import (
+    ProductEmailService,
+    ProductVisitMetadataBuilder,
+    ProductVisitTracker,
+)
 
 User = get_user_model()
 
@@ -39,6 +45,24 @@ class ProductVisitMetadataBuilderTest(TestCase):
         self.assertFalse(metadata["is_tablet"])
         self.assertFalse(metadata["is_pc"])
 
+    @override_settings(VISIT_DEFER_USER_AGENT_PARSING=True)
+    @patch("apps.products.parsers.UserAgentParser.parse")
+    def test_deferred_parsing_captures_only_raw_headers(self, mock_parse):
+        request = self.factory.get(
+            "/products/TEST123",
+            HTTP_USER_AGENT=self.user_agent,
+            HTTP_REFERER=self.referer,
+            REMOTE_ADDR=self.ip,
+        )
+
+        metadata = ProductVisitMetadataBuilder(request).build()
+
+        mock_parse.assert_not_called()
+        self.assertEqual(
+            metadata,
+            {"ip": self.ip, "user_agent": self.user_agent, "referer": self.referer},
+        )
+
     def test_ip_from_x_forwarded_for(self):
         forwarded_ip = "203.0.113.1, 70.41.3.18"
         request = self.factory.get(
@@ -74,7 +98,45 @@ class ProductVisitMetadataBuilderTest(TestCase):
                 builder.ua.is_pc = case["flags"].get("is_pc", False)
                 builder.ua.is_bot = case["flags"].get("is_bot", False)
 
-                self.assertEqual(builder._get_device_type(), case["expected"])
+                self.assertEqual(builder.build()["device_type"], case["expected"])
+
+
+class ProductVisitTrackerTest(TestCase):
+    def setUp(self):
+        reset_visit_buffer()
+
+    @patch("apps.products.tasks.flush_product_retrieves.delay")
+    def test_track_appends_event_to_buffer(self, mock_delay):
+        ProductVisitTracker.track(1, {"ip": "1.1.1.1"})
+
+        events = get_visit_buffer().drain(10)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["product_id"], 1)
+        self.assertEqual(events[0]["metadata"], {"ip": "1.1.1.1"})
+        self.assertIn("visited_at", events[0])
+        mock_delay.assert_not_called()
+
+    @override_settings(VISIT_BUFFER_BATCH_SIZE=2)
+    @patch("apps.products.tasks.flush_product_retrieves.delay")
+    def test_track_triggers_flush_when_batch_is_full(self, mock_delay):
+        ProductVisitTracker.track(1, {})
+        mock_delay.assert_not_called()
+
+        ProductVisitTracker.track(1, {})
+        mock_delay.assert_called_once_with()
+
+    @override_settings(VISIT_BUFFER_BATCH_SIZE=2)
+    @patch("apps.products.tasks.flush_product_retrieves.delay")
+    def test_track_keeps_triggering_flushes_past_the_batch_size(self, mock_delay):
+        buffer = get_visit_buffer()
+        buffer.requeue([{"product_id": 1, "metadata": {}}] * 3)
+
+        ProductVisitTracker.track(1, {})
+        self.assertEqual(mock_delay.call_count, 1)
+
+        ProductVisitTracker.track(1, {})
+        ProductVisitTracker.track(1, {})
+        self.assertEqual(mock_delay.call_count, 2)
 
 
 class ProductEmailServiceTest(TestCase):
@@ -87,30 +149,24 @@ class ProductEmailServiceTest(TestCase):
             email="user@example.com", password="pass", is_staff=True, is_active=True
         )
 
-    def test_build_generates_subject_and_body(self):
-        subject, body = ProductEmailService.build(self.product, self.user)
-
-        self.assertIn("[Catálogo] Producto actualizado", subject)
-        self.assertIn(self.product.name, subject)
-        self.assertIn(self.product.sku, subject)
-        self.assertIn("Zapatos Deportivos", body)
-        self.assertIn("user@example.com", body)
+    @override_settings(PRODUCT_BULK_EMAIL_MAX_SKUS=2)
+    def test_build_bulk_lists_a_sample_of_skus(self):
+        summary = {"received": 3, "created": 1, "updated": 2}
 
-    @patch("apps.products.tasks.send_product_update_email.delay")
-    def test_send_email_calls_task_with_correct_arguments(self, mock_delay):
-        User.objects.create_user(
-            email="admin@example.com", password="pass", is_staff=True, is_active=True
+        subject, body = ProductEmailService.build_bulk(
+            summary, ["A1", "A2", "A3"], self.user
         )
 
-        ProductEmailService.send_email(self.product, self.user)
+        self.assertIn("1 productos creados, 2 actualizados", subject)
+        self.assertIn("A1, A2 y 1 más", body)
+        self.assertIn("user@example.com", body)
 
-        self.assertTrue(mock_delay.called)
-        args, kwargs = mock_delay.call_args
-        self.assertIn("Zapatos Deportivos", args[0])
-        self.assertIn("SKU123", args[1])
-        self.assertEqual(args[2], ["admin@example.com"])
+    def test_send_bulk_email_only_writes_to_the_outbox(self):
+        with self.assertNumQueries(1):
+            ProductEmailService.send_bulk_email(
+                {"received": 1, "created": 1, "updated": 0}, ["A1"], self.user
+            )
 
-    @patch("apps.products.tasks.send_product_update_email.delay")
-    def test_send_email_does_nothing_if_no_other_admins(self, mock_delay):
-        ProductEmailService.send_email(self.product, self.user)
-        mock_delay.assert_not_called()
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.task, "apps.products.tasks.send_staff_notification")
+        self.assertEqual(message.kwargs, {"exclude_email": "user@example.com"})
@@ -1,9 +1,30 @@
-from unittest.mock import MagicMock, patch
+import datetime
+from unittest.mock import patch
 
+from celery.exceptions import Retry
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DataError, OperationalError
 from django.test import TestCase
+from django.utils import timezone
 
-from apps.products.models import Brand, Product, ProductRetrieve
-from apps.products.tasks import track_product_retrieve
+from apps.products.buffers import get_visit_buffer, reset_visit_buffer
+from apps.products.models import (
+    Brand,
+    Product,
+    ProductRetrieve,
+    VisitLocation,
+    VisitUserAgent,
+)
+from apps.products.tasks import (
+    flush_product_retrieves,
+    flush_product_retrieves_on_shutdown,
+    send_product_update_emails,
+    send_staff_notification,
+    track_product_retrieve,
+)
+
+User = get_user_model()
 
 
 class TrackProductRetrieveTaskTest(TestCase):
@@ -16,36 +37,38 @@ class TrackProductRetrieveTaskTest(TestCase):
             brand=self.brand,
         )
 
-    @patch("apps.products.tasks.Reader")
+    @patch("apps.products.tasks.GeoLocationService.locate")
     def test_track_product_retrieve_enriches_metadata_and_creates_record(
-        self, mock_reader_cls
+        self, mock_locate
     ):
-        mock_reader = MagicMock()
-        mock_reader.city.return_value.country.name = "Ecuador"
-        mock_reader.city.return_value.city.name = "Quito"
-        mock_reader_cls.return_value = mock_reader
+        mock_locate.return_value = ("Ecuador", "Quito")
 
-        metadata = {"ip": "123.123.123.123", "browser": "Firefox"}
+        metadata = {
+            "ip": "123.123.123.123",
+            "user_agent": "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Firefox/120.0",
+            "referer": "https://example.com",
+        }
 
         track_product_retrieve(self.product.id, metadata)
 
         self.assertEqual(ProductRetrieve.objects.count(), 1)
-        visit = ProductRetrieve.objects.first()
+        visit = ProductRetrieve.objects.select_related("user_agent", "location").get()
 
         self.assertEqual(visit.product, self.product)
-        self.assertEqual(visit.metadata["ip"], "123.123.123.123")
-        self.assertEqual(visit.metadata["browser"], "Firefox")
-        self.assertEqual(visit.metadata["country"], "Ecuador")
-        self.assertEqual(visit.metadata["city"], "Quito")
+        self.assertEqual(visit.ip, "123.123.123.123")
+        self.assertEqual(visit.device_type, ProductRetrieve.DeviceType.PC)
+        self.assertEqual(visit.user_agent.user_agent, metadata["user_agent"])
+        self.assertEqual(visit.user_agent.browser, "Firefox")
+        self.assertEqual(visit.location.country, "Ecuador")
+        self.assertEqual(visit.location.city, "Quito")
+        self.assertEqual(visit.referer, "https://example.com")
+        self.assertIsNone(visit.metadata)
 
-        mock_reader.city.assert_called_once_with("123.123.123.123")
-        mock_reader.close.assert_called_once()
+        mock_locate.assert_called_once_with("123.123.123.123")
 
-    @patch("apps.products.tasks.Reader")
-    def test_city_lookup_exception_uses_defaults(self, mock_reader_cls):
-        mock_reader = MagicMock()
-        mock_reader.city.side_effect = Exception("GeoIP error")
-        mock_reader_cls.return_value = mock_reader
+    @patch("apps.products.tasks.GeoLocationService.locate")
+    def test_unknown_location_uses_defaults(self, mock_locate):
+        mock_locate.return_value = (None, None)
 
         metadata = {"ip": "1.2.3.4"}
 
@@ -53,13 +76,203 @@ class TrackProductRetrieveTaskTest(TestCase):
 
         visit = ProductRetrieve.objects.first()
 
-        self.assertEqual(visit.metadata["country"], "México")
-        self.assertEqual(visit.metadata["city"], "Ciudad de México")
-        self.assertEqual(visit.metadata["ip"], "1.2.3.4")
+        self.assertEqual(visit.location.country, "México")
+        self.assertEqual(visit.location.city, "Ciudad de México")
+        self.assertEqual(visit.ip, "1.2.3.4")
+        self.assertIsNone(visit.user_agent)
+
+        mock_locate.assert_called_once_with("1.2.3.4")
+
+    @patch("apps.products.tasks.GeoLocationService.locate")
+    def test_deferred_user_agent_is_parsed_in_the_worker(self, mock_locate):
+        mock_locate.return_value = (None, None)
+        metadata = {
+            "ip": "1.2.3.4",
+            "user_agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 15_5 like Mac OS X)",
+        }
 
-        mock_reader.city.assert_called_once_with("1.2.3.4")
-        mock_reader.close.assert_called_once()
+        track_product_retrieve(self.product.id, metadata)
+
+        visit = ProductRetrieve.objects.first()
+        self.assertEqual(visit.device_type, ProductRetrieve.DeviceType.MOBILE)
+        self.assertEqual(visit.user_agent.os, "iOS")
 
     def test_product_not_found(self):
         track_product_retrieve(self.product.id + 1, {})
         self.assertEqual(ProductRetrieve.objects.count(), 0)
+
+
+@patch("apps.products.tasks.GeoLocationService.locate", return_value=(None, None))
+class FlushProductRetrievesTaskTest(TestCase):
+    def setUp(self):
+        self.brand = Brand.objects.create(name="FlushTest")
+        self.product = Product.objects.create(
+            sku="FLUSH1", name="Flush Product", price=10.00, brand=self.brand
+        )
+        reset_visit_buffer()
+        self.buffer = get_visit_buffer()
+        self.visited_at = timezone.now() - datetime.timedelta(minutes=5)
+
+    def _event(self, product_id, ip="1.2.3.4"):
+        return {
+            "product_id": product_id,
+            "metadata": {"ip": ip},
+            "visited_at": self.visited_at.isoformat(),
+        }
+
+    def test_flush_writes_events_in_chunks(self, mock_locate):
+        for _ in range(5):
+            self.buffer.append(self._event(self.product.id))
+
+        with patch(
+            "apps.products.tasks.ProductRetrieve.objects.bulk_create",
+            wraps=ProductRetrieve.objects.bulk_create,
+        ) as mock_bulk_create:
+            created = flush_product_retrieves(batch_size=2)
+
+        self.assertEqual(created, 5)
+        self.assertEqual(mock_bulk_create.call_count, 3)
+        self.assertEqual(len(self.buffer), 0)
+
+        visit = ProductRetrieve.objects.first()
+        self.assertEqual(visit.visited_at, self.visited_at)
+        self.assertEqual(visit.location.country, "México")
+        self.assertEqual(VisitLocation.objects.count(), 1)
+
+    def test_flush_reuses_lookup_rows(self, mock_locate):
+        user_agent = "Mozilla/5.0 (iPhone; CPU iPhone OS 15_5 like Mac OS X)"
+
+        for _ in range(2):
+            event = self._event(self.product.id)
+            event["metadata"]["user_agent"] = user_agent
+            self.buffer.append(event)
+            flush_product_retrieves()
+
+        self.assertEqual(ProductRetrieve.objects.count(), 2)
+        self.assertEqual(VisitUserAgent.objects.count(), 1)
+        self.assertEqual(VisitLocation.objects.count(), 1)
+        self.assertEqual(
+            set(ProductRetrieve.objects.values_list("user_agent_id", flat=True)),
+            {VisitUserAgent.objects.get().id},
+        )
+
+    def test_flush_skips_deleted_products(self, mock_locate):
+        self.buffer.append(self._event(self.product.id))
+        self.buffer.append(self._event(self.product.id + 100))
+
+        self.assertEqual(flush_product_retrieves(), 1)
+        self.assertEqual(ProductRetrieve.objects.count(), 1)
+
+    def test_flush_stores_invalid_ips_as_null(self, mock_locate):
+        self.buffer.append(self._event(self.product.id, ip="unknown"))
+        self.buffer.append(self._event(self.product.id, ip=" 2001:DB8::1 "))
+
+        self.assertEqual(flush_product_retrieves(), 2)
+        self.assertEqual(
+            list(ProductRetrieve.objects.order_by("id").values_list("ip", flat=True)),
+            [None, "2001:db8::1"],
+        )
+
+    def test_flush_requeues_events_when_the_database_is_down(self, mock_locate):
+        self.buffer.append(self._event(self.product.id))
+
+        with patch(
+            "apps.products.tasks.ProductRetrieve.objects.bulk_create",
+            side_effect=OperationalError("db down"),
+        ):
+            with self.assertRaises(OperationalError):
+                flush_product_retrieves()
+
+        self.assertEqual(len(self.buffer), 1)
+        self.assertEqual(len(self.buffer.dead_letters), 0)
+
+    def test_flush_dead_letters_failing_events_and_stores_the_rest(self, mock_locate):
+        for ip in ["1.1.1.1", "2.2.2.2", "6.6.6.6", "3.3.3.3"]:
+            self.buffer.append(self._event(self.product.id, ip=ip))
+
+        bulk_create = ProductRetrieve.objects.bulk_create
+
+        def fail_on_bad_ip(retrieves):
+            if any(retrieve.ip == "6.6.6.6" for retrieve in retrieves):
+                raise DataError("invalid input")
+            return bulk_create(retrieves)
+
+        with patch(
+            "apps.products.tasks.ProductRetrieve.objects.bulk_create",
+            side_effect=fail_on_bad_ip,
+        ), self.assertLogs("apps.products.tasks", "ERROR") as logs:
+            self.assertEqual(flush_product_retrieves(), 3)
+
+        self.assertEqual(len(logs.records), 1)
+
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(
+            [event["metadata"]["ip"] for event in self.buffer.dead_letters],
+            ["6.6.6.6"],
+        )
+        self.assertEqual(
+            set(ProductRetrieve.objects.values_list("ip", flat=True)),
+            {"1.1.1.1", "2.2.2.2", "3.3.3.3"},
+        )
+
+    def test_worker_shutdown_drains_the_buffer(self, mock_locate):
+        self.buffer.append(self._event(self.product.id))
+
+        flush_product_retrieves_on_shutdown(sig="TERM", how="Warm", exitcode=0)
+
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(ProductRetrieve.objects.count(), 1)
+
+
+class SendProductUpdateEmailsTaskTest(TestCase):
+    @patch("apps.products.tasks.EmailService.send_bulk")
+    def test_send_product_update_emails_counts_the_sent_emails(self, mock_send):
+        messages = [["A", "Body", ["a@example.com"]], ["B", "Body", ["b@example.com"]]]
+        mock_send.return_value = [
+            {"to": ["a@example.com"], "message_id": "1", "error": None},
+            {"to": ["b@example.com"], "message_id": "2", "error": None},
+        ]
+
+        self.assertEqual(send_product_update_emails(messages), 2)
+        mock_send.assert_called_once_with(messages)
+
+    @patch("apps.products.tasks.send_product_update_emails.retry")
+    @patch("apps.products.tasks.EmailService.send_bulk")
+    def test_failed_emails_are_retried(self, mock_send, mock_retry):
+        messages = [["A", "Body", ["a@example.com"]], ["B", "Body", ["b@example.com"]]]
+        mock_send.return_value = [
+            {"to": ["a@example.com"], "message_id": "1", "error": None},
+            {"to": ["b@example.com"], "message_id": None, "error": "throttled"},
+        ]
+        mock_retry.side_effect = Retry()
+
+        with self.assertRaises(Retry):
+            send_product_update_emails(messages)
+
+        self.assertEqual(mock_retry.call_args.kwargs["args"], [[messages[1]]])
+
+
+class SendStaffNotificationTaskTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        User.objects.create_user(
+            email="author@example.com", password="pass", is_staff=True
+        )
+        User.objects.create_user(
+            email="admin@example.com", password="pass", is_staff=True
+        )
+        User.objects.create_user(email="customer@example.com", password="pass")
+
+    @patch("apps.products.tasks.EmailService.send_email")
+    def test_sends_to_staff_except_the_author(self, mock_send):
+        self.assertEqual(
+            send_staff_notification("Subject", "Body", "author@example.com"), 1
+        )
+        mock_send.assert_called_once_with("Subject", "Body", ["admin@example.com"])
+
+    @patch("apps.products.tasks.EmailService.send_email")
+    def test_sends_nothing_without_other_staff(self, mock_send):
+        User.objects.filter(email="admin@example.com").delete()
+
+        self.assertEqual(send_staff_notification("S", "B", "author@example.com"), 0)
+        mock_send.assert_not_called()